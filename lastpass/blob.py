@@ -8,7 +8,7 @@ from typing import List, Optional, Tuple
 from io import BytesIO
 
 from .models import Account, Field, Share, Attachment
-from .cipher import aes_decrypt, aes_decrypt_base64, hex_to_bytes
+from .cipher import aes_decrypt, aes_decrypt_many, aes_decrypt_base64, hex_to_bytes
 from .exceptions import DecryptionException
 
 
@@ -64,6 +64,18 @@ class BlobParser:
         except Exception:
             return ""
     
+    def decrypt_items(self, items: List[bytes], key: Optional[bytes] = None) -> List[str]:
+        """Decrypt several items sharing a key, expanding the key only once"""
+        if key is None:
+            key = self.key
+        
+        try:
+            return [value.decode('utf-8', errors='replace')
+                    for value in aes_decrypt_many(items, key)]
+        except Exception:
+            # One bad item fails the batch; decrypt individually so only it is blanked
+            return [self.decrypt_item(item, key) for item in items]
+    
     def parse_account(self, data: bytes, share: Optional[Share] = None) -> Optional[Account]:
         """Parse ACCT chunk into Account object"""
         stream = BytesIO(data)
@@ -148,13 +160,10 @@ class BlobParser:
             # Decrypt fields
             decryption_key = share.key if share else self.key
             
-            name = self.decrypt_item(name_enc, decryption_key)
-            group = self.decrypt_item(group_enc, decryption_key)
-            url = self.decrypt_item(url_enc, decryption_key)
-            notes = self.decrypt_item(notes_enc, decryption_key)
-            username = self.decrypt_item(username_enc, decryption_key)
-            password = self.decrypt_item(password_enc, decryption_key)
-            attachkey = self.decrypt_item(attachkey_enc, decryption_key)
+            name, group, url, notes, username, password, attachkey = self.decrypt_items(
+                [name_enc, group_enc, url_enc, notes_enc, username_enc, password_enc, attachkey_enc],
+                decryption_key,
+            )
             
             # Build fullname (group + name)
             if group:
@@ -196,8 +205,7 @@ class BlobParser:
             value_enc = self.read_item(stream)
             checked = self.read_item(stream) == b'1'
             
-            name = self.decrypt_item(name_enc, account_key)
-            value = self.decrypt_item(value_enc, account_key)
+            name, value = self.decrypt_items([name_enc, value_enc], account_key)
             
             return Field(
                 name=name,
@@ -3,9 +3,10 @@ Cryptographic operations for LastPass
 """
 
 import base64
+import binascii
 import hashlib
 import struct
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from Crypto.Cipher import AES
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_OAEP
@@ -27,13 +28,14 @@ def aes_decrypt(ciphertext: bytes, key: bytes) -> bytes:
     # Check if it's in the '!base64|base64' format
     if ciphertext.startswith(b'!'):
         try:
-            # Split into IV and ciphertext
-            parts = ciphertext[1:].split(b'|', 1)
-            if len(parts) != 2:
+            # Split into IV and ciphertext; slicing around the separator
+            # copies a large payload once instead of twice
+            separator = ciphertext.find(b'|', 1)
+            if separator < 0:
                 raise DecryptionException("Invalid encrypted data format")
             
-            iv = base64.b64decode(parts[0])
-            data = base64.b64decode(parts[1])
+            iv = base64.b64decode(ciphertext[1:separator])
+            data = base64.b64decode(ciphertext[separator + 1:])
             
             # Decrypt with CBC mode
             cipher = AES.new(key, AES.MODE_CBC, iv)
@@ -66,6 +68,52 @@ def aes_decrypt(ciphertext: bytes, key: bytes) -> bytes:
             raise DecryptionException(f"AES decryption failed: {e}")
 
 
+def aes_decrypt_many(ciphertexts: List[bytes], key: bytes) -> List[bytes]:
+    """
+    Decrypt several values encrypted with the same key
+    Accepts the same formats as aes_decrypt and returns the same results,
+    but expands the key once: CBC is derived from a single ECB cipher by
+    XORing each decrypted block with the previous ciphertext block.
+    """
+    try:
+        ecb = AES.new(key, AES.MODE_ECB)
+        results = []
+        
+        for ciphertext in ciphertexts:
+            if not ciphertext:
+                results.append(b'')
+                continue
+            
+            if ciphertext.startswith(b'!'):
+                parts = ciphertext[1:].split(b'|', 1)
+                if len(parts) != 2:
+                    raise DecryptionException("Invalid encrypted data format")
+                
+                iv = base64.b64decode(parts[0])
+                data = base64.b64decode(parts[1])
+                if len(iv) != AES.block_size:
+                    raise DecryptionException("Incorrect IV length")
+                
+                blocks = ecb.decrypt(data)
+                previous = (iv + data)[:len(data)]
+                chained = int.from_bytes(blocks, 'big') ^ int.from_bytes(previous, 'big')
+                plaintext = chained.to_bytes(len(data), 'big')
+            else:
+                # Legacy ECB mode
+                plaintext = ecb.decrypt(ciphertext)
+            
+            try:
+                plaintext = unpad(plaintext, AES.block_size)
+            except ValueError:
+                pass
+            
+            results.append(plaintext)
+        
+        return results
+    except Exception as e:
+        raise DecryptionException(f"AES decryption failed: {e}")
+
+
 def aes_decrypt_base64(ciphertext: str, key: bytes) -> str:
     """Decrypt base64-encoded AES ciphertext"""
     if not ciphertext:
@@ -79,6 +127,90 @@ def aes_decrypt_base64(ciphertext: str, key: bytes) -> str:
         raise DecryptionException(f"Base64 AES decryption failed: {e}")
 
 
+def decrypt_aes256_cbc_base64_stream(src: bytes, key: bytes,
+                                     chunk_size: int = 12288) -> bytes:
+    """
+    Decrypt base64-encoded AES data such as attachment payloads
+    Accepts the same input as aes_decrypt_base64 but returns raw bytes, and
+    works through the input in chunk_size pieces (a multiple of 4 and, once
+    decoded, of the AES block size) fed to one cipher, so no full-size
+    intermediate copies of the payload are made.
+    """
+    if not src:
+        return b''
+    
+    if chunk_size <= 0 or chunk_size % 64:
+        raise ValueError("chunk_size must be a positive multiple of 64")
+    
+    try:
+        # Line breaks would shift the 4-character base64 groups between chunks
+        if b'\n' in src or b'\r' in src:
+            src = src.translate(None, b' \t\r\n')
+        
+        inner = (binascii.a2b_base64(src[i:i + chunk_size])
+                 for i in range(0, len(src), chunk_size))
+        
+        head = b''
+        for piece in inner:
+            head += piece
+            if not head.startswith(b'!') or b'|' in head:
+                break
+        
+        out = bytearray()
+        if head.startswith(b'!'):
+            separator = head.find(b'|')
+            if separator < 0:
+                raise DecryptionException("Invalid encrypted data format")
+            cipher = AES.new(key, AES.MODE_CBC, base64.b64decode(head[1:separator]))
+            text = head[separator + 1:]
+            pending = b''
+            
+            # Decode the inner base64 in whole 4-char groups, then decrypt
+            # whole blocks, carrying any remainder into the next round
+            while True:
+                usable = len(text) - len(text) % 4
+                pending += binascii.a2b_base64(text[:usable]) if usable else b''
+                text = text[usable:]
+                
+                whole = len(pending) - len(pending) % AES.block_size
+                if whole:
+                    out += cipher.decrypt(pending[:whole])
+                    pending = pending[whole:]
+                
+                piece = next(inner, None)
+                if piece is None:
+                    break
+                text += piece
+            
+            if text:
+                pending += base64.b64decode(text)
+            if pending:
+                out += cipher.decrypt(pending)
+        else:
+            # Legacy ECB mode
+            cipher = AES.new(key, AES.MODE_ECB)
+            pending = head
+            for piece in inner:
+                pending += piece
+                whole = len(pending) - len(pending) % AES.block_size
+                out += cipher.decrypt(pending[:whole])
+                pending = pending[whole:]
+            if pending:
+                out += cipher.decrypt(pending)
+        
+        # Strip PKCS7 padding in place; leave the data as-is if it is invalid
+        padding = out[-1] if out else 0
+        if (0 < padding <= AES.block_size and len(out) % AES.block_size == 0
+                and out[-padding:] == bytes([padding]) * padding):
+            del out[-padding:]
+        
+        return bytes(out)
+    except DecryptionException:
+        raise
+    except Exception as e:
+        raise DecryptionException(f"Base64 AES decryption failed: {e}")
+
+
 def aes_encrypt(plaintext: str, key: bytes) -> bytes:
     """
     Encrypt data using AES-256-CBC
@@ -108,6 +240,44 @@ def aes_encrypt(plaintext: str, key: bytes) -> bytes:
         raise DecryptionException(f"AES encryption failed: {e}")
 
 
+def aes_encrypt_many(plaintexts: List[Union[str, bytes]], key: bytes) -> List[bytes]:
+    """
+    Encrypt several values using AES-256-CBC, each with its own random IV
+    Draws all IVs with a single call to the random source.
+    Returns a list in the same format as aes_encrypt (b'' for empty values)
+    """
+    try:
+        ivs = get_random_bytes(AES.block_size * len(plaintexts)) if plaintexts else b''
+        results = []
+        
+        for i, plaintext in enumerate(plaintexts):
+            if not plaintext:
+                results.append(b'')
+                continue
+            
+            iv = ivs[i * AES.block_size:(i + 1) * AES.block_size]
+            cipher = AES.new(key, AES.MODE_CBC, iv)
+            if isinstance(plaintext, bytes):
+                plaintext_bytes = plaintext
+            else:
+                plaintext_bytes = plaintext.encode('utf-8')
+            ciphertext = cipher.encrypt(pad(plaintext_bytes, AES.block_size))
+            
+            results.append(b'!' + base64.b64encode(iv) + b'|' + base64.b64encode(ciphertext))
+        
+        return results
+    except Exception as e:
+        raise DecryptionException(f"AES encryption failed: {e}")
+
+
+def aes_encrypt_many_str(plaintexts: List[Union[str, bytes]], key: bytes) -> List[str]:
+    """
+    Encrypt like aes_encrypt_many but return str values ('' for empty values)
+    The output is base64 text, so it is decoded as ASCII rather than UTF-8.
+    """
+    return [value.decode('ascii') for value in aes_encrypt_many(plaintexts, key)]
+
+
 def encrypt_and_base64(plaintext: str, key: bytes) -> str:
     """Encrypt and return base64-encoded result"""
     encrypted = aes_encrypt(plaintext, key)
@@ -393,6 +393,10 @@ class CLI:
                 print("Login aborted. Try again without --plaintext-key.")
                 return 1
         
+        # Connect to the server and fetch the iteration count while the
+        # password is typed
+        self.client.prefetch_iterations(args.username)
+        
         password = getpass.getpass("Master Password: ")
         
         try:
@@ -1220,8 +1224,8 @@ class CLI:
                     self.client.export_to_csv(fields, f)
                 print(f"Exported to {args.output}")
             else:
-                csv_data = self.client.export_to_csv(fields)
-                print(csv_data)
+                # Stream rows straight to stdout rather than building the whole CSV
+                self.client.export_to_csv(fields, sys.stdout)
             
             return 0
         except Exception as e:
@@ -2,12 +2,20 @@
 Main LastPass client with friendly Python API
 """
 
-import os
+import bisect
+import dataclasses
+import hashlib
+import hmac
+import operator
 import re
 import secrets
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any, TextIO
+from typing import List, Optional, Dict, Any, Callable, Iterator, Set, TextIO, Tuple
 from getpass import getpass
 
 from .session import Session
@@ -15,8 +23,9 @@ from .http import HTTPClient
 from .kdf import derive_keys
 from .blob import parse_blob
 from .xml_parser import parse_login_response
-from .cipher import decrypt_private_key, aes_decrypt_base64
-from .models import Account, Field, Share, ShareLimit
+from .cipher import decrypt_private_key
+from .logger import get_logger
+from .models import Account, Share, ShareLimit
 from .note_types import NoteType
 from .exceptions import (
     LastPassException,
@@ -26,6 +35,19 @@ from .exceptions import (
 )
 
 
+# Vault size from which regex search is handed to Hyperscan, when installed
+HYPERSCAN_MIN_ACCOUNTS = 500
+
+# Python regex syntax Hyperscan reads differently: buffer anchors and {,n}
+_HYPERSCAN_UNSAFE = re.compile(r'\\[AZz]|\{,')
+
+# Concurrent requests used by the bulk share user methods
+SHARE_USER_WORKERS = 8
+
+# Concurrent add requests used by import_from_csv
+IMPORT_WORKERS = 8
+
+
 class LastPassClient:
     """
     Main LastPass client for vault operations
@@ -65,6 +87,36 @@ class LastPassClient:
         self._accounts: List[Account] = []
         self._shares: List[Share] = []
         self._blob_loaded = False
+        # Writes inside batch() defer their refresh sync until the block exits
+        self._batch_depth = 0
+        self._sync_pending = False
+        # Lowercased search fields, rebuilt whenever _accounts is replaced
+        self._search_keys: List[Dict[str, str]] = []
+        self._accounts_by_id: Dict[str, Account] = {}
+        self._search_keys_source: Optional[List[Account]] = None
+        self._trigram_index: Optional[Dict[str, Set[int]]] = None
+        self._substring_queries = 0
+        self._regex_corpus: Optional[Tuple[List[Account], Tuple[str, ...], bytes, List[int]]] = None
+        # Read-only views handed out by the accounts/shares properties
+        self._accounts_view: Tuple[Account, ...] = ()
+        self._accounts_view_source: Optional[List[Account]] = None
+        self._shares_view: Tuple[Share, ...] = ()
+        self._shares_view_source: Optional[List[Share]] = None
+        # Sorted group names, rebuilt whenever _accounts is replaced
+        self._groups: List[str] = []
+        self._groups_source: Optional[List[Account]] = None
+        # Share lookup tables, rebuilt whenever _shares is replaced
+        self._shares_by_key: Dict[str, Share] = {}
+        self._shares_index_source: Optional[List[Share]] = None
+        # Shares resolved by name/ID since the last completed sync
+        self._sync_generation = 0
+        self._resolved_shares: Dict[str, Share] = {}
+        self._resolved_shares_generation = 0
+        # In-memory only: iteration counts and KDF results for recent logins
+        self._iterations: Dict[str, int] = {}
+        self._iteration_prefetches: Dict[str, threading.Thread] = {}
+        self._derived_keys: Dict[Tuple[str, str, int], Tuple[str, bytes]] = {}
+        self._derived_keys_secret = secrets.token_bytes(32)
     
     @property
     def encryption_key(self) -> Optional[bytes]:
@@ -76,6 +128,32 @@ class LastPassClient:
         """Set encryption key"""
         self.decryption_key = value
     
+    @property
+    def accounts(self) -> Tuple[Account, ...]:
+        """
+        Read-only view of the loaded accounts
+        
+        Unlike get_accounts() this neither syncs nor copies; the same tuple
+        is returned until the vault is reloaded.
+        """
+        if self._accounts_view_source is not self._accounts:
+            self._accounts_view = tuple(self._accounts)
+            self._accounts_view_source = self._accounts
+        return self._accounts_view
+    
+    @property
+    def shares(self) -> Tuple[Share, ...]:
+        """
+        Read-only view of the loaded shared folders
+        
+        Unlike get_shares() this neither syncs nor copies; the same tuple
+        is returned until the vault is reloaded.
+        """
+        if self._shares_view_source is not self._shares:
+            self._shares_view = tuple(self._shares)
+            self._shares_view_source = self._shares
+        return self._shares_view
+    
     def login(self, username: str, password: Optional[str] = None, 
               trust: bool = False, otp: Optional[str] = None,
               force: bool = False) -> None:
@@ -103,19 +181,24 @@ class LastPassClient:
             password = getpass("Master Password: ")
         
         # Get iteration count
-        iterations = self.http.get_iterations(username)
+        iterations = self._get_iterations(username)
         
         # Derive keys
-        login_key, decryption_key = derive_keys(username, password, iterations)
-        
-        # Login to server
-        response_xml, status = self.http.login(username, login_key, iterations, trust, otp)
+        login_key, decryption_key = self._derive_keys(username, password, iterations)
         
-        if status != 200:
-            raise LoginFailedException(f"Login failed with HTTP status {status}")
-        
-        # Parse session from response
-        self.session = parse_login_response(response_xml)
+        try:
+            # Login to server
+            response_xml, status = self.http.login(username, login_key, iterations, trust, otp)
+            
+            if status != 200:
+                raise LoginFailedException(f"Login failed with HTTP status {status}")
+            
+            # Parse session from response
+            self.session = parse_login_response(response_xml)
+        except Exception:
+            # Don't reuse a stale iteration count or a rejected key next time
+            self._forget_keys(username)
+            raise
         self.session.server = self.server
         self.decryption_key = decryption_key
         
@@ -135,12 +218,13 @@ class LastPassClient:
         self._blob_loaded = False
         self._accounts = []
         self._shares = []
+        self._resolved_shares = {}
     
     def _try_load_session(self, username: str, password: Optional[str]) -> bool:
         """Try to load existing session"""
         if password:
-            iterations = self.http.get_iterations(username)
-            _, decryption_key = derive_keys(username, password, iterations)
+            iterations = self._get_iterations(username)
+            _, decryption_key = self._derive_keys(username, password, iterations)
         else:
             # Try to load plaintext key
             plaintext_key_file = self.config_dir / "plaintext_key"
@@ -159,6 +243,71 @@ class LastPassClient:
         
         return False
     
+    def prefetch_iterations(self, username: str) -> None:
+        """
+        Start fetching the PBKDF2 iteration count for username in the background
+        
+        Lets the request overlap with the master password prompt, so login
+        finds the count already cached. A failed fetch is simply retried by
+        login.
+        """
+        if username in self._iterations or username in self._iteration_prefetches:
+            return
+        
+        def fetch() -> None:
+            try:
+                self._iterations[username] = self.http.get_iterations(username)
+            except Exception:
+                pass
+        
+        thread = threading.Thread(target=fetch, daemon=True)
+        self._iteration_prefetches[username] = thread
+        thread.start()
+    
+    def _get_iterations(self, username: str) -> int:
+        """Get the PBKDF2 iteration count for username, asking the server once"""
+        # Wait for a prefetch in flight rather than sending the request twice
+        prefetch = self._iteration_prefetches.pop(username, None)
+        if prefetch is not None:
+            prefetch.join()
+        
+        if username not in self._iterations:
+            self._iterations[username] = self.http.get_iterations(username)
+        return self._iterations[username]
+    
+    def _derive_keys(self, username: str, password: str, iterations: int) -> Tuple[str, bytes]:
+        """
+        Derive login and decryption keys, reusing a derivation from this client
+        
+        Results are keyed by an HMAC of the password under a per-client random
+        secret rather than the password itself, kept in memory only, and
+        cleared on logout.
+        """
+        password_mac = hmac.new(self._derived_keys_secret, password.encode('utf-8'),
+                                hashlib.sha256).hexdigest()
+        cache_key = (username, password_mac, iterations)
+        
+        keys = self._derived_keys.get(cache_key)
+        if keys is None:
+            keys = derive_keys(username, password, iterations)
+            # Keep only a handful of recent derivations
+            if len(self._derived_keys) >= 4:
+                del self._derived_keys[next(iter(self._derived_keys))]
+            self._derived_keys[cache_key] = keys
+        
+        return keys
+    
+    def _forget_keys(self, username: Optional[str] = None) -> None:
+        """Drop cached iteration counts and derived keys (for one user or all)"""
+        if username is None:
+            self._iterations.clear()
+            self._derived_keys.clear()
+            return
+        
+        self._iterations.pop(username, None)
+        for cache_key in [k for k in self._derived_keys if k[0] == username]:
+            del self._derived_keys[cache_key]
+    
     def logout(self, force: bool = False) -> None:
         """
         Logout and clear session
@@ -179,8 +328,10 @@ class LastPassClient:
         # Clear in-memory data
         self.session = None
         self.decryption_key = None
+        self._forget_keys()
         self._accounts = []
         self._shares = []
+        self._resolved_shares = {}
         self._blob_loaded = False
     
     def is_logged_in(self) -> bool:
@@ -209,6 +360,62 @@ class LastPassClient:
         self._accounts = accounts
         self._shares = shares
         self._blob_loaded = True
+        self._sync_pending = False
+        self._sync_generation += 1
+    
+    def _refresh_after_write(self, auto_sync: bool = True) -> None:
+        """
+        Bring the local vault up to date after a write
+        
+        Syncs immediately unless auto_sync is False or a batch() block is
+        active. With auto_sync=False the cache is marked stale so the next
+        read downloads it; inside a batch the cached vault stays usable for
+        lookups and is refreshed once when the block exits.
+        """
+        if self._batch_depth:
+            self._sync_pending = True
+        elif auto_sync:
+            self.sync(force=True)
+        else:
+            self._blob_loaded = False
+            self._sync_pending = True
+    
+    @contextmanager
+    def batch(self) -> Iterator["LastPassClient"]:
+        """
+        Group several writes so the vault is re-downloaded once at the end
+        
+        Example:
+            with client.batch():
+                for entry in entries:
+                    client.add_account(**entry)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._sync_pending:
+                # Writes made before an exception must not be hidden behind
+                # the cached vault; the next read downloads it again
+                self._blob_loaded = False
+        
+        if not self._batch_depth and self._sync_pending and self.is_logged_in():
+            self.sync(force=True)
+    
+    def _find_account_for_write(self, query: str) -> Optional[Account]:
+        """
+        Find the account a write applies to, syncing only when needed
+        
+        Uses the cached vault when one is loaded. If the query misses while
+        earlier writes are still unsynced (e.g. an entry added in the same
+        batch), the vault is refreshed once and the lookup retried.
+        """
+        account = self.find_account(query, sync=not self._blob_loaded)
+        if account is None and self._sync_pending:
+            self.sync(force=True)
+            account = self.find_account(query, sync=False)
+        return account
     
     def get_accounts(self, sync: bool = True) -> List[Account]:
         """
@@ -218,7 +425,8 @@ class LastPassClient:
             sync: Sync from server before returning
         
         Returns:
-            List of Account objects
+            List of Account objects (a fresh copy; see the accounts
+            property for a read-only view that avoids it)
         """
         if sync:
             self.sync()
@@ -233,7 +441,8 @@ class LastPassClient:
             sync: Sync from server before returning
         
         Returns:
-            List of Share objects
+            List of Share objects (a fresh copy; see the shares
+            property for a read-only view that avoids it)
         """
         if sync:
             self.sync()
@@ -285,25 +494,100 @@ class LastPassClient:
         
         matches = []
         query_lower = query.lower()
+        accounts = self._accounts
+        search_keys = self._get_search_keys()
         
-        for account in self._accounts:
+        # Exact ID match takes precedence over substring matches
+        account = self._accounts_by_id.get(query)
+        if account is not None and (not group or account.group == group):
+            return [account]
+        
+        candidates = self._get_trigram_candidates(query_lower)
+        if candidates is None:
+            candidates = range(len(accounts))
+        
+        for i in candidates:
+            account = accounts[i]
+            keys = search_keys[i]
+            
             # Filter by group if specified
             if group and account.group != group:
                 continue
             
-            # Check for exact ID match
-            if account.id == query:
-                return [account]
-            
             # Check for substring matches
-            if (query_lower in account.name.lower() or
-                query_lower in account.fullname.lower() or
-                query_lower in account.username.lower() or
-                query_lower in account.url.lower()):
+            if (query_lower in keys["name"] or
+                query_lower in keys["fullname"] or
+                query_lower in keys["username"] or
+                query_lower in keys["url"]):
                 matches.append(account)
         
         return matches
     
+    def _get_search_keys(self) -> List[Dict[str, str]]:
+        """
+        Get lowercased search fields for each account, parallel to _accounts
+        
+        Computed once per sync instead of lowercasing every field on every query.
+        The ID index used for exact-ID lookups is rebuilt alongside.
+        """
+        if self._search_keys_source is not self._accounts:
+            self._accounts_by_id = {}
+            for account in self._accounts:
+                self._accounts_by_id.setdefault(account.id, account)
+            self._search_keys = [
+                {
+                    "name": account.name.lower(),
+                    "fullname": account.fullname.lower(),
+                    "username": account.username.lower(),
+                    "url": account.url.lower(),
+                }
+                for account in self._accounts
+            ]
+            self._search_keys_source = self._accounts
+            self._trigram_index = None
+            self._substring_queries = 0
+        
+        return self._search_keys
+    
+    def _get_trigram_candidates(self, query_lower: str) -> Optional[List[int]]:
+        """
+        Get indices of accounts that may contain query_lower in a search field
+        
+        Uses a trigram index over the lowercased search fields. The index is
+        built on the second query against the same account list, so one-shot
+        lookups keep the cheaper linear scan.
+        
+        Returns:
+            Sorted candidate indices, or None if every account must be scanned
+        """
+        if len(query_lower) < 3:
+            return None
+        
+        search_keys = self._get_search_keys()
+        
+        if self._trigram_index is None:
+            self._substring_queries += 1
+            if self._substring_queries < 2:
+                return None
+            
+            index: Dict[str, Set[int]] = {}
+            for i, keys in enumerate(search_keys):
+                for value in keys.values():
+                    for j in range(len(value) - 2):
+                        index.setdefault(value[j:j + 3], set()).add(i)
+            self._trigram_index = index
+        
+        candidates: Optional[Set[int]] = None
+        for j in range(len(query_lower) - 2):
+            postings = self._trigram_index.get(query_lower[j:j + 3])
+            if not postings:
+                return []
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return []
+        
+        return sorted(candidates)
+    
     def list_groups(self, sync: bool = True) -> List[str]:
         """
         Get list of all groups/folders
@@ -317,12 +601,11 @@ class LastPassClient:
         if sync:
             self.sync()
         
-        groups = set()
-        for account in self._accounts:
-            if account.group:
-                groups.add(account.group)
+        if self._groups_source is not self._accounts:
+            self._groups = sorted({a.group for a in self._accounts if a.group})
+            self._groups_source = self._accounts
         
-        return sorted(groups)
+        return list(self._groups)
     
     def generate_password(self, length: int = 16, symbols: bool = True) -> str:
         """
@@ -335,11 +618,43 @@ class LastPassClient:
         Returns:
             Generated password
         """
+        return self.generate_passwords(1, length, symbols)[0]
+    
+    def generate_passwords(self, count: int, length: int = 16,
+                           symbols: bool = True) -> List[str]:
+        """
+        Generate several random passwords at once
+        
+        Randomness is drawn from the OS in one block and mapped onto the
+        character set by rejection sampling, so the cost is a single
+        syscall rather than one per character.
+        
+        Args:
+            count: Number of passwords
+            length: Password length
+            symbols: Include symbols
+        
+        Returns:
+            List of generated passwords
+        """
         chars = string.ascii_letters + string.digits
         if symbols:
             chars += "!@#$%^&*()_+-=[]{}|;:,.<>?"
         
-        return ''.join(secrets.choice(chars) for _ in range(length))
+        n = len(chars)
+        mask = (1 << (n - 1).bit_length()) - 1
+        needed = count * length
+        out: List[str] = []
+        
+        while len(out) < needed:
+            for b in secrets.token_bytes((needed - len(out)) * 2):
+                idx = b & mask
+                if idx < n:
+                    out.append(chars[idx])
+                    if len(out) == needed:
+                        break
+        
+        return [''.join(out[i * length:(i + 1) * length]) for i in range(count)]
     
     def get_password(self, query: str, sync: bool = True) -> str:
         """
@@ -400,7 +715,8 @@ class LastPassClient:
     
     def add_account(self, name: str, username: str = "", password: str = "",
                    url: str = "", notes: str = "", group: str = "",
-                   fields: Optional[Dict[str, str]] = None, is_app: bool = False) -> str:
+                   fields: Optional[Dict[str, str]] = None, is_app: bool = False,
+                   auto_sync: bool = True) -> str:
         """
         Add a new account to the vault
         
@@ -413,6 +729,7 @@ class LastPassClient:
             group: Group/folder name
             fields: Custom fields as dict
             is_app: Whether this is an application entry
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Returns:
             Account ID of created account
@@ -423,40 +740,32 @@ class LastPassClient:
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        from . import cipher
-        
         # Encrypt account data
-        account_data = {
-            "name": cipher.aes_encrypt(name, self.encryption_key).decode('utf-8'),
-            "username": cipher.aes_encrypt(username, self.encryption_key).decode('utf-8') if username else "",
-            "password": cipher.aes_encrypt(password, self.encryption_key).decode('utf-8') if password else "",
-            "url": cipher.aes_encrypt(url, self.encryption_key).decode('utf-8') if url else "",
-            "extra": cipher.aes_encrypt(notes, self.encryption_key).decode('utf-8') if notes else "",
-            "grouping": cipher.aes_encrypt(group, self.encryption_key).decode('utf-8') if group else "",
-        }
-        
-        # Mark as application entry if specified
+        account_data = self._encrypt_account_data({
+            "name": name,
+            "username": username,
+            "password": password,
+            "url": url,
+            "extra": notes,
+            "grouping": group,
+        }, fields)
+        
+        # Mark as application entry if specified (app name is the entry name)
         if is_app:
-            account_data["appname"] = cipher.aes_encrypt(name, self.encryption_key).decode('utf-8')
-        
-        # Add custom fields if provided
-        if fields:
-            for field_name, field_value in fields.items():
-                encrypted_name = cipher.aes_encrypt(field_name, self.encryption_key).decode('utf-8')
-                encrypted_value = cipher.aes_encrypt(field_value, self.encryption_key).decode('utf-8')
-                account_data[f"customfield_{encrypted_name}"] = encrypted_value
+            account_data["appname"] = account_data["name"]
         
         account_id = self.http.add_account(self.session, account_data)
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
         
         return account_id
     
     def update_account(self, query: str, name: Optional[str] = None,
                       username: Optional[str] = None, password: Optional[str] = None,
                       url: Optional[str] = None, notes: Optional[str] = None,
-                      group: Optional[str] = None, fields: Optional[Dict[str, str]] = None) -> None:
+                      group: Optional[str] = None, fields: Optional[Dict[str, str]] = None,
+                      auto_sync: bool = True) -> None:
         """
         Update an existing account
         
@@ -469,6 +778,7 @@ class LastPassClient:
             notes: New notes (if provided)
             group: New group (if provided)
             fields: Custom fields as dict (if provided)
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             AccountNotFoundException: If account not found
@@ -477,46 +787,64 @@ class LastPassClient:
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        account = self.find_account(query, sync=True)
+        account = self._find_account_for_write(query)
         if not account:
             raise AccountNotFoundException(f"Account not found: {query}")
         
-        from . import cipher
-        
         # Build update data with only changed fields
-        account_data = {}
-        
-        if name is not None:
-            account_data["name"] = cipher.aes_encrypt(name, self.encryption_key).decode('utf-8')
-        if username is not None:
-            account_data["username"] = cipher.aes_encrypt(username, self.encryption_key).decode('utf-8')
-        if password is not None:
-            account_data["password"] = cipher.aes_encrypt(password, self.encryption_key).decode('utf-8')
-        if url is not None:
-            account_data["url"] = cipher.aes_encrypt(url, self.encryption_key).decode('utf-8')
-        if notes is not None:
-            account_data["extra"] = cipher.aes_encrypt(notes, self.encryption_key).decode('utf-8')
-        if group is not None:
-            account_data["grouping"] = cipher.aes_encrypt(group, self.encryption_key).decode('utf-8')
-        
-        # Add custom fields if provided
-        if fields:
-            for field_name, field_value in fields.items():
-                encrypted_name = cipher.aes_encrypt(field_name, self.encryption_key).decode('utf-8')
-                encrypted_value = cipher.aes_encrypt(field_value, self.encryption_key).decode('utf-8')
-                account_data[f"customfield_{encrypted_name}"] = encrypted_value
+        changes = {
+            "name": name,
+            "username": username,
+            "password": password,
+            "url": url,
+            "extra": notes,
+            "grouping": group,
+        }
+        account_data = self._encrypt_account_data(
+            {key: value for key, value in changes.items() if value is not None},
+            fields,
+        )
         
         self.http.update_account(self.session, account.id, account_data)
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
+    
+    def _encrypt_account_data(self, values: Dict[str, str],
+                              fields: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Encrypt account values and custom fields in a single batch
+        
+        Args:
+            values: Plaintext values keyed by request parameter name
+            fields: Custom fields as dict (name -> value)
+        
+        Returns:
+            Request parameters with encrypted values, including one
+            customfield_<encrypted name> entry per custom field
+        """
+        from . import cipher
+        
+        plaintexts = list(values.values())
+        for field_name, field_value in (fields or {}).items():
+            plaintexts.extend((field_name, field_value))
+        
+        encrypted = cipher.aes_encrypt_many_str(plaintexts, self.encryption_key)
+        
+        account_data = dict(zip(values, encrypted))
+        custom = encrypted[len(values):]
+        for i in range(0, len(custom), 2):
+            account_data[f"customfield_{custom[i]}"] = custom[i + 1]
+        
+        return account_data
     
-    def delete_account(self, query: str) -> None:
+    def delete_account(self, query: str, auto_sync: bool = True) -> None:
         """
         Delete an account from the vault
         
         Args:
             query: Account query (name, ID, or URL)
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             AccountNotFoundException: If account not found
@@ -525,7 +853,7 @@ class LastPassClient:
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        account = self.find_account(query, sync=True)
+        account = self._find_account_for_write(query)
         if not account:
             raise AccountNotFoundException(f"Account not found: {query}")
         
@@ -533,15 +861,58 @@ class LastPassClient:
         self.http.delete_account(self.session, account.id, share_id)
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
     
-    def duplicate_account(self, query: str, new_name: Optional[str] = None) -> str:
+    def delete_accounts(self, queries: List[str], auto_sync: bool = True) -> None:
+        """
+        Delete several accounts from the vault
+        
+        Every query is resolved before anything is deleted, then the delete
+        requests are sent concurrently and the vault is refreshed once.
+        
+        Args:
+            queries: Account queries (name, ID, or URL)
+            auto_sync: Sync afterwards instead of only marking the vault stale
+        
+        Raises:
+            AccountNotFoundException: If any account is not found
+            InvalidSessionException: If not logged in
+        """
+        if not self.is_logged_in():
+            raise InvalidSessionException("Not logged in")
+        
+        targets = []
+        for query in queries:
+            account = self._find_account_for_write(query)
+            if not account:
+                raise AccountNotFoundException(f"Account not found: {query}")
+            targets.append((account.id, account.share.id if account.share else None))
+        
+        if not targets:
+            return
+        
+        # Queries naming the same account only delete it once
+        try:
+            self.http.delete_accounts(self.session, list(dict.fromkeys(targets)))
+        except Exception:
+            # Some deletes may have gone through; don't serve them from the
+            # cached vault
+            self._blob_loaded = False
+            self._sync_pending = True
+            raise
+        
+        # Sync to refresh vault
+        self._refresh_after_write(auto_sync)
+    
+    def duplicate_account(self, query: str, new_name: Optional[str] = None,
+                          auto_sync: bool = True) -> str:
         """
         Duplicate an existing account
         
         Args:
             query: Account query (name, ID, or URL)
             new_name: Name for the duplicate (defaults to "Copy of [original name]")
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Returns:
             Account ID of duplicated account
@@ -553,7 +924,7 @@ class LastPassClient:
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        account = self.find_account(query, sync=True)
+        account = self._find_account_for_write(query)
         if not account:
             raise AccountNotFoundException(f"Account not found: {query}")
         
@@ -574,22 +945,24 @@ class LastPassClient:
             url=account.url,
             notes=account.notes,
             group=account.group,
-            fields=fields
+            fields=fields,
+            auto_sync=auto_sync,
         )
     
-    def move_account(self, query: str, new_group: str) -> None:
+    def move_account(self, query: str, new_group: str, auto_sync: bool = True) -> None:
         """
         Move an account to a different group/folder
         
         Args:
             query: Account query (name, ID, or URL)
             new_group: New group/folder name
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             AccountNotFoundException: If account not found
             InvalidSessionException: If not logged in
         """
-        self.update_account(query, group=new_group)
+        self.update_account(query, group=new_group, auto_sync=auto_sync)
     
     def get_attachment(self, query: str, attachment_id: str) -> bytes:
         """
@@ -633,15 +1006,52 @@ class LastPassClient:
         
         encrypted_data = self.http.get_attachment(self.session, attachment_id, share_id)
         
-        # The attachment data comes back encrypted
-        decrypted_data = cipher.decrypt_aes256_cbc_base64(
-            encrypted_data.decode('utf-8'),
+        # The attachment data comes back encrypted; decrypt it in chunks
+        # since attachments can be several megabytes
+        decrypted_data = cipher.decrypt_aes256_cbc_base64_stream(
+            encrypted_data,
             self.encryption_key
         )
         
         return decrypted_data
     
-    def upload_attachment(self, query: str, filename: str, file_data: bytes) -> None:
+    def get_attachments(self, query: str) -> Dict[str, bytes]:
+        """
+        Download every attachment of an account
+        
+        The downloads are sent concurrently over the HTTP client's pooled
+        connections rather than one round trip after another.
+        
+        Args:
+            query: Account query (name, ID, or URL)
+        
+        Returns:
+            Attachment data as bytes, by attachment ID
+        
+        Raises:
+            AccountNotFoundException: If account not found
+            InvalidSessionException: If not logged in
+        """
+        if not self.is_logged_in():
+            raise InvalidSessionException("Not logged in")
+        
+        account = self.find_account(query, sync=True)
+        if not account:
+            raise AccountNotFoundException(f"Account not found: {query}")
+        
+        from . import cipher
+        
+        attachment_ids = [att.id for att in account.attachments]
+        share_id = account.share.id if account.share else None
+        encrypted = self.http.get_attachments(self.session, attachment_ids, share_id)
+        
+        return {
+            attachment_id: cipher.decrypt_aes256_cbc_base64_stream(data, self.encryption_key)
+            for attachment_id, data in zip(attachment_ids, encrypted)
+        }
+    
+    def upload_attachment(self, query: str, filename: str, file_data: bytes,
+                          auto_sync: bool = True) -> None:
         """
         Upload an attachment to an account
         
@@ -649,6 +1059,7 @@ class LastPassClient:
             query: Account query (name, ID, or URL)
             filename: Name of the file
             file_data: File data as bytes
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             AccountNotFoundException: If account not found
@@ -657,7 +1068,7 @@ class LastPassClient:
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        account = self.find_account(query, sync=True)
+        account = self._find_account_for_write(query)
         if not account:
             raise AccountNotFoundException(f"Account not found: {query}")
         
@@ -673,7 +1084,7 @@ class LastPassClient:
                                     encrypted_data, share_id)
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
     
     def search_accounts_advanced(self, query: str, search_type: str = 'exact',
                                  fields: Optional[List[str]] = None,
@@ -690,16 +1101,15 @@ class LastPassClient:
         Returns:
             List of matching accounts
         """
-        import re
-        
         # Validate empty query for non-exact searches
         if search_type in ['substring', 'fixed'] and not query:
             return []
         
-        # Validate regex pattern before iterating
+        # Compile regex pattern once, before iterating
+        pattern = None
         if search_type == 'regex':
             try:
-                re.compile(query, re.IGNORECASE)
+                pattern = re.compile(query, re.IGNORECASE)
             except re.error as e:
                 raise LastPassException(f"Invalid regex pattern: {e}")
         
@@ -709,38 +1119,179 @@ class LastPassClient:
         if fields is None:
             fields = ['name', 'id', 'fullname', 'username', 'url', 'notes']
         
+        # Pick the matcher once instead of branching per account
+        search_methods = {
+            'exact': (self._search_exact, query),
+            'regex': (self._search_regex, pattern),
+            'substring': (self._search_substring, query.lower()),
+        }
+        
+        if search_type not in search_methods:
+            return []
+        
+        search, needle = search_methods[search_type]
+        return search(needle, fields)
+    
+    @staticmethod
+    def _field_getter(fields: List[str]) -> Callable[[Account], Tuple[Any, ...]]:
+        """
+        Build a function returning the given fields of an account as a tuple
+        
+        Fetches all fields with a single operator.attrgetter call; names that
+        are not Account attributes read as '' like getattr(account, field, '').
+        """
+        known = {f.name for f in dataclasses.fields(Account)}
+        present = [f for f in fields if f in known or hasattr(Account, f)]
+        missing = ('',) if len(present) < len(fields) else ()
+        
+        if not present:
+            return lambda account: missing
+        
+        getter = operator.attrgetter(*present)
+        if len(present) == 1:
+            return lambda account: (getter(account),) + missing
+        if missing:
+            return lambda account: getter(account) + missing
+        return getter
+    
+    def _search_exact(self, query: str, fields: List[str]) -> List[Account]:
+        """Match accounts where any of the given fields equals query"""
+        getter = self._field_getter(fields)
+        return [account for account in self._accounts if query in getter(account)]
+    
+    def _search_regex(self, pattern: re.Pattern, fields: List[str]) -> List[Account]:
+        """Match accounts where pattern is found in any of the given fields"""
         matches = []
         
-        for account in self._accounts:
-            if search_type == 'exact':
-                # Exact match on any field
-                for field in fields:
-                    field_value = getattr(account, field, '')
-                    if field_value == query:
-                        matches.append(account)
-                        break
+        candidates = self._get_hyperscan_candidates(pattern, fields)
+        if candidates is None:
+            accounts = self._accounts
+        else:
+            accounts = [self._accounts[i] for i in candidates]
+        
+        getter = self._field_getter(fields)
+        search = pattern.search
+        for account in accounts:
+            for value in getter(account):
+                if search(value):
+                    matches.append(account)
+                    break
+        
+        return matches
+    
+    def _get_hyperscan_candidates(self, pattern: re.Pattern,
+                                  fields: List[str]) -> Optional[List[int]]:
+        """
+        Prefilter accounts for a regex search with Hyperscan, if installed
+        
+        All searched fields are joined into one newline-separated buffer and
+        scanned in linear time. Hyperscan runs in prefilter mode, so it may
+        report extra accounts but never misses one; callers must still
+        confirm each candidate with the Python pattern.
+        
+        Returns:
+            Sorted candidate indices into _accounts, or None to scan every account
+        """
+        if len(self._accounts) < HYPERSCAN_MIN_ACCOUNTS:
+            return None
+        
+        # Patterns matching the empty string match every account anyway
+        if pattern.search('') or _HYPERSCAN_UNSAFE.search(pattern.pattern):
+            return None
+        
+        try:
+            import hyperscan
+        except ImportError:
+            return None
+        
+        corpus = self._get_regex_corpus(tuple(fields))
+        if corpus is None:
+            return None
+        buffer, offsets = corpus
+        
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[pattern.pattern.encode('utf-8')],
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 |
+                       hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_MULTILINE |
+                       hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH],
+            )
+        except hyperscan.error:
+            return None
+        
+        candidates = []
+        view = memoryview(buffer)
+        index = 0
+        
+        while index < len(offsets):
+            start = offsets[index]
+            match_ends = []
             
-            elif search_type == 'regex':
-                # Regex match
-                try:
-                    pattern = re.compile(query, re.IGNORECASE)
-                    for field in fields:
-                        field_value = getattr(account, field, '')
-                        if pattern.search(field_value):
-                            matches.append(account)
-                            break
-                except re.error as e:
-                    # Invalid regex pattern
-                    raise LastPassException(f"Invalid regex pattern: {e}")
+            def on_match(expr_id, match_from, match_to, flags, context):
+                match_ends.append(match_to)
+                return True  # Stop at the first match
+            
+            try:
+                database.scan(view[start:], match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
             
-            elif search_type == 'substring':
-                # Substring match (case insensitive)
-                query_lower = query.lower()
-                for field in fields:
+            if not match_ends:
+                break
+            
+            # Attribute the match to the account holding its last byte, then
+            # resume scanning at the next account
+            index = bisect.bisect_right(offsets, start + match_ends[0] - 1) - 1
+            candidates.append(index)
+            index += 1
+        
+        return candidates
+    
+    def _get_regex_corpus(self, fields: Tuple[str, ...]) -> Optional[Tuple[bytes, List[int]]]:
+        """
+        Get the UTF-8 search buffer for fields and each account's start offset
+        
+        Cached until _accounts is replaced or a different field list is used.
+        Returns None if a field is not a string.
+        """
+        cached = self._regex_corpus
+        if cached is not None and cached[0] is self._accounts and cached[1] == fields:
+            return cached[2], cached[3]
+        
+        parts = []
+        offsets = []
+        position = 0
+        
+        for account in self._accounts:
+            offsets.append(position)
+            for field in fields:
+                value = getattr(account, field, '')
+                if not isinstance(value, str):
+                    return None
+                try:
+                    encoded = value.encode('utf-8') + b'\n'
+                except UnicodeEncodeError:
+                    return None
+                parts.append(encoded)
+                position += len(encoded)
+        
+        buffer = b''.join(parts)
+        self._regex_corpus = (self._accounts, fields, buffer, offsets)
+        return buffer, offsets
+    
+    def _search_substring(self, query_lower: str, fields: List[str]) -> List[Account]:
+        """Match accounts where any of the given fields contains query (case insensitive)"""
+        matches = []
+        
+        for account, keys in zip(self._accounts, self._get_search_keys()):
+            for field in fields:
+                field_value = keys.get(field)
+                if field_value is None:
                     field_value = getattr(account, field, '').lower()
-                    if query_lower in field_value:
-                        matches.append(account)
-                        break
+                if query_lower in field_value:
+                    matches.append(account)
+                    break
         
         return matches
     
@@ -765,12 +1316,7 @@ class LastPassClient:
             raise InvalidSessionException("Not logged in")
         
         # Find share
-        shares = self.get_shares(sync=True)
-        share = None
-        for s in shares:
-            if s.id == share_name or s.name == share_name:
-                share = s
-                break
+        share = self._resolve_share(share_name)
         
         if not share:
             raise AccountNotFoundException(f"Share not found: {share_name}")
@@ -807,12 +1353,7 @@ class LastPassClient:
             raise InvalidSessionException("Not logged in")
         
         # Find share
-        shares = self.get_shares(sync=True)
-        share = None
-        for s in shares:
-            if s.id == share_name or s.name == share_name:
-                share = s
-                break
+        share = self._resolve_share(share_name)
         
         if not share:
             raise AccountNotFoundException(f"Share not found: {share_name}")
@@ -840,11 +1381,44 @@ class LastPassClient:
         if sync:
             self.sync()
         
-        for share in self._shares:
-            if share.id == query or share.name == query:
-                return share
+        return self._get_share_index().get(query)
+    
+    def _resolve_share(self, query: str) -> Optional[Share]:
+        """
+        Find a share for a share operation, remembering the result
+        
+        A share resolved since the last sync is reused without syncing
+        again, so a run of share operations with auto_sync=False does not
+        re-download the vault just to look the same share up.
+        """
+        if self._resolved_shares_generation != self._sync_generation:
+            self._resolved_shares = {}
+            self._resolved_shares_generation = self._sync_generation
+        
+        share = self._resolved_shares.get(query)
+        if share is None:
+            share = self.find_share(query, sync=True)
+            if share is not None:
+                self._resolved_shares[query] = share
+        
+        return share
+    
+    def _get_share_index(self) -> Dict[str, Share]:
+        """
+        Return a share lookup table by ID or name, rebuilding if stale
+        
+        Shares are added in list order and never overwrite an earlier entry,
+        so a query maps to the first share whose ID or name matches it.
+        """
+        if self._shares_index_source is not self._shares:
+            by_key: Dict[str, Share] = {}
+            for share in self._shares:
+                by_key.setdefault(share.id, share)
+                by_key.setdefault(share.name, share)
+            self._shares_by_key = by_key
+            self._shares_index_source = self._shares
         
-        return None
+        return self._shares_by_key
     
     def search_accounts_regex(self, query: str, fields: Optional[List[str]] = None, sync: bool = True) -> List[Account]:
         """
@@ -874,12 +1448,13 @@ class LastPassClient:
         """
         return self.search_accounts_advanced(query, search_type='substring', fields=fields, sync=sync)
     
-    def create_share(self, share_name: str) -> str:
+    def create_share(self, share_name: str, auto_sync: bool = True) -> str:
         """
         Create a new shared folder
         
         Args:
             share_name: Name of the shared folder to create
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Returns:
             Share ID as string
@@ -893,16 +1468,17 @@ class LastPassClient:
         share_id = self.http.create_share(self.session, share_name)
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
         
         return share_id
     
-    def delete_share(self, share_name_or_id: str) -> None:
+    def delete_share(self, share_name_or_id: str, auto_sync: bool = True) -> None:
         """
         Delete a shared folder
         
         Args:
             share_name_or_id: Share name or ID
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             InvalidSessionException: If not logged in
@@ -912,14 +1488,18 @@ class LastPassClient:
             raise InvalidSessionException("Not logged in")
         
         # Find share
-        share = self.find_share(share_name_or_id, sync=True)
+        share = self._resolve_share(share_name_or_id)
         if not share:
             raise AccountNotFoundException(f"Share not found: {share_name_or_id}")
         
         self.http.delete_share(self.session, share.id)
+        self._resolved_shares = {
+            query: resolved for query, resolved in self._resolved_shares.items()
+            if resolved is not share
+        }
         
         # Sync to refresh vault
-        self.sync(force=True)
+        self._refresh_after_write(auto_sync)
     
     def list_share_users(self, share_name_or_id: str) -> List[Dict[str, Any]]:
         """
@@ -939,7 +1519,7 @@ class LastPassClient:
             raise InvalidSessionException("Not logged in")
         
         # Find share
-        share = self.find_share(share_name_or_id, sync=True)
+        share = self._resolve_share(share_name_or_id)
         if not share:
             raise AccountNotFoundException(f"Share not found: {share_name_or_id}")
         
@@ -947,7 +1527,7 @@ class LastPassClient:
     
     def add_share_user(self, share_name_or_id: str, username: str,
                       readonly: bool = False, admin: bool = False,
-                      hide_passwords: bool = False) -> None:
+                      hide_passwords: bool = False, auto_sync: bool = True) -> None:
         """
         Add a user to a shared folder
         
@@ -957,56 +1537,88 @@ class LastPassClient:
             readonly: Grant read-only access
             admin: Grant admin privileges
             hide_passwords: Hide passwords from user
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             InvalidSessionException: If not logged in
             AccountNotFoundException: If share not found
         """
-        if not self.is_logged_in():
-            raise InvalidSessionException("Not logged in")
+        self.add_share_users(share_name_or_id, [{
+            "username": username,
+            "readonly": readonly,
+            "admin": admin,
+            "hide_passwords": hide_passwords,
+        }], auto_sync=auto_sync)
+    
+    def add_share_users(self, share_name_or_id: str, users: List[Dict[str, Any]],
+                        auto_sync: bool = True) -> None:
+        """
+        Add several users to a shared folder, syncing once at the end
         
-        # Find share
-        share = self.find_share(share_name_or_id, sync=True)
-        if not share:
-            raise AccountNotFoundException(f"Share not found: {share_name_or_id}")
+        Args:
+            share_name_or_id: Share name or ID
+            users: List of dicts with key username and optional readonly,
+                   admin, hide_passwords (default False)
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
-        self.http.add_share_user(
-            self.session, share.id, username,
-            readonly=readonly, admin=admin, hide_passwords=hide_passwords
-        )
+        Raises:
+            InvalidSessionException: If not logged in
+            AccountNotFoundException: If share not found
+        """
+        share = self._find_share_for_write(share_name_or_id)
         
-        # Sync to refresh vault
-        self.sync(force=True)
+        self._run_share_user_requests([
+            partial(
+                self.http.add_share_user, self.session, share.id, user["username"],
+                readonly=user.get("readonly", False),
+                admin=user.get("admin", False),
+                hide_passwords=user.get("hide_passwords", False)
+            )
+            for user in users
+        ], auto_sync)
     
-    def remove_share_user(self, share_name_or_id: str, username: str) -> None:
+    def remove_share_user(self, share_name_or_id: str, username: str,
+                          auto_sync: bool = True) -> None:
         """
         Remove a user from a shared folder
         
         Args:
             share_name_or_id: Share name or ID
             username: Username/email to remove
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             InvalidSessionException: If not logged in
             AccountNotFoundException: If share not found
         """
-        if not self.is_logged_in():
-            raise InvalidSessionException("Not logged in")
+        self.remove_share_users(share_name_or_id, [username], auto_sync=auto_sync)
+    
+    def remove_share_users(self, share_name_or_id: str, usernames: List[str],
+                           auto_sync: bool = True) -> None:
+        """
+        Remove several users from a shared folder, syncing once at the end
         
-        # Find share
-        share = self.find_share(share_name_or_id, sync=True)
-        if not share:
-            raise AccountNotFoundException(f"Share not found: {share_name_or_id}")
+        Args:
+            share_name_or_id: Share name or ID
+            usernames: Usernames/emails to remove
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
-        self.http.remove_share_user(self.session, share.id, username)
+        Raises:
+            InvalidSessionException: If not logged in
+            AccountNotFoundException: If share not found
+        """
+        share = self._find_share_for_write(share_name_or_id)
         
-        # Sync to refresh vault
-        self.sync(force=True)
+        self._run_share_user_requests([
+            partial(self.http.remove_share_user, self.session, share.id, username)
+            for username in usernames
+        ], auto_sync)
     
     def update_share_user(self, share_name_or_id: str, username: str,
                          readonly: Optional[bool] = None,
                          admin: Optional[bool] = None,
-                         hide_passwords: Optional[bool] = None) -> None:
+                         hide_passwords: Optional[bool] = None,
+                         auto_sync: bool = True) -> None:
         """
         Update permissions for a user in a shared folder
         
@@ -1016,26 +1628,80 @@ class LastPassClient:
             readonly: Set read-only access (None = no change)
             admin: Set admin privileges (None = no change)
             hide_passwords: Hide passwords (None = no change)
+            auto_sync: Sync afterwards instead of only marking the vault stale
+        
+        Raises:
+            InvalidSessionException: If not logged in
+            AccountNotFoundException: If share not found
+        """
+        self.update_share_users(share_name_or_id, [{
+            "username": username,
+            "readonly": readonly,
+            "admin": admin,
+            "hide_passwords": hide_passwords,
+        }], auto_sync=auto_sync)
+    
+    def update_share_users(self, share_name_or_id: str, users: List[Dict[str, Any]],
+                           auto_sync: bool = True) -> None:
+        """
+        Update permissions for several users in a shared folder, syncing once
+        
+        Args:
+            share_name_or_id: Share name or ID
+            users: List of dicts with key username and optional readonly,
+                   admin, hide_passwords (missing or None = no change)
+            auto_sync: Sync afterwards instead of only marking the vault stale
         
         Raises:
             InvalidSessionException: If not logged in
             AccountNotFoundException: If share not found
         """
+        share = self._find_share_for_write(share_name_or_id)
+        
+        self._run_share_user_requests([
+            partial(
+                self.http.update_share_user, self.session, share.id, user["username"],
+                readonly=user.get("readonly"),
+                admin=user.get("admin"),
+                hide_passwords=user.get("hide_passwords")
+            )
+            for user in users
+        ], auto_sync)
+    
+    def _run_share_user_requests(self, calls: List[Callable[[], None]],
+                                 auto_sync: bool) -> None:
+        """
+        Send share user requests concurrently, then refresh the vault once
+        
+        The requests are independent and network-bound, so they share the
+        HTTP session's connection pool across a few threads. When several
+        are sent, the vault is refreshed even if some fail, since others may
+        have gone through; the first failure is then re-raised.
+        """
+        errors = []
+        if len(calls) == 1:
+            calls[0]()
+        elif calls:
+            with ThreadPoolExecutor(max_workers=min(SHARE_USER_WORKERS, len(calls))) as pool:
+                futures = [pool.submit(call) for call in calls]
+            errors = [f.exception() for f in futures if f.exception() is not None]
+        
+        # Sync to refresh vault
+        self._refresh_after_write(auto_sync)
+        
+        if errors:
+            raise errors[0]
+    
+    def _find_share_for_write(self, share_name_or_id: str) -> Share:
+        """Resolve the share a write applies to, checking login first"""
         if not self.is_logged_in():
             raise InvalidSessionException("Not logged in")
         
-        # Find share
-        share = self.find_share(share_name_or_id, sync=True)
+        share = self._resolve_share(share_name_or_id)
         if not share:
             raise AccountNotFoundException(f"Share not found: {share_name_or_id}")
         
-        self.http.update_share_user(
-            self.session, share.id, username,
-            readonly=readonly, admin=admin, hide_passwords=hide_passwords
-        )
-        
-        # Sync to refresh vault
-        self.sync(force=True)
+        return share
     
     def change_password(self, current_password: str, new_password: str) -> None:
         """
@@ -1103,12 +1769,13 @@ class LastPassClient:
         
         from .csv_utils import import_accounts_from_csv
         
-        # Parse CSV
-        accounts_data = import_accounts_from_csv(csv_data, keep_duplicates)
+        # Parse CSV, skipping rows that have no name to import under
+        accounts_data = [
+            account_data for account_data in import_accounts_from_csv(csv_data, keep_duplicates)
+            if account_data.get("name")
+        ]
         
-        # Import each account
-        count = 0
-        for account_data in accounts_data:
+        def import_account(account_data: Dict[str, Any]) -> bool:
             try:
                 self.add_account(
                     name=account_data["name"],
@@ -1119,12 +1786,22 @@ class LastPassClient:
                     group=account_data.get("group", ""),
                     fields=account_data.get("fields"),
                 )
-                count += 1
-            except Exception:
+                return True
+            except LastPassException as e:
                 # Skip accounts that fail to import
-                continue
+                get_logger().warning("Failed to import %s: %s", account_data["name"], e)
+                return False
+        
+        # Import each account, syncing once at the end; the rows are
+        # independent round-trips, so several are kept in flight at a time
+        with self.batch():
+            if len(accounts_data) > 1:
+                with ThreadPoolExecutor(max_workers=min(IMPORT_WORKERS, len(accounts_data))) as pool:
+                    imported = list(pool.map(import_account, accounts_data))
+            else:
+                imported = [import_account(account_data) for account_data in accounts_data]
         
-        return count
+        return sum(imported)
     
     def add_secure_note(self, name: str, note_type: NoteType, 
                        fields: Dict[str, str], group: str = "") -> str:
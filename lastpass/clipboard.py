@@ -3,38 +3,85 @@ Clipboard integration for LastPass CLI
 """
 
 import os
+import shutil
 import subprocess
 import sys
-import time
-from typing import Optional
+from typing import List, Optional, Tuple, Union
+
+
+# Run by the detached clear helper: argv is [seconds, command...], where the
+# command is fed empty input; without a command pyperclip is used instead
+_CLEAR_SCRIPT = """
+import subprocess, sys, time
+time.sleep(float(sys.argv[1]))
+if len(sys.argv) > 2:
+    subprocess.run(sys.argv[2:], input=b'', stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+else:
+    try:
+        import pyperclip
+        pyperclip.copy('')
+    except ImportError:
+        pass
+"""
+
+# Clipboard tools in order of preference: the copy command, and the command
+# that clears the clipboard again when fed empty input (None = no auto-clear)
+_CLIPBOARD_TOOLS = [
+    # Linux with X11
+    (['xclip', '-selection', 'clipboard'], ['xclip', '-selection', 'clipboard']),
+    (['xsel', '--clipboard', '--input'], ['xsel', '--clipboard', '--input']),
+    # Linux with Wayland
+    (['wl-copy'], ['wl-copy', '--clear']),
+    # macOS
+    (['pbcopy'], ['pbcopy']),
+    # Windows (WSL or native)
+    (['clip.exe'], None),
+    # Termux (Android)
+    (['termux-clipboard-set'], None),
+]
+
+
+def _as_bytes(text: Union[str, bytes]) -> Union[bytes, bytearray]:
+    """Return text as bytes for a tool's stdin, passing buffers through uncopied"""
+    return text.encode('utf-8') if isinstance(text, str) else text
 
 
 class ClipboardManager:
     """Manage clipboard operations with support for custom commands"""
     
+    # Installed entries of _CLIPBOARD_TOOLS, detected on first use
+    _tools: Optional[List[Tuple[list, Optional[list]]]] = None
+    
     @staticmethod
-    def copy_to_clipboard(text: str, clear_after: Optional[int] = None) -> bool:
+    def copy_to_clipboard(text: Union[str, bytes], clear_after: Optional[int] = None) -> bool:
         """
         Copy text to clipboard
         
         Args:
-            text: Text to copy
+            text: Text to copy (str, or UTF-8 encoded bytes)
             clear_after: Seconds after which to clear clipboard (None = don't clear)
         
         Returns:
             True if successful, False otherwise
         """
-        # Check for custom clipboard command
-        custom_command = os.environ.get('LPASS_CLIPBOARD_COMMAND')
+        # Encode once into a buffer every tool reads from, and wipe it
+        # afterwards so the secret does not linger in freed memory
+        data = bytearray(text, 'utf-8') if isinstance(text, str) else bytearray(text)
         
-        if custom_command:
-            return ClipboardManager._use_custom_command(custom_command, text)
-        
-        # Auto-detect clipboard tool
-        return ClipboardManager._auto_clipboard(text, clear_after)
+        try:
+            # Check for custom clipboard command
+            custom_command = os.environ.get('LPASS_CLIPBOARD_COMMAND')
+            
+            if custom_command:
+                return ClipboardManager._use_custom_command(custom_command, data)
+            
+            # Auto-detect clipboard tool
+            return ClipboardManager._auto_clipboard(data, clear_after)
+        finally:
+            data[:] = bytes(len(data))
     
     @staticmethod
-    def _use_custom_command(command: str, text: str) -> bool:
+    def _use_custom_command(command: str, text: Union[str, bytes]) -> bool:
         """Use custom clipboard command"""
         try:
             process = subprocess.Popen(
@@ -44,54 +91,27 @@ class ClipboardManager:
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            process.communicate(input=text.encode('utf-8'))
+            process.communicate(input=_as_bytes(text))
             return process.returncode == 0
         except Exception:
             return False
     
     @staticmethod
-    def _auto_clipboard(text: str, clear_after: Optional[int] = None) -> bool:
+    def _auto_clipboard(text: Union[str, bytes], clear_after: Optional[int] = None) -> bool:
         """Auto-detect and use appropriate clipboard tool"""
-        # Try different clipboard tools in order of preference
-        
-        # Linux with X11
-        if ClipboardManager._try_command(['xclip', '-selection', 'clipboard'], text):
-            if clear_after:
-                ClipboardManager._schedule_clear(clear_after)
-            return True
-        
-        if ClipboardManager._try_command(['xsel', '--clipboard', '--input'], text):
-            if clear_after:
-                ClipboardManager._schedule_clear(clear_after)
-            return True
-        
-        # Linux with Wayland
-        if ClipboardManager._try_command(['wl-copy'], text):
-            if clear_after:
-                ClipboardManager._schedule_clear_wayland(clear_after)
-            return True
-        
-        # macOS
-        if ClipboardManager._try_command(['pbcopy'], text):
-            if clear_after:
-                ClipboardManager._schedule_clear_macos(clear_after)
-            return True
-        
-        # Windows (WSL or native)
-        if ClipboardManager._try_command(['clip.exe'], text):
-            # No auto-clear on Windows
-            return True
-        
-        # Termux (Android)
-        if ClipboardManager._try_command(['termux-clipboard-set'], text):
-            return True
+        # Try the installed clipboard tools in order of preference
+        for copy_command, clear_command in ClipboardManager._get_clipboard_tools():
+            if ClipboardManager._try_command(copy_command, text):
+                if clear_after and clear_command:
+                    ClipboardManager._schedule_clear(clear_after, clear_command)
+                return True
         
         # Try Python's pyperclip as fallback
         try:
             import pyperclip
-            pyperclip.copy(text)
+            pyperclip.copy(text if isinstance(text, str) else text.decode('utf-8'))
             if clear_after:
-                ClipboardManager._schedule_clear_generic(clear_after)
+                ClipboardManager._schedule_clear(clear_after)
             return True
         except ImportError:
             pass
@@ -99,7 +119,26 @@ class ClipboardManager:
         return False
     
     @staticmethod
-    def _try_command(command: list, text: str) -> bool:
+    def _get_clipboard_tools() -> List[Tuple[list, Optional[list]]]:
+        """
+        Get the clipboard tools found on PATH, in order of preference
+        
+        Detected once per process, so a copy only spawns tools that exist
+        instead of probing each one in turn.
+        """
+        if ClipboardManager._tools is None:
+            tools = [tool for tool in _CLIPBOARD_TOOLS if shutil.which(tool[0][0])]
+            
+            # Under Wayland without X the X11 tools have no display to reach
+            if os.environ.get('WAYLAND_DISPLAY') and not os.environ.get('DISPLAY'):
+                tools.sort(key=lambda tool: tool[0][0] != 'wl-copy')
+            
+            ClipboardManager._tools = tools
+        
+        return ClipboardManager._tools
+    
+    @staticmethod
+    def _try_command(command: list, text: Union[str, bytes]) -> bool:
         """Try to execute clipboard command"""
         try:
             process = subprocess.Popen(
@@ -108,72 +147,28 @@ class ClipboardManager:
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-            process.communicate(input=text.encode('utf-8'), timeout=5)
+            process.communicate(input=_as_bytes(text), timeout=5)
             return process.returncode == 0
         except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
             return False
     
     @staticmethod
-    def _schedule_clear(seconds: int) -> None:
-        """Schedule clipboard clear for X11"""
-        # Fork a background process to clear clipboard after delay
-        try:
-            if os.fork() == 0:
-                # Child process
-                time.sleep(seconds)
-                subprocess.run(
-                    ['xclip', '-selection', 'clipboard'],
-                    input=b'',
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                sys.exit(0)
-        except Exception:
-            pass
-    
-    @staticmethod
-    def _schedule_clear_wayland(seconds: int) -> None:
-        """Schedule clipboard clear for Wayland"""
-        try:
-            if os.fork() == 0:
-                time.sleep(seconds)
-                subprocess.run(
-                    ['wl-copy', '--clear'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                sys.exit(0)
-        except Exception:
-            pass
-    
-    @staticmethod
-    def _schedule_clear_macos(seconds: int) -> None:
-        """Schedule clipboard clear for macOS"""
-        try:
-            if os.fork() == 0:
-                time.sleep(seconds)
-                subprocess.run(
-                    ['pbcopy'],
-                    input=b'',
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                sys.exit(0)
-        except Exception:
-            pass
-    
-    @staticmethod
-    def _schedule_clear_generic(seconds: int) -> None:
-        """Schedule clipboard clear using pyperclip"""
+    def _schedule_clear(seconds: int, clear_command: Optional[list] = None) -> None:
+        """
+        Clear the clipboard after a delay from a detached helper process
+        
+        A fresh interpreter in its own session outlives this one without
+        forking (and copying) the current process. With no clear command the
+        helper clears the clipboard through pyperclip.
+        """
         try:
-            if os.fork() == 0:
-                time.sleep(seconds)
-                try:
-                    import pyperclip
-                    pyperclip.copy('')
-                except ImportError:
-                    pass
-                sys.exit(0)
+            subprocess.Popen(
+                [sys.executable, '-c', _CLEAR_SCRIPT, str(seconds)] + (clear_command or []),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
         except Exception:
             pass
     
@@ -5,8 +5,44 @@ Configuration management for LastPass CLI
 import os
 import json
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+# orjson parses and serializes noticeably faster when installed; json is the
+# fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Environment lookups are memoized on the raw values they depend on, so a
+# changed variable is picked up on the next call rather than going stale
+
+@lru_cache(maxsize=8)
+def _resolve_config_dir(lpass_home: Optional[str], xdg_config_home: Optional[str],
+                        home: Optional[str]) -> Path:
+    """Resolve the configuration directory (home only keys Path.home())"""
+    # Check LPASS_HOME first (overrides everything)
+    if lpass_home:
+        return Path(lpass_home)
+    
+    # Use XDG_CONFIG_HOME or default
+    if xdg_config_home is not None:
+        config_home = Path(xdg_config_home)
+    else:
+        config_home = Path.home() / ".config"
+    return config_home / "lpass"
+
+
+@lru_cache(maxsize=32)
+def _parse_int(value: str, default: int) -> int:
+    """Parse an integer setting, falling back to default when malformed"""
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
 
 class Config:
     """Configuration file manager"""
@@ -17,21 +53,25 @@ class Config:
         self.config_dir = config_dir
         self.config_file = config_dir / "config.json"
         self._config: Optional[Dict[str, Any]] = None
+        # Alias file contents by command, filled lazily (None = not read yet)
+        self._alias_files: Optional[Dict[str, Optional[str]]] = None
+        # Stored plaintext key, kept after the first read; a bytearray so it
+        # can be wiped when the key is deleted
+        self._plaintext_key: Optional[bytearray] = None
     
     @staticmethod
     def _get_config_dir() -> Path:
         """Get LastPass configuration directory"""
-        # Check LPASS_HOME first (overrides everything)
-        lpass_home = os.environ.get("LPASS_HOME")
-        if lpass_home:
-            return Path(lpass_home)
-        
-        # Use XDG_CONFIG_HOME or default
-        if "XDG_CONFIG_HOME" in os.environ:
-            config_home = Path(os.environ["XDG_CONFIG_HOME"])
-        else:
-            config_home = Path.home() / ".config"
-        return config_home / "lpass"
+        environ = os.environ
+        return _resolve_config_dir(environ.get("LPASS_HOME"),
+                                   environ.get("XDG_CONFIG_HOME"),
+                                   environ.get("HOME"))
+    
+    @staticmethod
+    def reset_env_cache() -> None:
+        """Forget memoized environment lookups (for tests that patch Path.home)"""
+        _resolve_config_dir.cache_clear()
+        _parse_int.cache_clear()
     
     def _load(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -43,8 +83,13 @@ class Config:
             return self._config
         
         try:
-            with open(self.config_file, 'r') as f:
-                self._config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            
+            if orjson is not None:
+                self._config = orjson.loads(data)
+            else:
+                self._config = json.loads(data)
         except Exception:
             self._config = {}
         
@@ -54,8 +99,13 @@ class Config:
         """Save configuration to file"""
         self.config_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
         
-        with open(self.config_file, 'w') as f:
-            json.dump(self._config or {}, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(self._config or {}, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self._config or {}, indent=2).encode('utf-8')
+        
+        with open(self.config_file, 'wb') as f:
+            f.write(data)
         
         os.chmod(self.config_file, 0o600)
     
@@ -84,10 +134,12 @@ class Config:
     def set_alias(self, alias: str, command: str) -> None:
         """Set command alias"""
         self.set(f"alias.{alias}", command)
+        self._alias_files = None
     
     def delete_alias(self, alias: str) -> None:
         """Delete command alias"""
         self.delete(f"alias.{alias}")
+        self._alias_files = None
     
     def expand_alias(self, args: list) -> list:
         """
@@ -103,17 +155,21 @@ class Config:
         command = args[0]
         
         # First try to load from alias file
-        alias_file = self.config_dir / f"alias.{command}"
-        if alias_file.exists():
-            try:
-                with open(alias_file, 'r') as f:
-                    alias_value = f.read().strip()
-                    if alias_value:
-                        # Split alias value and prepend to remaining args
-                        expanded = alias_value.split()
-                        return expanded + args[1:]
-            except Exception:
-                pass  # Fall through to check config
+        alias_files = self._get_alias_files()
+        if command in alias_files:
+            alias_value = alias_files[command]
+            if alias_value is None:
+                try:
+                    with open(self.config_dir / f"alias.{command}", 'r') as f:
+                        alias_value = f.read().strip()
+                except Exception:
+                    alias_value = ""  # Fall through to check config
+                alias_files[command] = alias_value
+            
+            if alias_value:
+                # Split alias value and prepend to remaining args
+                expanded = alias_value.split()
+                return expanded + args[1:]
         
         # Then try config.json
         alias_value = self.get_alias(command)
@@ -124,26 +180,46 @@ class Config:
         
         return args
     
+    def _get_alias_files(self) -> Dict[str, Optional[str]]:
+        """
+        Get the commands that have an alias file in the config directory
+        
+        The directory is scanned once per instance rather than checked with a
+        stat per lookup; file contents are read on first use. Writes through
+        write_buffer/unlink and alias changes reset the cache.
+        """
+        if self._alias_files is None:
+            self._alias_files = {}
+            try:
+                with os.scandir(self.config_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("alias.") and entry.is_file():
+                            self._alias_files[entry.name[len("alias."):]] = None
+            except OSError:
+                pass
+        
+        return self._alias_files
+    
     def write_buffer(self, key: str, data: bytes) -> None:
         """Write binary buffer to config file"""
         file_path = self.config_dir / key
         self.config_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
         
-        with open(file_path, 'wb') as f:
+        # Create new files private from the start; the chmod still tightens
+        # a file that already existed with a looser mode
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(file_path, flags, 0o600)
+        with open(fd, 'wb') as f:
             f.write(data)
         
         os.chmod(file_path, 0o600)
+        self._alias_files = None
     
     def read_buffer(self, key: str) -> Optional[bytes]:
         """Read binary buffer from config file"""
-        file_path = self.config_dir / key
-        
-        if not file_path.exists():
-            return None
-        
+        # A missing file is just another failed read, so skip the exists() stat
         try:
-            with open(file_path, 'rb') as f:
-                return f.read()
+            return (self.config_dir / key).read_bytes()
         except Exception:
             return None
     
@@ -152,31 +228,43 @@ class Config:
         file_path = self.config_dir / key
         if file_path.exists():
             file_path.unlink()
+        self._alias_files = None
     
     def has_plaintext_key(self) -> bool:
         """Check if plaintext key is stored"""
-        return (self.config_dir / "plaintext_key").exists()
+        return self._plaintext_key is not None or (self.config_dir / "plaintext_key").exists()
     
     def get_plaintext_key(self) -> Optional[bytes]:
-        """Get stored plaintext key"""
-        return self.read_buffer("plaintext_key")
+        """Get stored plaintext key (read from disk once per instance)"""
+        if self._plaintext_key is None:
+            key = self.read_buffer("plaintext_key")
+            if key is None:
+                return None
+            self._plaintext_key = bytearray(key)
+        
+        return bytes(self._plaintext_key)
     
     def set_plaintext_key(self, key: bytes) -> None:
         """Store plaintext key (WARNING: less secure)"""
         self.write_buffer("plaintext_key", key)
+        self._forget_plaintext_key()
+        self._plaintext_key = bytearray(key)
     
     def delete_plaintext_key(self) -> None:
         """Delete stored plaintext key"""
         self.unlink("plaintext_key")
+        self._forget_plaintext_key()
+    
+    def _forget_plaintext_key(self) -> None:
+        """Wipe and drop the in-memory copy of the plaintext key"""
+        if self._plaintext_key is not None:
+            self._plaintext_key[:] = bytes(len(self._plaintext_key))
+            self._plaintext_key = None
     
     @staticmethod
     def get_auto_sync_time() -> int:
         """Get auto-sync time in seconds (0 = disabled)"""
-        sync_time = os.environ.get("LPASS_AUTO_SYNC_TIME", "0")
-        try:
-            return int(sync_time)
-        except ValueError:
-            return 0
+        return _parse_int(os.environ.get("LPASS_AUTO_SYNC_TIME", "0"), 0)
     
     @staticmethod
     def get_clipboard_command() -> Optional[str]:
@@ -191,11 +279,7 @@ class Config:
     @staticmethod
     def get_agent_timeout() -> int:
         """Get agent timeout in seconds (0 = never expire)"""
-        timeout = os.environ.get("LPASS_AGENT_TIMEOUT", "3600")
-        try:
-            return int(timeout)
-        except ValueError:
-            return 3600
+        return _parse_int(os.environ.get("LPASS_AGENT_TIMEOUT", "3600"), 3600)
     
     @staticmethod
     def get_log_level() -> str:
@@ -4,21 +4,24 @@ CSV import/export utilities for LastPass
 
 import csv
 import io
-from typing import List, Dict, Any, Optional, TextIO
+import operator
+from typing import List, Dict, Any, Callable, FrozenSet, Iterable, Iterator, Optional, TextIO
 from .models import Account, Field
 
 
 def escape_csv_value(value: str) -> str:
-    """Escape value for CSV output"""
+    """
+    Escape value for CSV output
+    Kept for callers quoting single values; export itself goes through csv.writer.
+    """
     if value is None:
         return ""
     
     value = str(value)
     
-    # Check if we need quoting
-    needs_quote = any(c in value for c in ['"', ',', '\n', '\r'])
-    
-    if needs_quote:
+    # Check if we need quoting; separate substring tests run in C, unlike
+    # an any() over a generator
+    if '"' in value or ',' in value or '\n' in value or '\r' in value:
         # Escape quotes by doubling them
         value = value.replace('"', '""')
         return f'"{value}"'
@@ -26,6 +29,83 @@ def escape_csv_value(value: str) -> str:
     return value
 
 
+DEFAULT_EXPORT_FIELDS = [
+    "url", "username", "password", "extra", "name", "grouping",
+    "fav", "id", "attachpresent", "last_touch", "last_modified"
+]
+
+
+# Standard export columns and how to read them from an account
+_EXPORT_GETTERS: Dict[str, Callable[[Account], Any]] = {
+    "url": operator.attrgetter("url"),
+    "username": operator.attrgetter("username"),
+    "password": operator.attrgetter("password"),
+    "extra": operator.attrgetter("notes"),
+    "name": operator.attrgetter("name"),
+    "grouping": operator.attrgetter("group"),
+    "fav": lambda account: "1" if account.favorite else "0",
+    "id": operator.attrgetter("id"),
+    "attachpresent": lambda account: "1" if account.attach_present else "0",
+    "last_touch": operator.attrgetter("last_touch"),
+    "last_modified": operator.attrgetter("last_modified_gmt"),
+    "fullname": operator.attrgetter("fullname"),
+}
+
+
+def _iter_export_rows(accounts: Iterable[Account],
+                      fields: List[str]) -> Iterator[List[Any]]:
+    """Yield the CSV values of each account for the requested columns"""
+    # Resolve each column to its getter once rather than per account;
+    # columns without one are custom fields
+    columns = [(field_name, _EXPORT_GETTERS.get(field_name)) for field_name in fields]
+    has_custom = any(getter is None for _, getter in columns)
+    custom_values: Dict[str, Any] = {}
+    
+    for account in accounts:
+        if has_custom:
+            # Index the account's custom fields once instead of scanning
+            # them per column; the first field with a name wins, as in get_field
+            custom_values = {}
+            for custom_field in account.fields:
+                custom_values.setdefault(custom_field.name, custom_field.value)
+        
+        yield [getter(account) if getter else custom_values.get(field_name, "")
+               for field_name, getter in columns]
+
+
+def iter_export_accounts_to_csv(accounts: Iterable[Account],
+                                fields: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    Export accounts to CSV format one line at a time
+    
+    Args:
+        accounts: Accounts to export
+        fields: List of field names to include (default: all)
+    
+    Yields:
+        The header line, then one CSV line per account
+    """
+    # Default fields to export
+    if fields is None:
+        fields = DEFAULT_EXPORT_FIELDS
+    
+    # Reuse one small buffer so only a single row is held in memory
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    
+    def emit(row: List[Any]) -> str:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow(row)
+        return buffer.getvalue()
+    
+    # Header
+    yield emit(fields)
+    
+    for row in _iter_export_rows(accounts, fields):
+        yield emit(row)
+
+
 def export_accounts_to_csv(accounts: List[Account], 
                            fields: Optional[List[str]] = None,
                            output: Optional[TextIO] = None) -> str:
@@ -35,17 +115,14 @@ def export_accounts_to_csv(accounts: List[Account],
     Args:
         accounts: List of accounts to export
         fields: List of field names to include (default: all)
-        output: Optional file object to write to
+        output: Optional file object to write to; rows are streamed into it
     
     Returns:
         CSV string if output is None
     """
     # Default fields to export
     if fields is None:
-        fields = [
-            "url", "username", "password", "extra", "name", "grouping", 
-            "fav", "id", "attachpresent", "last_touch", "last_modified"
-        ]
+        fields = DEFAULT_EXPORT_FIELDS
     
     # Create string buffer if no output file
     if output is None:
@@ -56,46 +133,9 @@ def export_accounts_to_csv(accounts: List[Account],
     
     writer = csv.writer(output, lineterminator='\r\n')
     
-    # Write header
+    # Write header, then let the csv module consume the row generator
     writer.writerow(fields)
-    
-    # Write accounts
-    for account in accounts:
-        row = []
-        for field_name in fields:
-            if field_name == "url":
-                row.append(account.url)
-            elif field_name == "username":
-                row.append(account.username)
-            elif field_name == "password":
-                row.append(account.password)
-            elif field_name == "extra":
-                row.append(account.notes)
-            elif field_name == "name":
-                row.append(account.name)
-            elif field_name == "grouping":
-                row.append(account.group)
-            elif field_name == "fav":
-                row.append("1" if account.favorite else "0")
-            elif field_name == "id":
-                row.append(account.id)
-            elif field_name == "attachpresent":
-                row.append("1" if account.attach_present else "0")
-            elif field_name == "last_touch":
-                row.append(account.last_touch)
-            elif field_name == "last_modified":
-                row.append(account.last_modified_gmt)
-            elif field_name == "fullname":
-                row.append(account.fullname)
-            else:
-                # Check custom fields
-                custom_field = account.get_field(field_name)
-                if custom_field:
-                    row.append(custom_field.value)
-                else:
-                    row.append("")
-        
-        writer.writerow(row)
+    writer.writerows(_iter_export_rows(accounts, fields))
     
     if return_string:
         return output.getvalue()
@@ -103,6 +143,13 @@ def export_accounts_to_csv(accounts: List[Account],
     return ""
 
 
+# Columns that map to account attributes; anything else imports as a custom field
+_STANDARD_IMPORT_FIELDS: FrozenSet[str] = frozenset({
+    "url", "username", "password", "extra", "name", "grouping",
+    "fav", "id", "attachpresent", "last_touch", "last_modified", "fullname"
+})
+
+
 def import_accounts_from_csv(csv_data: str, 
                              keep_duplicates: bool = False) -> List[Dict[str, Any]]:
     """
@@ -119,6 +166,10 @@ def import_accounts_from_csv(csv_data: str,
     accounts = []
     seen_names = set()
     
+    # Work out the custom field columns once from the header
+    custom_columns = [key for key in dict.fromkeys(reader.fieldnames or [])
+                      if key not in _STANDARD_IMPORT_FIELDS]
+    
     for row in reader:
         # Extract account data from CSV row
         name = row.get("name", "")
@@ -130,8 +181,9 @@ def import_accounts_from_csv(csv_data: str,
         
         # Skip if duplicate and not keeping duplicates
         if not keep_duplicates:
-            # Create unique identifier from name and username
-            identifier = f"{group}/{name}:{username}"
+            # Identify entries by group, name and username; a tuple avoids
+            # building a joined string per row
+            identifier = (group, name, username)
             if identifier in seen_names:
                 continue
             seen_names.add(identifier)
@@ -151,14 +203,10 @@ def import_accounts_from_csv(csv_data: str,
             account_data["favorite"] = row["fav"] == "1"
         
         # Extract custom fields (any column not in standard fields)
-        standard_fields = {
-            "url", "username", "password", "extra", "name", "grouping",
-            "fav", "id", "attachpresent", "last_touch", "last_modified", "fullname"
-        }
-        
         custom_fields = {}
-        for key, value in row.items():
-            if key not in standard_fields and value:
+        for key in custom_columns:
+            value = row[key]
+            if value:
                 custom_fields[key] = value
         
         if custom_fields:
@@ -2,16 +2,62 @@
 External editor integration for multi-line editing
 """
 
+import io
 import os
+import re
+import shutil
 import subprocess
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+
+# Template labels of the standard account fields and their result keys;
+# any other label is a custom field
+_FIELD_MAP = {
+    'Name': 'name',
+    'URL': 'url',
+    'Username': 'username',
+    'Password': 'password',
+}
+
+# A '#' comment line of edit_field output, with its line ending
+_COMMENT_LINE = re.compile(r'^#[^\n]*\n?', re.MULTILINE)
+
+
+# RAM-backed tmpfs used for edit files when no directory is configured
+_TMPFS_DIR = '/dev/shm'
+
+
+@lru_cache(maxsize=8)
+def _resolve_tmpdir(tmpdir: Optional[str], use_tmpfs: Optional[str] = None) -> Path:
+    """
+    Resolve the editor's fallback temporary directory from the environment
+    
+    Keyed on the variables, so a changed one is picked up on the next call
+    while repeated edits skip the tmpfs probe. SECURE_TMPDIR is checked by
+    the caller on every call, since it may be created or removed at runtime.
+    """
+    # An explicit TMPDIR wins
+    if tmpdir is not None:
+        return Path(tmpdir)
+    
+    # Otherwise prefer tmpfs, so the plaintext being edited stays in RAM
+    # instead of reaching the disk (LPASS_USE_TMPFS=0 turns this off)
+    if (use_tmpfs != '0' and os.path.isdir(_TMPFS_DIR)
+            and os.access(_TMPFS_DIR, os.W_OK | os.X_OK)):
+        return Path(_TMPFS_DIR)
+    
+    return Path('/tmp')
 
 
 class Editor:
     """External editor integration"""
     
+    # Fallback editor found on PATH, as (PATH it was found on, editor)
+    _default_editor: Optional[Tuple[Optional[str], str]] = None
+    
     @staticmethod
     def _get_editor() -> str:
         """Get editor command"""
@@ -21,28 +67,29 @@ class Editor:
             if editor:
                 return editor
         
-        # Default editors
-        for editor in ['vi', 'vim', 'nano', 'emacs']:
-            if subprocess.run(['which', editor], 
-                            capture_output=True, 
-                            check=False).returncode == 0:
-                return editor
+        # Default editors; the PATH scan is repeated only if PATH changes
+        path = os.environ.get('PATH')
+        cached = Editor._default_editor
+        if cached is None or cached[0] != path:
+            editor = next(
+                (editor for editor in ['vi', 'vim', 'nano', 'emacs'] if shutil.which(editor)),
+                'vi'
+            )
+            cached = Editor._default_editor = (path, editor)
         
-        return 'vi'
+        return cached[1]
     
     @staticmethod
     def _get_secure_tmpdir() -> Path:
         """Get secure temporary directory"""
+        environ = os.environ
+        
         # Check for secure tmpdir first
-        secure_tmpdir = os.environ.get('SECURE_TMPDIR')
-        if secure_tmpdir:
-            tmpdir = Path(secure_tmpdir)
-            if tmpdir.exists():
-                return tmpdir
-        
-        # Fall back to TMPDIR or /tmp
-        tmpdir_env = os.environ.get('TMPDIR', '/tmp')
-        return Path(tmpdir_env)
+        secure_tmpdir = environ.get('SECURE_TMPDIR')
+        if secure_tmpdir and os.path.isdir(secure_tmpdir):
+            return Path(secure_tmpdir)
+        
+        return _resolve_tmpdir(environ.get('TMPDIR'), environ.get('LPASS_USE_TMPFS'))
     
     @staticmethod
     def edit_text(initial_text: str = "", 
@@ -61,7 +108,9 @@ class Editor:
         """
         tmpdir = Editor._get_secure_tmpdir()
         
-        # Create secure temporary file
+        # Create secure temporary file; mkstemp already makes it readable and
+        # writable by the owner only, and its descriptor is not inherited by
+        # the editor
         fd, tmppath = tempfile.mkstemp(
             prefix=prefix,
             suffix=suffix,
@@ -70,9 +119,6 @@ class Editor:
         )
         
         try:
-            # Set secure permissions
-            os.chmod(tmppath, 0o600)
-            
             # Write initial content
             with os.fdopen(fd, 'w') as f:
                 f.write(initial_text)
@@ -89,7 +135,8 @@ class Editor:
             if result.returncode != 0:
                 return None
             
-            # Read edited content
+            # Read edited content by path: editors that save by writing a new
+            # file and renaming it over this one leave the old descriptor stale
             with open(tmppath, 'r') as f:
                 edited_text = f.read()
             
@@ -131,13 +178,12 @@ class Editor:
         if edited is None:
             return None
         
-        # Remove header and comment lines
-        lines = []
-        for line in edited.splitlines():
-            if not line.startswith('#'):
-                lines.append(line)
+        # Remove header and comment lines in one regex pass; edit_text reads
+        # with universal newlines, so lines only ever end in '\n'
+        edited = _COMMENT_LINE.sub('', edited)
         
-        return '\n'.join(lines)
+        # Drop the final line ending, as joining the lines back would
+        return edited[:-1] if edited.endswith('\n') else edited
     
     @staticmethod
     def edit_account_template(account_data: dict) -> Optional[dict]:
@@ -150,36 +196,32 @@ class Editor:
         Returns:
             Dict with edited account data or None if cancelled
         """
-        # Create template
-        lines = []
-        
-        # Required fields
-        lines.append(f"Name: {account_data.get('name', '')}")
-        
-        # Check if it's a secure note (has NoteType field)
-        is_secure_note = any(
-            f.get('name') == 'NoteType' 
-            for f in account_data.get('fields', [])
-        )
-        
-        if not is_secure_note:
-            # Standard account fields
-            lines.append(f"URL: {account_data.get('url', '')}")
-            lines.append(f"Username: {account_data.get('username', '')}")
-            lines.append(f"Password: {account_data.get('password', '')}")
-        
-        # Additional fields
-        for field in account_data.get('fields', []):
+        # One pass over the fields both detects a secure note (has NoteType
+        # field) and collects the additional field lines
+        is_secure_note = False
+        field_lines = []
+        for field in account_data.get('fields', ()):
             field_name = field.get('name', '')
-            field_value = field.get('value', '')
-            if field_name and field_name != 'NoteType':
-                lines.append(f"{field_name}: {field_value}")
-        
-        # Notes section
-        lines.append("Notes:    # Add notes below this line.")
-        lines.append(account_data.get('notes', ''))
-        
-        template = '\n'.join(lines)
+            if field_name == 'NoteType':
+                is_secure_note = True
+            elif field_name:
+                field_lines.append(f"{field_name}: {field.get('value', '')}\n")
+        
+        # Standard account fields, left out of secure notes
+        if is_secure_note:
+            standard_lines = ""
+        else:
+            standard_lines = (f"URL: {account_data.get('url', '')}\n"
+                              f"Username: {account_data.get('username', '')}\n"
+                              f"Password: {account_data.get('password', '')}\n")
+        
+        # Create template in one piece: name, standard fields, additional
+        # fields, then the notes section
+        template = (f"Name: {account_data.get('name', '')}\n"
+                    f"{standard_lines}"
+                    f"{''.join(field_lines)}"
+                    f"Notes:    # Add notes below this line.\n"
+                    f"{account_data.get('notes', '')}")
         
         # Edit in external editor
         edited = Editor.edit_text(
@@ -215,13 +257,30 @@ class Editor:
             'fields': []
         }
         
-        lines = content.splitlines()
+        def flush(field_name: str, field_lines: List[str]) -> None:
+            value = '\n'.join(field_lines)
+            key = _FIELD_MAP.get(field_name)
+            if key:
+                result[key] = value
+            else:
+                # Custom field
+                result['fields'].append({
+                    'name': field_name,
+                    'value': value,
+                    'type': 'text'
+                })
+        
         current_field = None
         current_value = []
         in_notes = False
         notes_lines = []
         
-        for line in lines:
+        # Stream the lines rather than splitting the whole content into a
+        # list up front; newline=None reads '\r\n' and '\r' endings as '\n'
+        for line in io.StringIO(content, newline=None):
+            if line.endswith('\n'):
+                line = line[:-1]
+            
             # Skip comment lines in notes
             if in_notes:
                 if not line.strip().startswith('#'):
@@ -229,29 +288,14 @@ class Editor:
                 continue
             
             # Check for field: value format
-            if ':' in line:
-                colon_idx = line.index(':')
-                field_name = line[:colon_idx].strip()
-                field_value = line[colon_idx + 1:].strip()
+            field_name, colon, field_value = line.partition(':')
+            if colon:
+                field_name = field_name.strip()
+                field_value = field_value.strip()
                 
                 # Save previous field if any
                 if current_field:
-                    value = '\n'.join(current_value)
-                    if current_field == 'Name':
-                        result['name'] = value
-                    elif current_field == 'URL':
-                        result['url'] = value
-                    elif current_field == 'Username':
-                        result['username'] = value
-                    elif current_field == 'Password':
-                        result['password'] = value
-                    else:
-                        # Custom field
-                        result['fields'].append({
-                            'name': current_field,
-                            'value': value,
-                            'type': 'text'
-                        })
+                    flush(current_field, current_value)
                 
                 # Start new field
                 if field_name == 'Notes':
@@ -271,21 +315,7 @@ class Editor:
         
         # Save last field
         if current_field and not in_notes:
-            value = '\n'.join(current_value)
-            if current_field == 'Name':
-                result['name'] = value
-            elif current_field == 'URL':
-                result['url'] = value
-            elif current_field == 'Username':
-                result['username'] = value
-            elif current_field == 'Password':
-                result['password'] = value
-            else:
-                result['fields'].append({
-                    'name': current_field,
-                    'value': value,
-                    'type': 'text'
-                })
+            flush(current_field, current_value)
         
         # Save notes
         result['notes'] = '\n'.join(notes_lines)
@@ -20,11 +20,15 @@ Special modifiers:
   %% - literal percent sign
 """
 
-from typing import Optional, Tuple
-from datetime import datetime
+import operator
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 from .models import Account
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp: Optional[str], utc: bool = True) -> str:
     """
     Format a timestamp string to human-readable format
@@ -35,6 +39,8 @@ def format_timestamp(timestamp: Optional[str], utc: bool = True) -> str:
     
     Returns:
         Formatted timestamp string (YYYY-MM-DD HH:MM) or empty string
+    
+    Results are memoized, as listings repeat the same timestamps many times.
     """
     if not timestamp:
         return ""
@@ -44,9 +50,9 @@ def format_timestamp(timestamp: Optional[str], utc: bool = True) -> str:
         if ts == 0:
             return ""
         
-        dt = datetime.utcfromtimestamp(ts) if utc else datetime.fromtimestamp(ts)
+        dt = datetime.fromtimestamp(ts, timezone.utc) if utc else datetime.fromtimestamp(ts)
         return dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, OSError):
+    except (ValueError, OSError, OverflowError):
         return ""
 
 
@@ -66,6 +72,37 @@ def get_display_fullname(account: Account) -> str:
         return f"(none)/{account.fullname}"
 
 
+# Account format codes and how to read each value from an account; a None
+# value formats as empty
+_ACCOUNT_GETTERS: Dict[str, Callable[[Account], Optional[str]]] = {
+    # account id
+    'i': operator.attrgetter('id'),
+    # account name (shortname)
+    'n': operator.attrgetter('name'),
+    # account fullname (with path)
+    'N': get_display_fullname,
+    # account username
+    'u': operator.attrgetter('username'),
+    # account password
+    'p': operator.attrgetter('password'),
+    # modification time
+    'm': lambda account: format_timestamp(account.last_modified_gmt, utc=True),
+    # last touch time
+    'U': lambda account: format_timestamp(account.last_touch, utc=False),
+    # share name
+    's': lambda account: account.share.name if account.share else "",
+    # group name
+    'g': operator.attrgetter('group'),
+    # URL
+    'l': operator.attrgetter('url'),
+}
+
+
+def _no_value(account: Account) -> str:
+    """Getter for unknown account codes, which format as empty"""
+    return ""
+
+
 def format_account_field(code: str, account: Account, add_slash: bool = False) -> str:
     """
     Format a single account field based on format code
@@ -78,38 +115,7 @@ def format_account_field(code: str, account: Account, add_slash: bool = False) -
     Returns:
         Formatted field value
     """
-    value = ""
-    
-    if code == 'i':
-        # account id
-        value = account.id or ""
-    elif code == 'n':
-        # account name (shortname)
-        value = account.name or ""
-    elif code == 'N':
-        # account fullname (with path)
-        value = get_display_fullname(account)
-    elif code == 'u':
-        # account username
-        value = account.username or ""
-    elif code == 'p':
-        # account password
-        value = account.password or ""
-    elif code == 'm':
-        # modification time
-        value = format_timestamp(getattr(account, 'last_modified', None), utc=True)
-    elif code == 'U':
-        # last touch time
-        value = format_timestamp(getattr(account, 'last_touch', None), utc=False)
-    elif code == 's':
-        # share name
-        value = account.share.name if account.share else ""
-    elif code == 'g':
-        # group name
-        value = account.group or ""
-    elif code == 'l':
-        # URL
-        value = account.url or ""
+    value = _ACCOUNT_GETTERS.get(code, _no_value)(account) or ""
     
     # Add trailing slash if requested and value is non-empty
     if value and add_slash:
@@ -182,91 +188,78 @@ def format_account(format_str: str, account: Account,
     Returns:
         Formatted string
     """
-    result = []
-    i = 0
+    return _render(_compile_format(format_str), account, field_name, field_value)
+
+
+# Plan step kinds: literal text, an account code (%a?, held as its resolved
+# getter) or a field code (%f?), the latter two also in a %/ form that
+# appends a slash to non-empty values
+_LITERAL, _ACCOUNT, _ACCOUNT_SLASH, _FIELD, _FIELD_SLASH = range(5)
+
+# One match per literal run or % directive: literal text, %%, or % with an
+# optional / modifier followed by a/f and its code letter, or any other char
+_FORMAT_TOKEN = re.compile(r'([^%]+)|%(%)|%(/?)(?:([af])(.)?|(.))?', re.DOTALL)
+
+
+@lru_cache(maxsize=64)
+def _compile_format(format_str: str) -> Tuple[Tuple[int, Any], ...]:
+    """
+    Parse a format string once into (kind, item) steps, the item being
+    literal text, an account getter or a field code
     
-    while i < len(format_str):
-        if format_str[i] != '%':
-            result.append(format_str[i])
-            i += 1
-            continue
-        
-        # Found %, check next character
-        if i + 1 >= len(format_str):
-            # Trailing %, just add it
-            result.append('%')
-            i += 1
-            continue
-        
-        next_char = format_str[i + 1]
-        
-        if next_char == '%':
+    Adjacent literal text is merged and account codes are resolved to their
+    getters, so rendering an account neither re-scans the format string nor
+    looks codes up again.
+    """
+    plan = []
+    
+    def literal(text: str) -> None:
+        if plan and plan[-1][0] == _LITERAL:
+            plan[-1] = (_LITERAL, plan[-1][1] + text)
+        else:
+            plan.append((_LITERAL, text))
+    
+    for text, percent, slash, kind, code, other in _FORMAT_TOKEN.findall(format_str):
+        if text:
+            literal(text)
+        elif percent:
             # %% -> literal %
-            result.append('%')
-            i += 2
+            literal('%')
+        elif kind and code:
+            # %a? account code or %f? field code
+            if kind == 'a':
+                plan.append((_ACCOUNT_SLASH if slash else _ACCOUNT,
+                             _ACCOUNT_GETTERS.get(code, _no_value)))
+            else:
+                plan.append((_FIELD_SLASH if slash else _FIELD, code))
+        else:
+            # Trailing % or %/, a code letter with no specifier, or an
+            # unknown code: all kept literally
+            literal('%' + slash + (kind or other))
+    
+    return tuple(plan)
+
+
+def _render(plan: Tuple[Tuple[int, Any], ...], account: Account,
+            field_name: Optional[str] = None, field_value: Optional[str] = None) -> str:
+    """Render a compiled format plan for one account"""
+    result = []
+    
+    for kind, item in plan:
+        if kind == _LITERAL:
+            result.append(item)
             continue
         
-        # Check for slash modifier
-        add_slash = False
-        if next_char == '/':
-            add_slash = True
-            i += 2
-            if i >= len(format_str):
-                # Trailing %/, just add it
-                result.append('%/')
-                break
-            next_char = format_str[i]
+        if kind == _ACCOUNT or kind == _ACCOUNT_SLASH:
+            value = item(account)
         else:
-            i += 1
-        
-        # Check for format code
-        if i >= len(format_str):
-            # No code after %, add the %
-            result.append('%')
-            if add_slash:
-                result.append('/')
-            break
-        
-        code_char = format_str[i]
-        i += 1
+            value = format_field_field(item, field_name, field_value)
         
-        # Check if it's an account format (a) or field format (f)
-        if code_char == 'a':
-            # Account field
-            if i >= len(format_str):
-                # No field specifier, add literal
-                result.append('%')
-                if add_slash:
-                    result.append('/')
-                result.append('a')
-                break
-            
-            field_code = format_str[i]
-            i += 1
-            value = format_account_field(field_code, account, add_slash)
+        # The %/ slash is appended as its own piece rather than concatenated
+        if value:
             result.append(value)
-        
-        elif code_char == 'f':
-            # Field name/value
-            if i >= len(format_str):
-                # No field specifier, add literal
-                result.append('%')
-                if add_slash:
-                    result.append('/')
-                result.append('f')
-                break
-            
-            field_code = format_str[i]
-            i += 1
-            value = format_field_field(field_code, field_name, field_value, add_slash)
-            result.append(value)
-        
-        else:
-            # Unknown format code, add it literally
-            result.append('%')
-            if add_slash:
+            if kind == _ACCOUNT_SLASH or kind == _FIELD_SLASH:
                 result.append('/')
-            result.append(code_char)
     
     return ''.join(result)
 
@@ -282,4 +275,5 @@ def format_accounts(format_str: str, accounts: list) -> list:
     Returns:
         List of formatted strings
     """
-    return [format_account(format_str, account) for account in accounts]
+    plan = _compile_format(format_str)
+    return [_render(plan, account) for account in accounts]
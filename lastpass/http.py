@@ -2,32 +2,256 @@
 HTTP communication with LastPass servers
 """
 
+import atexit
+import gzip
+import json
+import mimetypes
+import os
+import queue
+import re
 import requests
+import threading
 import time
-from typing import Optional, Dict, Any, List, Tuple
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, BinaryIO, List, Tuple
 from urllib.parse import urlencode
+from xml.sax.saxutils import escape
 from .exceptions import NetworkException, LoginFailedException
 from .session import Session
 
+# pybase64 encodes large attachments with SIMD when installed; base64 is the
+# fallback
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+
+# Concurrent requests used by post_batch
+BATCH_WORKERS = 8
+
+# Kept-alive connections pooled for the server: room for a full set of bulk
+# workers on top of the foreground requests, so none is dropped and reopened
+POOL_MAXSIZE = 16
+
+# Seconds to wait for a connection to the server, and for each read once
+# connected; an unreachable server fails fast while slow responses have room
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+
+# Form bodies larger than this are gzipped when compression is requested;
+# smaller ones gain too little to be worth it
+GZIP_MIN_SIZE = 16 * 1024
+
+# Endpoints the client posts to, whose full URLs are built once per client
+_ENDPOINTS = ("iterations.php", "login.php", "logout.php", "getaccts.php", "update.php",
+              "getattach.php", "show_website.php", "share.php", "lastpass/api.php")
+
+# Content type of the pre-encoded form bodies post() sends
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_GZIP_FORM_HEADERS = {**_FORM_HEADERS, "Content-Encoding": "gzip"}
+
+# Bytes read per piece when streaming a response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Default client-side rate limit on requests: bursts of up to
+# RATE_LIMIT_BURST are sent at once, after which requests are paced to
+# RATE_LIMIT_PER_SECOND. The limit is shared by every thread using a client,
+# so past the burst it, not the worker count, bounds the throughput of the
+# concurrent bulk operations (post_batch, bulk imports, share-user changes):
+# raise it or pass rate_per_second=None to HTTPClient for faster bulk work
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_PER_SECOND = 5.0
+
+# Account fields sent by batch_upload_accounts, in element order
+_UPLOAD_ACCOUNT_FIELDS = ("name", "username", "password", "url", "notes", "group")
+
+# Access log entries waiting to be sent; more are dropped, as logging is
+# fire and forget anyway
+LOG_QUEUE_SIZE = 1024
+
+# Seconds close() (and interpreter exit) waits for queued access logs to be
+# sent before dropping the rest, so an unreachable server cannot hang exit
+LOG_FLUSH_TIMEOUT = 5.0
+
+# Queued in place of an entry to stop the access log sender
+_LOG_STOP = None
+
+# Account ID in an add_account response: {"aid":"account_id",...}
+_AID_RE = re.compile(rb'"aid"\s*:\s*"([^"]*)"')
+
+# Share ID in a create_share response: <ok sharingid="123456" />, or an id
+# key in JSON that json itself could not read
+_SHARING_ID_RE = re.compile(rb'sharingid="(\d+)"')
+_SHARE_JSON_ID_RE = re.compile(rb'["\']id["\']\s*:\s*["\'](\w+)["\']')
+
+# <user .../> elements of a get_share_users XML response, their attributes,
+# and the attributes that are boolean flags
+_SHARE_USER_RE = re.compile(rb'<user\s+([^>]+)/>')
+_XML_ATTR_RE = re.compile(rb'(\w+)="([^"]*)"')
+_SHARE_USER_FLAGS = frozenset({'readonly', 'give', 'canadminister'})
+
+
+def _file_suffixes(filename: str) -> str:
+    """Get a file name's extensions, e.g. '.tar.gz', ignoring leading dots"""
+    name = os.path.basename(filename).lstrip('.')
+    dot = name.find('.')
+    return name[dot:] if dot >= 0 else ''
+
+
+@lru_cache(maxsize=256)
+def _guess_mimetype(suffixes: str) -> str:
+    """
+    Guess the MIME type of files with the given extensions
+    
+    Only the extensions decide the type, so uploads share one lookup per
+    kind of file.
+    """
+    mimetype, _ = mimetypes.guess_type("attachment" + suffixes)
+    return mimetype or "application/octet-stream"
+
+
+def _wait_for_queue(log_queue: queue.Queue, timeout: Optional[float]) -> bool:
+    """Wait for every task on log_queue to be done, for up to timeout seconds"""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with log_queue.all_tasks_done:
+        while log_queue.unfinished_tasks:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            log_queue.all_tasks_done.wait(remaining)
+    return True
+
 
 class HTTPClient:
     """HTTP client for LastPass API"""
     
-    def __init__(self, server: str = "lastpass.com"):
+    def __init__(self, server: str = "lastpass.com", connect_timeout: float = CONNECT_TIMEOUT,
+                 read_timeout: float = READ_TIMEOUT, compress_uploads: bool = False,
+                 rate_per_second: Optional[float] = RATE_LIMIT_PER_SECOND,
+                 rate_burst: int = RATE_LIMIT_BURST):
         self.server = server
         self.base_url = f"https://{server}"
+        self._urls = {endpoint: f"{self.base_url}/{endpoint}" for endpoint in _ENDPOINTS}
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # Opt-in, as not every server accepts gzipped request bodies
+        self.compress_uploads = compress_uploads
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "lpass-cli/1.0.0",
         })
+        
+        # All requests go to the one server; retries are handled by post()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                pool_maxsize=POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        
+        # Token bucket pacing post(), turned off by rate_per_second=None; the
+        # rate is cut on every 429 and recovers gradually as requests succeed
+        self.rate_per_second = rate_per_second
+        self.rate_burst = rate_burst
+        self._rate = rate_per_second
+        self._tokens = float(rate_burst)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Background sender for log_access, started on first use
+        self._log_queue: Optional[queue.Queue] = None
+        self._log_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """
+        Send any queued access logs, then close the pooled connections
+        
+        Queued logs get up to LOG_FLUSH_TIMEOUT seconds; the sender thread
+        is stopped either way.
+        """
+        self._stop_log_worker()
+        self.session.close()
+    
+    def _acquire_token(self) -> None:
+        """
+        Wait until the rate limit admits another request
+        
+        A token is reserved under the lock, possibly driving the bucket
+        negative, so concurrent callers queue up behind each other while
+        sleeping outside it.
+        """
+        if self.rate_per_second is None:
+            return
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate_burst,
+                               self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+    
+    def _adjust_rate(self, throttled: bool) -> None:
+        """Halve the request rate on a 429, else creep back towards the limit"""
+        if self.rate_per_second is None:
+            return
+        
+        with self._rate_lock:
+            if throttled:
+                self._rate = max(self._rate / 2, 0.5)
+            elif self._rate < self.rate_per_second:
+                self._rate = min(self._rate + 0.1, self.rate_per_second)
     
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
-             session: Optional[Session] = None, max_retries: int = 3) -> Tuple[bytes, int]:
+             session: Optional[Session] = None, max_retries: int = 3,
+             read_timeout: Optional[float] = None, compress: bool = False,
+             rate_limit: bool = True) -> Tuple[bytes, int]:
         """
         POST request to LastPass
+        read_timeout overrides the client's read timeout for this request.
+        compress gzips bodies over GZIP_MIN_SIZE bytes (Content-Encoding: gzip).
+        rate_limit=False sends outside the rate limit, for background traffic
+        that must not use up the tokens of foreground requests.
         Returns: (response_body, status_code)
         """
-        url = f"{self.base_url}/{endpoint}"
+        response = self._post_response(endpoint, data, session, max_retries,
+                                       read_timeout=read_timeout, compress=compress,
+                                       rate_limit=rate_limit)
+        return response.content, response.status_code
+    
+    def post_to(self, endpoint: str, writer: BinaryIO, data: Optional[Dict[str, Any]] = None,
+                session: Optional[Session] = None, max_retries: int = 3,
+                read_timeout: Optional[float] = None) -> int:
+        """
+        POST request to LastPass, streaming a successful response body
+        
+        The body is copied to writer in STREAM_CHUNK_SIZE pieces as it
+        arrives, so it is never held in memory whole. Error responses are
+        not written.
+        Returns: status_code
+        """
+        with self._post_response(endpoint, data, session, max_retries,
+                                 stream=True, read_timeout=read_timeout) as response:
+            if response.status_code == 200:
+                try:
+                    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                        writer.write(chunk)
+                except requests.RequestException as e:
+                    raise NetworkException(f"HTTP request failed: {e}")
+            
+            return response.status_code
+    
+    def _post_response(self, endpoint: str, data: Optional[Dict[str, Any]],
+                       session: Optional[Session], max_retries: int,
+                       stream: bool = False,
+                       read_timeout: Optional[float] = None,
+                       compress: bool = False,
+                       rate_limit: bool = True) -> requests.Response:
+        """Send a POST with rate limiting and retries, returning the response"""
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
         
         if data is None:
             data = {}
@@ -37,19 +261,44 @@ class HTTPClient:
             data["token"] = session.token
             data["sessionid"] = session.sessionid
         
+        # Encode the form once up front, so retries resend it as is
+        body = urlencode([(key, value) for key, value in data.items() if value is not None],
+                         doseq=True)
+        headers = _FORM_HEADERS
+        
+        # Compress large bodies once as well, at the fastest level since
+        # the request is bound by the upload rather than the CPU
+        if compress and len(body) > GZIP_MIN_SIZE:
+            body = gzip.compress(body.encode('ascii'), compresslevel=1)
+            headers = _GZIP_FORM_HEADERS
+        
+        # Only streamed requests pass the flag, leaving the plain call as is
+        options = {"stream": True} if stream else {}
+        timeout = (self.connect_timeout,
+                   self.read_timeout if read_timeout is None else read_timeout)
+        
         # Retry logic for rate limiting and transient errors
         for attempt in range(max_retries):
+            if rate_limit:
+                self._acquire_token()
             try:
-                response = self.session.post(url, data=data, timeout=30)
+                response = self.session.post(url, data=body, headers=headers,
+                                             timeout=timeout, **options)
+                if rate_limit:
+                    self._adjust_rate(response.status_code == 429)
                 
                 # Handle rate limiting with exponential backoff
                 if response.status_code == 429:
                     if attempt < max_retries - 1:
+                        response.close()
                         wait_time = (2 ** attempt) * 2  # 2s, 4s, 8s
                         time.sleep(wait_time)
                         continue
                 
-                return response.content, response.status_code
+                if not stream:
+                    # Read the body here so read errors are retried too
+                    response.content
+                return response
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
                     time.sleep(1)  # Brief delay before retry
@@ -59,6 +308,39 @@ class HTTPClient:
         # Should not reach here, but just in case
         raise NetworkException(f"Failed after {max_retries} retries")
     
+    def post_batch(self, requests_data: List[Tuple[str, Dict[str, Any]]],
+                   session: Optional[Session] = None) -> List[Tuple[bytes, int]]:
+        """
+        POST several independent requests concurrently
+        
+        The requests share this client's connection pool across a few
+        threads, so N requests cost about N / BATCH_WORKERS round trips
+        instead of N, as far as the client's rate limit allows (past the
+        burst, rate_per_second caps the pace). Each request gets post()'s
+        retry handling.
+        Returns: (response_body, status_code) per request, in order
+        """
+        if len(requests_data) <= 1:
+            return [self.post(endpoint, data, session=session)
+                    for endpoint, data in requests_data]
+        
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(requests_data))) as pool:
+            return list(pool.map(lambda request: self.post(request[0], request[1], session=session),
+                                 requests_data))
+    
+    def _cmd_post(self, session: Session, data: Dict[str, Any], error: str) -> bytes:
+        """
+        POST a command to show_website.php, which most vault edits go
+        through, raising NetworkException prefixed with error on failure
+        Returns: response_body
+        """
+        content, status = self.post("show_website.php", data, session=session)
+        
+        if status != 200:
+            raise NetworkException(f"{error}: HTTP {status}")
+        
+        return content
+    
     def get_iterations(self, username: str) -> int:
         """Get PBKDF2 iteration count for a username"""
         try:
@@ -67,7 +349,8 @@ class HTTPClient:
             if status != 200:
                 raise NetworkException(f"Failed to get iterations: HTTP {status}")
             
-            iterations = int(content.decode('utf-8').strip())
+            # int() parses the ASCII digits straight from the bytes
+            iterations = int(content.strip())
             
             if iterations < 2:
                 raise NetworkException(f"Invalid iteration count: {iterations}")
@@ -124,6 +407,27 @@ class HTTPClient:
         
         return content
     
+    def download_blob_to(self, session: Session, writer: BinaryIO) -> None:
+        """
+        Download the encrypted account blob into a writable binary file
+        
+        Unlike download_blob, the vault is streamed rather than held in
+        memory, e.g. when saving it to disk.
+        """
+        data = {
+            "mobile": "1",
+            "requestsrc": "cli",
+            "hasplugin": "3.3.0",  # Version string for compatibility
+        }
+        
+        status = self.post_to("getaccts.php", writer, data, session=session)
+        
+        # Handle rate limiting with specific message
+        if status == 429:
+            raise NetworkException("Rate limited by LastPass (HTTP 429). Please wait a few minutes before retrying.")
+        elif status != 200:
+            raise NetworkException(f"Failed to download blob: HTTP {status}")
+    
     def get_blob_version(self, session: Session) -> int:
         """
         Get the current version number of the vault blob without downloading the full blob.
@@ -142,16 +446,18 @@ class HTTPClient:
         if status != 200:
             raise NetworkException(f"Failed to get blob version: HTTP {status}")
         
-        # Response should be a simple version number
-        try:
-            version = int(content.strip())
-            return version
-        except ValueError:
-            raise NetworkException(f"Invalid blob version response: {content.decode('utf-8', errors='ignore')}")
+        # Response should be a simple version number; only a short prefix is
+        # looked at, so an error page costs no more than a number would
+        head = content[:64].strip()
+        if len(content) > 64 or not head.isdigit():
+            raise NetworkException(f"Invalid blob version response: {head.decode('utf-8', errors='ignore')}")
+        
+        return int(head)
     
     def upload_blob(self, session: Session, blob_data: str) -> None:
-        """Upload encrypted vault blob"""
-        content, status = self.post("update.php", {"blob": blob_data}, session=session)
+        """Upload encrypted vault blob, gzipped if compress_uploads is set"""
+        content, status = self.post("update.php", {"blob": blob_data}, session=session,
+                                    compress=self.compress_uploads)
         
         if status != 200:
             raise NetworkException(f"Failed to upload blob: HTTP {status}")
@@ -171,6 +477,24 @@ class HTTPClient:
         
         return content
     
+    def get_attachments(self, session: Session, attachment_ids: List[str],
+                        share_id: Optional[str] = None) -> List[bytes]:
+        """Download several attachments of one account concurrently"""
+        requests_data = []
+        for attachment_id in attachment_ids:
+            data = {"getattach": attachment_id}
+            if share_id:
+                data["shareid"] = share_id
+            requests_data.append(("getattach.php", data))
+        
+        contents = []
+        for content, status in self.post_batch(requests_data, session=session):
+            if status != 200:
+                raise NetworkException(f"Failed to get attachment: HTTP {status}")
+            contents.append(content)
+        
+        return contents
+    
     def delete_account(self, session: Session, account_id: str, 
                       share_id: Optional[str] = None) -> None:
         """Delete an account from the vault"""
@@ -179,10 +503,21 @@ class HTTPClient:
         if share_id:
             data["sharedfolderid"] = share_id
         
-        content, status = self.post("show_website.php", data, session=session)
+        self._cmd_post(session, data, "Failed to delete account")
+    
+    def delete_accounts(self, session: Session,
+                        accounts: List[Tuple[str, Optional[str]]]) -> None:
+        """Delete several accounts, given as (account_id, share_id) pairs, concurrently"""
+        requests_data = []
+        for account_id, share_id in accounts:
+            data = {"extjs": "1", "delete": "1", "aid": account_id}
+            if share_id:
+                data["sharedfolderid"] = share_id
+            requests_data.append(("show_website.php", data))
         
-        if status != 200:
-            raise NetworkException(f"Failed to delete account: HTTP {status}")
+        for content, status in self.post_batch(requests_data, session=session):
+            if status != 200:
+                raise NetworkException(f"Failed to delete account: HTTP {status}")
     
     def add_account(self, session: Session, account_data: Dict[str, Any]) -> str:
         """Add a new account to the vault. Returns account ID."""
@@ -192,20 +527,11 @@ class HTTPClient:
             **account_data
         }
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to add account: HTTP {status}")
+        content = self._cmd_post(session, data, "Failed to add account")
         
-        # Parse response to get account ID
-        response = content.decode('utf-8', errors='ignore')
-        # Response format: {"aid":"account_id",...}
-        if '"aid":"' in response:
-            aid_start = response.find('"aid":"') + 7
-            aid_end = response.find('"', aid_start)
-            return response[aid_start:aid_end]
-        
-        return ""
+        # Parse response to get account ID, decoding only the ID itself
+        match = _AID_RE.search(content)
+        return match.group(1).decode('utf-8', errors='ignore') if match else ""
     
     def update_account(self, session: Session, account_id: str, 
                       account_data: Dict[str, Any]) -> None:
@@ -217,21 +543,13 @@ class HTTPClient:
             **account_data
         }
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to update account: HTTP {status}")
+        self._cmd_post(session, data, "Failed to update account")
     
     def upload_attachment(self, session: Session, account_id: str, filename: str,
                          file_data: bytes, share_id: Optional[str] = None) -> None:
         """Upload an attachment to an account"""
-        import base64
-        import mimetypes
-        
         # Determine MIME type
-        mimetype, _ = mimetypes.guess_type(filename)
-        if not mimetype:
-            mimetype = "application/octet-stream"
+        mimetype = _guess_mimetype(_file_suffixes(filename))
         
         # Base64 encode file data
         encoded_data = base64.b64encode(file_data).decode('ascii')
@@ -247,32 +565,95 @@ class HTTPClient:
         if share_id:
             data["sharedfolderid"] = share_id
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to upload attachment: HTTP {status}")
+        self._cmd_post(session, data, "Failed to upload attachment")
     
     def log_access(self, session: Session, account_id: str, url: str,
                    share_id: Optional[str] = None) -> None:
         """
         Log account access for audit trail.
         This is a fire-and-forget operation - failures are silently ignored.
+        
+        The request is queued for a background thread rather than sent
+        inline, so the caller does not wait a round trip per access; use
+        flush_logs() to wait for queued entries to go out.
         """
+        data = {
+            "cmd": "loglogin",
+            "aid": account_id,
+            "url": url,
+        }
+        
+        if share_id:
+            data["sharedfolderid"] = share_id
+        
         try:
-            data = {
-                "cmd": "loglogin",
-                "aid": account_id,
-                "url": url,
-            }
+            self._get_log_queue().put_nowait((data, session))
+        except queue.Full:
+            # Silently drop the entry, as a failed request would be
+            pass
+    
+    def flush_logs(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued access log has been sent
+        
+        Gives up after timeout seconds if one is given.
+        Returns: whether the queue was emptied
+        """
+        log_queue = self._log_queue
+        return log_queue is None or _wait_for_queue(log_queue, timeout)
+    
+    def _get_log_queue(self) -> queue.Queue:
+        """Get the access log queue, starting its sender thread on first use"""
+        with self._log_lock:
+            if self._log_queue is None:
+                self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+                threading.Thread(target=self._log_worker, args=(self._log_queue,),
+                                 daemon=True).start()
+                
+                # Entries still queued at exit get a bounded chance to go out
+                atexit.register(self._stop_log_worker)
             
-            if share_id:
-                data["sharedfolderid"] = share_id
+            return self._log_queue
+    
+    def _stop_log_worker(self) -> None:
+        """Flush queued access logs within LOG_FLUSH_TIMEOUT, then stop the sender"""
+        with self._log_lock:
+            log_queue, self._log_queue = self._log_queue, None
+        if log_queue is None:
+            return
+        
+        atexit.unregister(self._stop_log_worker)
+        
+        if not _wait_for_queue(log_queue, LOG_FLUSH_TIMEOUT):
+            # Drop what could not be sent in time, making room for the stop
+            try:
+                while True:
+                    log_queue.get_nowait()
+                    log_queue.task_done()
+            except queue.Empty:
+                pass
+        
+        log_queue.put(_LOG_STOP)
+    
+    def _log_worker(self, log_queue: queue.Queue) -> None:
+        """Send queued access logs one after another until told to stop"""
+        while True:
+            entry = log_queue.get()
+            if entry is _LOG_STOP:
+                log_queue.task_done()
+                return
             
-            # Fire and forget - don't care about response
-            self.post("show_website.php", data, session=session)
-        except Exception:
-            # Silently ignore logging failures
-            pass
+            data, session = entry
+            try:
+                # Fire and forget - don't care about response, retry or wait
+                # on the rate limit that foreground requests use
+                self.post("show_website.php", data, session=session, max_retries=1,
+                          rate_limit=False)
+            except Exception:
+                # Silently ignore logging failures
+                pass
+            finally:
+                log_queue.task_done()
     
     def get_share_limits(self, session: Session, share_id: str, 
                         user_id: str) -> Dict[str, Any]:
@@ -280,22 +661,18 @@ class HTTPClient:
         Get account access limits (whitelist/blacklist) for a user in a shared folder.
         Returns dict with 'whitelist' (bool) and 'account_ids' (List[str])
         """
-        import xml.etree.ElementTree as ET
-        
         data = {
             "cmd": "getshareacctswhitelist",
             "shareid": share_id,
             "uid": user_id,
         }
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to get share limits: HTTP {status}")
+        content = self._cmd_post(session, data, "Failed to get share limits")
         
         # Parse XML response
         try:
-            root = ET.fromstring(content.decode('utf-8'))
+            # The parser reads the bytes, and their declared encoding, itself
+            root = ET.fromstring(content)
             
             # Check for whitelist or blacklist
             whitelist_elem = root.find('whitelist')
@@ -320,13 +697,12 @@ class HTTPClient:
         """
         Set account access limits (whitelist/blacklist) for a user in a shared folder.
         """
-        # Build XML with account IDs
+        # Build XML with account IDs, escaped and joined in one go
+        aids = ''.join(f"<aid>{escape(aid)}</aid>" for aid in account_ids)
+        
         if whitelist:
             # Whitelist mode - hidebydefault=1 means hide all except listed
-            xml_content = "<accounts hidebydefault='1'>"
-            for aid in account_ids:
-                xml_content += f"<aid>{aid}</aid>"
-            xml_content += "</accounts>"
+            xml_content = f"<accounts hidebydefault='1'>{aids}</accounts>"
             
             data = {
                 "cmd": "setshareacctswhitelist",
@@ -336,10 +712,7 @@ class HTTPClient:
             }
         else:
             # Blacklist mode - hidebydefault=0 means show all except listed
-            xml_content = "<accounts hidebydefault='0'>"
-            for aid in account_ids:
-                xml_content += f"<aid>{aid}</aid>"
-            xml_content += "</accounts>"
+            xml_content = f"<accounts hidebydefault='0'>{aids}</accounts>"
             
             data = {
                 "cmd": "setshareacctsblacklist",
@@ -348,10 +721,7 @@ class HTTPClient:
                 "black": xml_content,
             }
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to set share limits: HTTP {status}")
+        self._cmd_post(session, data, "Failed to set share limits")
     
     def batch_upload_accounts(self, session: Session, 
                              accounts_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -359,28 +729,20 @@ class HTTPClient:
         Upload multiple accounts in a single batch operation.
         More efficient than individual account adds.
         """
-        # Build XML with all accounts
-        xml_content = "<accounts>"
+        # Build XML with all accounts as a tree, serialized (and escaped) once
+        root = ET.Element("accounts")
         for account in accounts_data:
-            xml_content += "<account>"
-            xml_content += f"<name>{account.get('name', '')}</name>"
-            xml_content += f"<username>{account.get('username', '')}</username>"
-            xml_content += f"<password>{account.get('password', '')}</password>"
-            xml_content += f"<url>{account.get('url', '')}</url>"
-            xml_content += f"<notes>{account.get('notes', '')}</notes>"
-            xml_content += f"<group>{account.get('group', '')}</group>"
-            xml_content += "</account>"
-        xml_content += "</accounts>"
+            element = ET.SubElement(root, "account")
+            for key in _UPLOAD_ACCOUNT_FIELDS:
+                ET.SubElement(element, key).text = account.get(key, '')
+        xml_content = ET.tostring(root, encoding="unicode")
         
         data = {
             "cmd": "uploadaccounts",
             "accounts": xml_content,
         }
         
-        content, status = self.post("show_website.php", data, session=session)
-        
-        if status != 200:
-            raise NetworkException(f"Failed to batch upload accounts: HTTP {status}")
+        self._cmd_post(session, data, "Failed to batch upload accounts")
         
         # Return empty dict for now - actual implementation would parse account IDs
         return {}
@@ -489,31 +851,21 @@ class HTTPClient:
         
         # Parse response to get share ID
         # Response can be JSON: {"id":"123456"} or XML: <ok sharingid="123456" />
-        response = content.decode('utf-8', errors='ignore')
         
-        # Try JSON first
-        import json
+        # Try JSON first (json reads the UTF-8 bytes itself)
         try:
-            data = json.loads(response)
+            data = json.loads(content)
             if "id" in data:
                 return data["id"]
-        except (json.JSONDecodeError, KeyError):
+        except (ValueError, KeyError):
             pass
         
-        # Try XML
-        if "sharingid" in response:
-            import re
-            match = re.search(r'sharingid="(\d+)"', response)
-            if match:
-                return match.group(1)
-        
-        # Try simple ID in JSON
-        if '"id":"' in response or "'id':'":
-            import re
-            match = re.search(r'["\']id["\']\s*:\s*["\'](\w+)["\']', response)
-            if match:
-                return match.group(1)
+        # Try XML, then a simple ID in loose JSON, on the raw bytes
+        match = _SHARING_ID_RE.search(content) or _SHARE_JSON_ID_RE.search(content)
+        if match:
+            return match.group(1).decode('ascii')
         
+        response = content.decode('utf-8', errors='ignore')
         raise NetworkException(f"Failed to parse share ID from response: {response}")
     
     def delete_share(self, session: Session, share_id: str) -> None:
@@ -558,35 +910,31 @@ class HTTPClient:
         if status != 200:
             raise NetworkException(f"Failed to get share users: HTTP {status}")
         
-        # Parse response - can be JSON or XML
-        response = content.decode('utf-8', errors='ignore')
+        # Parse response - can be JSON or XML, both read from the raw bytes
+        # so only the extracted values are decoded
         
-        # Try JSON first
-        import json
+        # Try JSON first (json reads the UTF-8 bytes itself)
         try:
-            result = json.loads(response)
+            result = json.loads(content)
             if isinstance(result, list):
                 return result
             elif isinstance(result, dict) and "users" in result:
                 return result["users"]
-        except (json.JSONDecodeError, KeyError):
+        except (ValueError, KeyError):
             pass
         
         # Try XML parsing
         users = []
-        import re
-        user_pattern = re.compile(r'<user\s+([^>]+)/>')
-        for match in user_pattern.finditer(response):
-            attrs = match.group(1)
+        for attrs in _SHARE_USER_RE.findall(content):
             user = {}
             
             # Extract attributes
-            for attr_match in re.finditer(r'(\w+)="([^"]*)"', attrs):
-                key, value = attr_match.groups()
-                if key in ['readonly', 'give', 'canadminister']:
-                    user[key] = value == '1' or value == 'on'
+            for key, value in _XML_ATTR_RE.findall(attrs):
+                key = key.decode('ascii')
+                if key in _SHARE_USER_FLAGS:
+                    user[key] = value == b'1' or value == b'on'
                 else:
-                    user[key] = value
+                    user[key] = value.decode('utf-8', errors='ignore')
             
             users.append(user)
         
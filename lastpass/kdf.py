@@ -41,6 +41,10 @@ def derive_keys(username: str, password: str, iterations: int) -> Tuple[str, byt
     Derive both login key and decryption key
     Returns: (login_key_hex, decryption_key_bytes)
     """
-    login_key = kdf_login_key(username, password, iterations)
     decryption_key = kdf_decryption_key(username, password, iterations)
+    
+    # The login key is the decryption key put through one more round, so
+    # reuse it rather than running the full iteration count a second time
+    login_key = pbkdf2_sha256(decryption_key, password.encode('utf-8'), 1).hex()
+    
     return login_key, decryption_key
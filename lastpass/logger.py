@@ -2,12 +2,19 @@
 Logging system with configurable levels and file output
 """
 
+import atexit
 import os
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 from enum import IntEnum
-from typing import Optional
+from typing import List, Optional, Tuple
+
+
+# Bytes of log lines held in memory before they are written out; errors are
+# always written at once
+LOG_BUFFER_SIZE = 64 * 1024
 
 
 class LogLevel(IntEnum):
@@ -19,6 +26,10 @@ class LogLevel(IntEnum):
     ERROR = 4
 
 
+# Level names indexed by level value
+_LEVEL_NAMES = tuple(level.name for level in LogLevel)
+
+
 class Logger:
     """Structured logging system"""
     
@@ -28,6 +39,16 @@ class Logger:
     
     def __init__(self):
         self.config_dir = self._get_config_dir()
+        # Descriptor of the log file, kept open once written to, and lines
+        # not yet written
+        self._fd: Optional[int] = None
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        # Guards the buffer and descriptor, as worker threads log too
+        self._lock = threading.Lock()
+        # Timestamp last formatted, reused by lines logged in the same second
+        self._timestamp: Tuple[int, str] = (-1, "")
+        atexit.register(self.close)
     
     @classmethod
     def get_instance(cls) -> 'Logger':
@@ -103,42 +124,91 @@ class Logger:
             formatted_message = message
         
         # Add timestamp and level
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        level_name = LogLevel(level).name
-        log_line = f"[{timestamp}] {level_name}: {formatted_message}\n"
+        now = int(time.time())
+        if now == self._timestamp[0]:
+            timestamp = self._timestamp[1]
+        else:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._timestamp = (now, timestamp)
+        log_line = f"[{timestamp}] {_LEVEL_NAMES[level]}: {formatted_message}\n"
         
-        # Write to log file
-        log_file = self.get_log_file()
-        if log_file:
-            try:
-                with open(log_file, 'a') as f:
-                    f.write(log_line)
-            except Exception:
-                pass
+        # Buffer for the log file, writing batches rather than every line
+        if self.get_log_file():
+            with self._lock:
+                self._buffer.append(log_line)
+                self._buffer_size += len(log_line)
+                if self._buffer_size >= LOG_BUFFER_SIZE or level >= LogLevel.ERROR:
+                    self._flush_locked()
         
         # Also write to stderr for errors
         if level >= LogLevel.ERROR:
             sys.stderr.write(log_line)
     
+    def flush(self) -> None:
+        """Write buffered log lines to the log file"""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Write buffered log lines, with _lock held"""
+        if not self._buffer:
+            return
+        
+        data = ''.join(self._buffer).encode('utf-8', 'replace')
+        self._buffer.clear()
+        self._buffer_size = 0
+        
+        try:
+            if self._fd is None:
+                # Appends go straight to the descriptor with no Python-level
+                # buffering; the log is readable by its owner only
+                self._fd = os.open(self.get_log_file(),
+                                   os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Write buffered log lines and close the log file"""
+        with self._lock:
+            self._flush_locked()
+            if self._fd is not None:
+                try:
+                    os.close(self._fd)
+                except OSError:
+                    pass
+                self._fd = None
+    
+    # The helpers below check the level themselves, so a disabled message
+    # costs one level check; pass format arguments separately rather
+    # than pre-formatting, so they are only formatted when logged
+    
     def debug(self, message: str, *args) -> None:
         """Log debug message"""
-        self.log(LogLevel.DEBUG, message, *args)
+        if self.get_log_level() <= LogLevel.DEBUG:
+            self.log(LogLevel.DEBUG, message, *args)
     
     def verbose(self, message: str, *args) -> None:
         """Log verbose message"""
-        self.log(LogLevel.VERBOSE, message, *args)
+        if self.get_log_level() <= LogLevel.VERBOSE:
+            self.log(LogLevel.VERBOSE, message, *args)
     
     def info(self, message: str, *args) -> None:
         """Log info message"""
-        self.log(LogLevel.INFO, message, *args)
+        if self.get_log_level() <= LogLevel.INFO:
+            self.log(LogLevel.INFO, message, *args)
     
     def warning(self, message: str, *args) -> None:
         """Log warning message"""
-        self.log(LogLevel.WARNING, message, *args)
+        if self.get_log_level() <= LogLevel.WARNING:
+            self.log(LogLevel.WARNING, message, *args)
     
     def error(self, message: str, *args) -> None:
         """Log error message"""
-        self.log(LogLevel.ERROR, message, *args)
+        if self.get_log_level() <= LogLevel.ERROR:
+            self.log(LogLevel.ERROR, message, *args)
 
 
 # Global logger instance
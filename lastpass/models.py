@@ -2,12 +2,21 @@
 Data models for LastPass entities
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+# Models are created per vault entry, so drop the per-instance __dict__
+# where dataclasses can also keep a __weakref__ slot (Python 3.11+); on older
+# versions the models stay regular classes so they remain weak-referenceable
+_SLOTS: Dict[str, Any] = (
+    {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+)
+
+
+@dataclass(**_SLOTS)
 class Field:
     """Custom field in an account"""
     name: str
@@ -24,7 +33,7 @@ class Field:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Attachment:
     """File attachment for an account"""
     id: str
@@ -44,7 +53,7 @@ class Attachment:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Share:
     """Shared folder information"""
     id: str
@@ -60,7 +69,7 @@ class Share:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShareUser:
     """User in a shared folder"""
     username: str
@@ -83,7 +92,7 @@ class ShareUser:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShareLimit:
     """Share limit configuration (whitelist/blacklist of accounts)"""
     whitelist: bool = False  # If True, account_ids is whitelist; if False, blacklist
@@ -97,7 +106,7 @@ class ShareLimit:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Account:
     """LastPass account/entry in the vault"""
     id: str
@@ -147,21 +156,28 @@ class Account:
         }
         
         if self.is_app:
-            data["appname"] = self.appname
-            data["wintitle"] = self.wintitle
-            data["wininfo"] = self.wininfo
-            data["exeversion"] = self.exeversion
-            data["warnversion"] = self.warnversion
-            data["exehash"] = self.exehash
+            data.update(
+                appname=self.appname,
+                wintitle=self.wintitle,
+                wininfo=self.wininfo,
+                exeversion=self.exeversion,
+                warnversion=self.warnversion,
+                exehash=self.exehash,
+            )
         
-        if self.fields:
-            data["fields"] = [f.to_dict() for f in self.fields]
+        # Serialize fields and attachments through the unbound to_dict, saving
+        # a method lookup per item
+        fields = self.fields
+        if fields:
+            data["fields"] = list(map(Field.to_dict, fields))
         
-        if self.attachments:
-            data["attachments"] = [a.to_dict() for a in self.attachments]
+        attachments = self.attachments
+        if attachments:
+            data["attachments"] = list(map(Attachment.to_dict, attachments))
         
-        if self.share:
-            data["share"] = self.share.to_dict()
+        share = self.share
+        if share:
+            data["share"] = share.to_dict()
         
         return data
     
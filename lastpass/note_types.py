@@ -42,6 +42,9 @@ class NoteTemplate:
     def __post_init__(self):
         if self.multiline_fields is None:
             self.multiline_fields = []
+        # Sets for membership tests; the lists keep the field order
+        self._fields_set = frozenset(self.fields)
+        self._multiline_set = frozenset(self.multiline_fields)
 
 
 # Note type templates matching lastpass-cli
@@ -328,22 +331,23 @@ NOTE_TEMPLATES = {
 }
 
 
+# Note types by shortname and by lowercased full name, built once
+_SHORTNAME_TO_TYPE: Dict[str, NoteType] = {
+    template.shortname: note_type for note_type, template in NOTE_TEMPLATES.items()
+}
+_NAME_TO_TYPE: Dict[str, NoteType] = {
+    template.name.lower(): note_type for note_type, template in NOTE_TEMPLATES.items()
+}
+
+
 def get_note_type_by_shortname(shortname: str) -> Optional[NoteType]:
     """Get note type by shortname"""
-    shortname_lower = shortname.lower()
-    for note_type, template in NOTE_TEMPLATES.items():
-        if template.shortname == shortname_lower:
-            return note_type
-    return None
+    return _SHORTNAME_TO_TYPE.get(shortname.lower())
 
 
 def get_note_type_by_name(name: str) -> Optional[NoteType]:
     """Get note type by full name"""
-    name_lower = name.lower()
-    for note_type, template in NOTE_TEMPLATES.items():
-        if template.name.lower() == name_lower:
-            return note_type
-    return None
+    return _NAME_TO_TYPE.get(name.lower())
 
 
 def get_template(note_type: NoteType) -> Optional[NoteTemplate]:
@@ -354,8 +358,8 @@ def get_template(note_type: NoteType) -> Optional[NoteTemplate]:
 def is_multiline_field(note_type: NoteType, field_name: str) -> bool:
     """Check if a field should be multiline"""
     template = get_template(note_type)
-    if template and template.multiline_fields:
-        return field_name in template.multiline_fields
+    if template:
+        return field_name in template._multiline_set
     return False
 
 
@@ -363,7 +367,7 @@ def has_field(note_type: NoteType, field_name: str) -> bool:
     """Check if note type has a specific field"""
     template = get_template(note_type)
     if template:
-        return field_name in template.fields
+        return field_name in template._fields_set
     return False
 
 
@@ -385,7 +389,7 @@ def format_note_fields(note_type: NoteType, fields: Dict[str, str]) -> str:
     
     # Add any extra fields not in template
     for key, value in fields.items():
-        if key not in template.fields:
+        if key not in template._fields_set:
             lines.append(f"{key}:{value}")
     
     return "\n".join(lines)
@@ -6,8 +6,7 @@ This module handles the conversion between LastPass secure note format
 separate fields for easier manipulation.
 """
 
-from typing import Optional
-from copy import deepcopy
+from typing import List, Optional
 
 from .models import Account, Field
 from .note_types import get_note_type_by_name, has_field, is_multiline_field
@@ -60,7 +59,7 @@ def notes_expand(account: Account) -> Optional[Account]:
         share=account.share,
         pwprotect=account.pwprotect,
         fields=[],
-        attachments=account.attachments.copy() if account.attachments else [],
+        attachments=list(account.attachments or ()),
         attachkey=account.attachkey,
         attach_present=account.attach_present,
     )
@@ -74,10 +73,16 @@ def notes_expand(account: Account) -> Optional[Account]:
             type_name = first_line[9:].strip()
             note_type = get_note_type_by_name(type_name)
     
-    # Parse fields
+    # Parse fields; the lines of a multiline value are collected in
+    # current_chunks and joined once the field is complete
     current_field = None
+    current_chunks: List[str] = []
     notes_section_started = False
     
+    def finish() -> None:
+        if current_field is not None and len(current_chunks) > 1:
+            current_field.value = '\n'.join(current_chunks)
+    
     for i, line in enumerate(lines):
         if not line and not current_field:
             continue
@@ -100,19 +105,20 @@ def notes_expand(account: Account) -> Optional[Account]:
             break
         
         # Parse key:value line
-        if ':' in line:
-            colon_idx = line.index(':')
-            key = line[:colon_idx]
-            value = line[colon_idx+1:].strip()
+        key, sep, value = line.partition(':')
+        if sep:
+            value = value.strip()
             
             # Check if this key belongs to a known note type field
             if note_type and current_field:
                 # Check if this is a new field or continuation
                 if not has_field(note_type, key) and is_multiline_field(note_type, current_field.name):
                     # This is a continuation line (like Proc-Type in SSH keys)
-                    current_field.value += '\n' + line
+                    current_chunks.append(line)
                     continue
             
+            finish()
+            
             # Handle special fields
             if key == "Username":
                 expanded.username = value
@@ -133,11 +139,12 @@ def notes_expand(account: Account) -> Optional[Account]:
                 new_field = Field(name=key, value=value, type="text")
                 expanded.fields.append(new_field)
                 current_field = new_field
-        else:
-            # Continuation line (no colon)
-            if current_field:
-                # Append to current field's value
-                current_field.value += '\n' + line
+                current_chunks = [value]
+        elif current_field:
+            # Continuation line (no colon) of the current field's value
+            current_chunks.append(line)
+    
+    finish()
     
     # If no fields were parsed, return original notes
     if (not expanded.username and not expanded.password and 
@@ -183,37 +190,41 @@ def notes_collapse(account: Account) -> Account:
         share=account.share,
         pwprotect=account.pwprotect,
         fields=[],
-        attachments=account.attachments.copy() if account.attachments else [],
+        attachments=list(account.attachments or ()),
         attachkey=account.attachkey,
         attach_present=account.attach_present,
     )
     
-    # Build notes content
+    # Build notes content in one pass over the fields; NoteType must be
+    # first if present (only the first one is kept)
+    note_type_line = None
     note_lines = []
     
-    # NoteType must be first if present
-    for field in account.fields:
-        if field.name == "NoteType":
-            note_lines.append(f"{field.name.strip()}:{field.value.strip()}")
-            break
-    
-    # Add other fields
     for field in account.fields:
         if field.name != "NoteType":
             note_lines.append(f"{field.name.strip()}:{field.value.strip()}")
+        elif note_type_line is None:
+            note_type_line = f"NoteType:{field.value.strip()}"
+    
+    if note_type_line is not None:
+        note_lines.insert(0, note_type_line)
     
     # Add special fields if present
-    if account.username and account.username.strip():
-        note_lines.append(f"Username:{account.username.strip()}")
+    username = account.username.strip() if account.username else ""
+    if username:
+        note_lines.append(f"Username:{username}")
     
-    if account.password and account.password.strip():
-        note_lines.append(f"Password:{account.password.strip()}")
+    password = account.password.strip() if account.password else ""
+    if password:
+        note_lines.append(f"Password:{password}")
     
-    if account.url and account.url.strip() and account.url != "http://sn":
-        note_lines.append(f"URL:{account.url.strip()}")
+    url = account.url.strip() if account.url else ""
+    if url and account.url != "http://sn":
+        note_lines.append(f"URL:{url}")
     
-    if account.notes and account.notes.strip():
-        note_lines.append(f"Notes:{account.notes.strip()}")
+    notes = account.notes.strip() if account.notes else ""
+    if notes:
+        note_lines.append(f"Notes:{notes}")
     
     collapsed.notes = '\n'.join(note_lines)
     
@@ -59,9 +59,27 @@ class Session:
         # Encrypt session data
         encrypted = encrypt_and_base64(data, key)
         
-        # Write to file with secure permissions
-        session_file.write_text(encrypted)
-        os.chmod(session_file, 0o600)
+        # Write a private temporary file and swap it in, so a crash mid-write
+        # leaves the previous session intact rather than a truncated one
+        temp_file = config_dir / "session.tmp"
+        try:
+            temp_file.unlink()
+        except FileNotFoundError:
+            pass
+        
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(encrypted)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, session_file)
+        except BaseException:
+            try:
+                temp_file.unlink()
+            except FileNotFoundError:
+                pass
+            raise
     
     @classmethod
     def load(cls, key: bytes, config_dir: Optional[Path] = None) -> Optional["Session"]:
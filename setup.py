@@ -42,6 +42,9 @@ setup(
     ],
     extras_require={
         "clipboard": ["pyperclip>=1.8.0"],
+        "search": ["hyperscan>=0.4.0"],
+        "fastjson": ["orjson>=3.6.0"],
+        "fastbase64": ["pybase64>=1.0.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
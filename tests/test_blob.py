@@ -92,6 +92,14 @@ class TestBlobParser:
         parser = BlobParser(b"", encryption_key)
         decrypted = parser.decrypt_item(encrypted, custom_key)
         assert decrypted == plaintext
+    
+    def test_decrypt_items(self, encryption_key):
+        """Test batch decryption blanks only the items that fail"""
+        parser = BlobParser(b"", encryption_key)
+        items = [aes_encrypt("one", encryption_key), b"", b"!bad", aes_encrypt("two", encryption_key)]
+        
+        assert parser.decrypt_items(items[:2]) == ["one", ""]
+        assert parser.decrypt_items(items) == ["one", "", "", "two"]
 
 
 class TestParseBlobFunction:
@@ -9,7 +9,11 @@ from Crypto.PublicKey import RSA as CryptoRSA
 from lastpass.cipher import (
     aes_decrypt,
     aes_decrypt_base64,
+    aes_decrypt_many,
+    decrypt_aes256_cbc_base64_stream,
     aes_encrypt,
+    aes_encrypt_many,
+    aes_encrypt_many_str,
     encrypt_and_base64,
     rsa_decrypt,
     rsa_encrypt,
@@ -102,6 +106,112 @@ class TestAESCrypto:
         assert decrypted.decode('utf-8') == plaintext
 
 
+class TestAESEncryptMany:
+    """Test batch AES encryption"""
+    
+    @pytest.fixture
+    def aes_key(self):
+        """32-byte AES-256 key"""
+        return b"0123456789abcdef0123456789abcdef"
+    
+    def test_round_trip(self, aes_key):
+        """Test each batch result decrypts to its plaintext"""
+        plaintexts = ["name", "", "pässwörd", b"raw bytes"]
+        
+        encrypted = aes_encrypt_many(plaintexts, aes_key)
+        
+        assert len(encrypted) == 4
+        assert encrypted[1] == b''
+        assert aes_decrypt(encrypted[0], aes_key) == b"name"
+        assert aes_decrypt(encrypted[2], aes_key) == "pässwörd".encode('utf-8')
+        assert aes_decrypt(encrypted[3], aes_key) == b"raw bytes"
+    
+    def test_distinct_ivs(self, aes_key):
+        """Test equal plaintexts still get distinct IVs"""
+        encrypted = aes_encrypt_many(["same", "same"], aes_key)
+        
+        assert encrypted[0] != encrypted[1]
+    
+    def test_empty_batch(self, aes_key):
+        """Test encrypting an empty batch"""
+        assert aes_encrypt_many([], aes_key) == []
+    
+    def test_invalid_key(self):
+        """Test batch encryption with an invalid key"""
+        with pytest.raises(DecryptionException):
+            aes_encrypt_many(["data"], b"short")
+    
+    def test_str_variant(self, aes_key):
+        """Test the str-returning batch helper produces decryptable text"""
+        batch = aes_encrypt_many_str(["user", ""], aes_key)
+        
+        assert isinstance(batch[0], str) and batch[0].startswith("!")
+        assert aes_decrypt(batch[0].encode("ascii"), aes_key) == b"user"
+        assert batch[1] == ""
+
+
+class TestAESDecryptMany:
+    """Test batch AES decryption"""
+    
+    @pytest.fixture
+    def aes_key(self):
+        """32-byte AES-256 key"""
+        return b"0123456789abcdef0123456789abcdef"
+    
+    def test_matches_single_decrypt(self, aes_key):
+        """Test batch results equal aes_decrypt for CBC, ECB and empty values"""
+        from Crypto.Cipher import AES
+        from Crypto.Util.Padding import pad
+        
+        ciphertexts = [aes_encrypt("x" * n, aes_key) for n in (1, 15, 16, 17, 40)]
+        ciphertexts.append(b"")
+        ciphertexts.append(AES.new(aes_key, AES.MODE_ECB).encrypt(pad(b"legacy", 16)))
+        ciphertexts.append(b"!" + base64.b64encode(b"i" * 16) + b"|")
+        
+        assert aes_decrypt_many(ciphertexts, aes_key) == [aes_decrypt(c, aes_key) for c in ciphertexts]
+    
+    def test_invalid_data(self, aes_key):
+        """Test malformed input raises DecryptionException"""
+        with pytest.raises(DecryptionException):
+            aes_decrypt_many([b"!no-separator"], aes_key)
+        with pytest.raises(DecryptionException):
+            aes_decrypt_many([b"not a block multiple"], aes_key)
+
+
+class TestDecryptStream:
+    """Test chunked base64 AES decryption"""
+    
+    @pytest.fixture
+    def aes_key(self):
+        """32-byte AES-256 key"""
+        return b"0123456789abcdef0123456789abcdef"
+    
+    @pytest.mark.parametrize("size", [1, 15, 16, 17, 100, 5000])
+    def test_matches_original_bytes(self, aes_key, size):
+        """Test output equals the plaintext across chunk boundaries"""
+        plaintext = get_random_bytes(size)
+        src = base64.b64encode(aes_encrypt(plaintext, aes_key))
+        
+        assert decrypt_aes256_cbc_base64_stream(src, aes_key, chunk_size=64) == plaintext
+        assert decrypt_aes256_cbc_base64_stream(src, aes_key) == plaintext
+    
+    def test_wrapped_base64(self, aes_key):
+        """Test line-wrapped base64 input"""
+        plaintext = get_random_bytes(1000)
+        src = base64.encodebytes(aes_encrypt(plaintext, aes_key))
+        
+        assert decrypt_aes256_cbc_base64_stream(src, aes_key, chunk_size=64) == plaintext
+    
+    def test_empty(self, aes_key):
+        """Test empty input"""
+        assert decrypt_aes256_cbc_base64_stream(b"", aes_key) == b""
+    
+    def test_invalid_data(self, aes_key):
+        """Test malformed input raises DecryptionException"""
+        with pytest.raises(DecryptionException):
+            decrypt_aes256_cbc_base64_stream(base64.b64encode(b"!no-separator"), aes_key)
+
+
 class TestRSACrypto:
     """Test RSA encryption/decryption"""
     
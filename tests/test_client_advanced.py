@@ -9,7 +9,7 @@ from pathlib import Path
 from lastpass.client import LastPassClient
 from lastpass.exceptions import LoginFailedException, InvalidSessionException
 from lastpass.session import Session
-from lastpass.models import Account
+from lastpass.models import Account, Share
 
 
 class TestClientSessionLoading:
@@ -245,6 +245,36 @@ class TestClientGetSharesSync:
         
         shares = client.get_shares(sync=False)
         assert isinstance(shares, list)
+    
+    def test_find_share_by_id_and_name(self):
+        """Test find_share lookups follow replacement of the share list"""
+        client = LastPassClient()
+        client._shares = [
+            Share(id="100", name="Team", key=b""),
+            Share(id="200", name="Ops", key=b""),
+            Share(id="300", name="Team", key=b""),
+        ]
+        
+        assert client.find_share("200", sync=False).name == "Ops"
+        assert client.find_share("Team", sync=False).id == "100"
+        assert client.find_share("missing", sync=False) is None
+        
+        client._shares = [Share(id="400", name="Infra", key=b"")]
+        assert client.find_share("Ops", sync=False) is None
+        assert client.find_share("Infra", sync=False).id == "400"
+    
+    def test_find_share_id_name_collision_uses_list_order(self):
+        """Test a name match earlier in the list beats a later ID match"""
+        client = LastPassClient()
+        client._shares = [
+            Share(id="100", name="200", key=b""),
+            Share(id="200", name="Ops", key=b""),
+        ]
+        
+        assert client.find_share("200", sync=False).id == "100"
+        
+        client._shares = list(reversed(client._shares))
+        assert client.find_share("200", sync=False).id == "200"
 
 
 class TestClientListGroupsSync:
@@ -3,10 +3,12 @@ Tests for clipboard functionality
 """
 
 import os
+import subprocess
+import sys
 import pytest
 from unittest.mock import Mock, patch
 
-from lastpass.clipboard import ClipboardManager
+from lastpass.clipboard import ClipboardManager, _CLIPBOARD_TOOLS
 
 
 class TestClipboardManager:
@@ -41,6 +43,22 @@ class TestClipboardManager:
             result = ClipboardManager.copy_to_clipboard("test text")
             assert result is True
     
+    @patch('subprocess.Popen')
+    def test_copy_passes_bytes_and_wipes_buffer(self, mock_popen):
+        """Test the secret is sent once as bytes and the buffer is zeroed afterwards"""
+        sent = []
+        mock_process = Mock()
+        mock_process.communicate.side_effect = lambda input: sent.append((input, bytes(input)))
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        
+        with patch.dict(os.environ, {'LPASS_CLIPBOARD_COMMAND': 'custom-clipboard'}):
+            assert ClipboardManager.copy_to_clipboard("pässword") is True
+        
+        buffer, contents = sent[0]
+        assert contents == "pässword".encode('utf-8')
+        assert buffer == bytes(len(contents))
+    
     @patch('subprocess.Popen')
     def test_copy_xclip(self, mock_popen):
         """Test xclip clipboard"""
@@ -51,7 +69,69 @@ class TestClipboardManager:
         
         result = ClipboardManager._try_command(['xclip', '-selection', 'clipboard'], 'test')
         assert result is True
-
+    
+    
+    @patch('subprocess.Popen')
+    def test_schedule_clear_spawns_detached_helper(self, mock_popen):
+        """Test clipboard clearing is handed to a new session instead of a fork"""
+        with patch('os.fork') as mock_fork:
+            ClipboardManager._schedule_clear(30, ['wl-copy', '--clear'])
+        
+        mock_fork.assert_not_called()
+        args, kwargs = mock_popen.call_args
+        assert args[0][0] == sys.executable
+        assert args[0][3:] == ['30', 'wl-copy', '--clear']
+        assert kwargs['start_new_session'] is True
+    
+    @patch('lastpass.clipboard.ClipboardManager._schedule_clear')
+    @patch('lastpass.clipboard.ClipboardManager._try_command')
+    @patch('lastpass.clipboard.ClipboardManager._get_clipboard_tools',
+           return_value=_CLIPBOARD_TOOLS)
+    def test_auto_clipboard_schedules_matching_clear(self, mock_tools, mock_try, mock_clear):
+        """Test the first working tool is used and cleared with its own command"""
+        mock_try.side_effect = lambda command, text: command == ['wl-copy']
+        
+        assert ClipboardManager._auto_clipboard("secret", clear_after=10) is True
+        mock_clear.assert_called_once_with(10, ['wl-copy', '--clear'])
+        
+        mock_clear.reset_mock()
+        mock_try.side_effect = lambda command, text: command == ['clip.exe']
+        
+        assert ClipboardManager._auto_clipboard("secret", clear_after=10) is True
+        mock_clear.assert_not_called()
+    
+    def test_clipboard_tools_detected_once(self, monkeypatch):
+        """Test only installed tools are tried, with wl-copy first under Wayland"""
+        installed = {'xclip', 'wl-copy'}
+        which_calls = []
+        
+        def which(name):
+            which_calls.append(name)
+            return f"/usr/bin/{name}" if name in installed else None
+        
+        monkeypatch.setattr('shutil.which', which)
+        monkeypatch.setattr(ClipboardManager, '_tools', None)
+        monkeypatch.setenv('WAYLAND_DISPLAY', 'wayland-0')
+        monkeypatch.delenv('DISPLAY', raising=False)
+        
+        tools = ClipboardManager._get_clipboard_tools()
+        assert [copy[0] for copy, _ in tools] == ['wl-copy', 'xclip']
+        
+        probes = len(which_calls)
+        assert ClipboardManager._get_clipboard_tools() is tools
+        assert len(which_calls) == probes
+    
+    def test_clear_helper_runs_command(self, tmp_path):
+        """Test the helper script runs the clear command once the delay passes"""
+        from lastpass.clipboard import _CLEAR_SCRIPT
+        
+        marker = tmp_path / "cleared"
+        command = [sys.executable, '-c',
+                   f"import sys; open({str(marker)!r}, 'wb').write(sys.stdin.buffer.read() + b'ok')"]
+        
+        subprocess.run([sys.executable, '-c', _CLEAR_SCRIPT, '0'] + command, check=True, timeout=30)
+        
+        assert marker.read_bytes() == b'ok'
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
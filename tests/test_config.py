@@ -2,6 +2,7 @@
 Tests for configuration management
 """
 
+import sys
 import pytest
 from pathlib import Path
 
@@ -72,6 +73,21 @@ class TestConfig:
         temp_config.delete_plaintext_key()
         assert not temp_config.has_plaintext_key()
     
+    def test_plaintext_key_read_once(self, temp_config, mocker):
+        """Test the plaintext key is read from disk once and wiped on delete"""
+        temp_config.write_buffer("plaintext_key", b"k" * 32)
+        read = mocker.spy(temp_config, "read_buffer")
+        
+        assert temp_config.get_plaintext_key() == b"k" * 32
+        assert temp_config.get_plaintext_key() == b"k" * 32
+        assert read.call_count == 1
+        
+        cached = temp_config._plaintext_key
+        temp_config.delete_plaintext_key()
+        assert cached == bytes(32)
+        assert not temp_config.has_plaintext_key()
+        assert temp_config.get_plaintext_key() is None
+    
     def test_write_read_buffer(self, temp_config):
         """Test binary buffer operations"""
         data = b"binary data test"
@@ -83,7 +99,68 @@ class TestConfig:
         temp_config.unlink("test_buffer")
         retrieved = temp_config.read_buffer("test_buffer")
         assert retrieved is None
-
+    
+    
+    def test_expand_alias_from_file(self, temp_config):
+        """Test alias files are found, cached, and picked up after writes"""
+        temp_config.set_alias("ll", "ls --config")
+        temp_config.write_buffer("alias.ll", b"ls --long\n")
+        
+        assert temp_config.expand_alias(["ll", "g"]) == ["ls", "--long", "g"]
+        assert temp_config.expand_alias(["ll"]) == ["ls", "--long"]
+        
+        temp_config.write_buffer("alias.ll", b"show --json")
+        assert temp_config.expand_alias(["ll"]) == ["show", "--json"]
+        
+        # Without the file the config.json alias applies
+        temp_config.unlink("alias.ll")
+        assert temp_config.expand_alias(["ll"]) == ["ls", "--config"]
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_write_buffer_is_private(self, temp_config):
+        """Test buffers are written with owner-only permissions, even over looser files"""
+        temp_config.write_buffer("new_buffer", b"\x00\r\n")
+        assert (temp_config.config_dir / "new_buffer").stat().st_mode & 0o777 == 0o600
+        
+        loose = temp_config.config_dir / "loose_buffer"
+        loose.write_bytes(b"old contents")
+        loose.chmod(0o644)
+        temp_config.write_buffer("loose_buffer", b"new")
+        
+        assert loose.stat().st_mode & 0o777 == 0o600
+        assert temp_config.read_buffer("loose_buffer") == b"new"
+        assert temp_config.read_buffer("new_buffer") == b"\x00\r\n"
+    
+    def test_config_round_trip_without_orjson(self, tmp_path, monkeypatch):
+        """Test config persists through the json fallback when orjson is missing"""
+        monkeypatch.setattr("lastpass.config.orjson", None)
+        
+        config = Config(tmp_path / "lpass_test")
+        config.set("alias.ll", "ls --long")
+        config.set("name", "caf\u00e9")
+        
+        reloaded = Config(tmp_path / "lpass_test")
+        assert reloaded.get("alias.ll") == "ls --long"
+        assert reloaded.get("name") == "caf\u00e9"
+    
+    def test_env_lookups_follow_changes(self, monkeypatch, tmp_path):
+        """Test memoized environment lookups still see updated variables"""
+        monkeypatch.setenv("LPASS_HOME", str(tmp_path / "one"))
+        monkeypatch.setenv("LPASS_AGENT_TIMEOUT", "60")
+        assert Config._get_config_dir() == tmp_path / "one"
+        assert Config.get_agent_timeout() == 60
+        
+        monkeypatch.setenv("LPASS_HOME", str(tmp_path / "two"))
+        monkeypatch.setenv("LPASS_AGENT_TIMEOUT", "soon")
+        assert Config._get_config_dir() == tmp_path / "two"
+        assert Config.get_agent_timeout() == 3600
+        
+        monkeypatch.delenv("LPASS_HOME")
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+        assert Config._get_config_dir() == tmp_path / "xdg" / "lpass"
+        
+        Config.reset_env_cache()
+        assert Config._get_config_dir() == tmp_path / "xdg" / "lpass"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
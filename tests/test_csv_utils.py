@@ -6,6 +6,7 @@ import pytest
 from lastpass.csv_utils import (
     export_accounts_to_csv,
     import_accounts_from_csv,
+    iter_export_accounts_to_csv,
     parse_csv_field_list,
 )
 from lastpass.models import Account, Field
@@ -158,7 +159,17 @@ https://different.com,user@example.com,pass456,,Different Account,Work"""
         assert len(accounts) == 2
         assert accounts[0]["name"] == "Test Account"
         assert accounts[1]["name"] == "Different Account"
+    
+    def test_import_duplicate_check_keeps_fields_apart(self):
+        """Test entries whose joined name and username look alike are not merged"""
+        csv_data = """url,username,password,extra,name,grouping
+https://a.com,c,pass1,,a:b,Work
+https://b.com,b:c,pass2,,a,Work"""
+
+        accounts = import_accounts_from_csv(csv_data)
         
+        assert [a["password"] for a in accounts] == ["pass1", "pass2"]
+    
     def test_import_keep_duplicates_when_requested(self):
         """Test keeping duplicates when requested"""
         csv_data = """url,username,password,extra,name,grouping
@@ -270,6 +281,37 @@ class TestCSVUtilities:
         assert "Test" in content
         assert "user" in content
     
+    def test_iter_export_yields_one_line_per_row(self):
+        """Test the streaming export yields the same CSV line by line"""
+        accounts = [
+            Account(id="1", name="Test, Inc", username="user", password="p\"w"),
+            Account(id="2", name="Other", username="admin", notes="multi\nline"),
+        ]
+        fields = ["id", "name", "username", "password", "extra"]
+        
+        lines = list(iter_export_accounts_to_csv(iter(accounts), fields))
+        
+        assert lines == [
+            "id,name,username,password,extra\r\n",
+            '1,"Test, Inc",user,"p""w",\r\n',
+            '2,Other,admin,,"multi\nline"\r\n',
+        ]
+        assert "".join(lines) == export_accounts_to_csv(accounts, fields=fields)
+    
+    def test_export_custom_field_first_match_wins(self):
+        """Test a repeated custom field name exports the first value like get_field"""
+        accounts = [
+            Account(id="1", name="Test", fields=[
+                Field(name="Key", value="first"),
+                Field(name="Key", value="second"),
+            ]),
+            Account(id="2", name="Plain"),
+        ]
+        
+        csv_data = export_accounts_to_csv(accounts, fields=["name", "Key"])
+        
+        assert csv_data == "name,Key\r\nTest,first\r\nPlain,\r\n"
+    
     def test_export_with_custom_field_from_account(self):
         """Test exporting custom fields from account"""
         accounts = [
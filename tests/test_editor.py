@@ -6,7 +6,7 @@ import os
 import subprocess
 from pathlib import Path
 
-from lastpass.editor import Editor
+from lastpass.editor import Editor, _resolve_tmpdir
 from lastpass.models import Account, Field
 
 
@@ -27,21 +27,41 @@ class TestGetEditor:
         assert editor == 'emacs'
     
     @patch.dict(os.environ, {}, clear=True)
-    @patch('subprocess.run')
-    def test_get_editor_default_vi(self, mock_run):
+    @patch.object(Editor, '_default_editor', None)
+    @patch('shutil.which')
+    def test_get_editor_default_vi(self, mock_which):
         """Test getting default editor (vi)."""
-        mock_run.return_value = Mock(returncode=0)
+        mock_which.return_value = '/usr/bin/editor'
         editor = Editor._get_editor()
         assert editor in ['vi', 'vim', 'nano', 'emacs']
     
     @patch.dict(os.environ, {}, clear=True)
-    @patch('subprocess.run')
-    def test_get_editor_fallback_to_vi(self, mock_run):
+    @patch.object(Editor, '_default_editor', None)
+    @patch('shutil.which')
+    def test_get_editor_fallback_to_vi(self, mock_which):
         """Test fallback to vi when no editors found."""
-        mock_run.return_value = Mock(returncode=1)
+        mock_which.return_value = None
         editor = Editor._get_editor()
         assert editor == 'vi'
-
+    
+    
+    @patch.object(Editor, '_default_editor', None)
+    @patch('subprocess.run')
+    def test_get_editor_scans_path_once(self, mock_run):
+        """Test the fallback editor is looked up without spawning and cached per PATH."""
+        found = {'nano'}
+        with patch.dict(os.environ, {'PATH': '/one'}, clear=True), \
+             patch('shutil.which', side_effect=lambda e: e if e in found else None) as mock_which:
+            assert Editor._get_editor() == 'nano'
+            calls = mock_which.call_count
+            assert Editor._get_editor() == 'nano'
+            assert mock_which.call_count == calls
+            
+            found = {'vim'}
+            os.environ['PATH'] = '/two'
+            assert Editor._get_editor() == 'vim'
+        
+        mock_run.assert_not_called()
 
 @pytest.mark.unit
 class TestGetSecureTmpdir:
@@ -50,21 +70,44 @@ class TestGetSecureTmpdir:
     @patch.dict(os.environ, {'SECURE_TMPDIR': '/secure/tmp'})
     def test_get_secure_tmpdir_from_env(self):
         """Test getting secure tmpdir from environment."""
-        with patch('pathlib.Path.exists', return_value=True):
+        _resolve_tmpdir.cache_clear()
+        with patch('os.path.isdir', return_value=True):
             tmpdir = Editor._get_secure_tmpdir()
             assert str(tmpdir) == '/secure/tmp'
     
+    @patch.dict(os.environ, {'SECURE_TMPDIR': '/secure/tmp', 'TMPDIR': '/custom/tmp'})
+    def test_get_secure_tmpdir_follows_env(self):
+        """Test a changed TMPDIR or a newly created SECURE_TMPDIR is picked up."""
+        _resolve_tmpdir.cache_clear()
+        with patch('os.path.isdir', return_value=False):
+            assert str(Editor._get_secure_tmpdir()) == '/custom/tmp'
+            
+            os.environ['TMPDIR'] = '/other/tmp'
+            assert str(Editor._get_secure_tmpdir()) == '/other/tmp'
+        
+        with patch('os.path.isdir', return_value=True):
+            assert str(Editor._get_secure_tmpdir()) == '/secure/tmp'
+    
     @patch.dict(os.environ, {'TMPDIR': '/custom/tmp'}, clear=True)
     def test_get_secure_tmpdir_from_tmpdir(self):
         """Test getting tmpdir from TMPDIR env var."""
         tmpdir = Editor._get_secure_tmpdir()
         assert str(tmpdir) == '/custom/tmp'
     
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.dict(os.environ, {'LPASS_USE_TMPFS': '0'}, clear=True)
     def test_get_secure_tmpdir_default(self):
         """Test getting default tmpdir."""
         tmpdir = Editor._get_secure_tmpdir()
         assert str(tmpdir) == '/tmp'
+    
+    @patch.dict(os.environ, {}, clear=True)
+    def test_get_secure_tmpdir_prefers_tmpfs(self):
+        """Test tmpfs is used when no directory is configured."""
+        _resolve_tmpdir.cache_clear()
+        with patch('os.path.isdir', return_value=True), \
+             patch('os.access', return_value=True):
+            assert str(Editor._get_secure_tmpdir()) == '/dev/shm'
+        _resolve_tmpdir.cache_clear()
 
 
 @pytest.mark.unit
@@ -101,7 +144,7 @@ class TestEditText:
         
         # Verify
         assert result == 'edited content'
-        mock_chmod.assert_called_once_with(mock_tmpfile, 0o600)
+        mock_chmod.assert_not_called()
         mock_subprocess.assert_called_once()
         mock_unlink.assert_called_once_with(mock_tmpfile)
     
@@ -150,7 +193,30 @@ class TestEditText:
         
         assert result is None
         mock_unlink.assert_called_once()
-
+    
+    
+    @pytest.mark.skipif(os.name != 'posix', reason="POSIX file modes")
+    def test_edit_text_private_file_replaced_by_editor(self, tmp_path):
+        """Test the temp file is private and a save-by-rename editor is read correctly."""
+        seen = {}
+        
+        def editor(args, check=False):
+            path = args[1]
+            seen['mode'] = os.stat(path).st_mode & 0o777
+            seen['text'] = Path(path).read_text()
+            # Save the way some editors do: write a new file, rename it over
+            replacement = tmp_path / 'replacement'
+            replacement.write_text('new text')
+            os.replace(replacement, path)
+            return Mock(returncode=0)
+        
+        with patch.object(Editor, '_get_secure_tmpdir', return_value=tmp_path), \
+             patch.object(Editor, '_get_editor', return_value='editor'), \
+             patch('subprocess.run', side_effect=editor):
+            assert Editor.edit_text('old text') == 'new text'
+        
+        assert seen == {'mode': 0o600, 'text': 'old text'}
+        assert list(tmp_path.iterdir()) == []
 
 @pytest.mark.unit
 class TestEditField:
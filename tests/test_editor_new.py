@@ -6,7 +6,7 @@ import os
 import subprocess
 from pathlib import Path
 
-from lastpass.editor import Editor
+from lastpass.editor import Editor, _resolve_tmpdir
 from lastpass.models import Account, Field
 
 
@@ -27,18 +27,20 @@ class TestGetEditor:
         assert editor == 'emacs'
     
     @patch.dict(os.environ, {}, clear=True)
-    @patch('subprocess.run')
-    def test_get_editor_default_vi(self, mock_run):
+    @patch.object(Editor, '_default_editor', None)
+    @patch('shutil.which')
+    def test_get_editor_default_vi(self, mock_which):
         """Test getting default editor (vi)."""
-        mock_run.return_value = Mock(returncode=0)
+        mock_which.return_value = '/usr/bin/editor'
         editor = Editor._get_editor()
         assert editor in ['vi', 'vim', 'nano', 'emacs']
     
     @patch.dict(os.environ, {}, clear=True)
-    @patch('subprocess.run')
-    def test_get_editor_fallback_to_vi(self, mock_run):
+    @patch.object(Editor, '_default_editor', None)
+    @patch('shutil.which')
+    def test_get_editor_fallback_to_vi(self, mock_which):
         """Test fallback to vi when no editors found."""
-        mock_run.return_value = Mock(returncode=1)
+        mock_which.return_value = None
         editor = Editor._get_editor()
         assert editor == 'vi'
 
@@ -50,7 +52,8 @@ class TestGetSecureTmpdir:
     @patch.dict(os.environ, {'SECURE_TMPDIR': '/secure/tmp'})
     def test_get_secure_tmpdir_from_env(self):
         """Test getting secure tmpdir from environment."""
-        with patch('pathlib.Path.exists', return_value=True):
+        _resolve_tmpdir.cache_clear()
+        with patch('os.path.isdir', return_value=True):
             tmpdir = Editor._get_secure_tmpdir()
             assert str(tmpdir) == '/secure/tmp'
     
@@ -60,7 +63,7 @@ class TestGetSecureTmpdir:
         tmpdir = Editor._get_secure_tmpdir()
         assert str(tmpdir) == '/custom/tmp'
     
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.dict(os.environ, {'LPASS_USE_TMPFS': '0'}, clear=True)
     def test_get_secure_tmpdir_default(self):
         """Test getting default tmpdir."""
         tmpdir = Editor._get_secure_tmpdir()
@@ -101,7 +104,7 @@ class TestEditText:
         
         # Verify
         assert result == 'edited content'
-        mock_chmod.assert_called_once_with(mock_tmpfile, 0o600)
+        mock_chmod.assert_not_called()
         mock_subprocess.assert_called_once()
         mock_unlink.assert_called_once_with(mock_tmpfile)
     
@@ -8,6 +8,7 @@ from lastpass.format import (
     format_account_field,
     format_field_field,
     format_account,
+    format_accounts,
     format_timestamp,
     get_display_fullname
 )
@@ -34,6 +35,12 @@ class TestFormatting:
         assert format_timestamp("") == ""
         assert format_timestamp("0") == ""
     
+    def test_format_timestamp_invalid(self):
+        """Test unparseable and out-of-range timestamps format as empty"""
+        assert format_timestamp("not a number") == ""
+        assert format_timestamp(str(10 ** 20)) == ""
+        assert format_timestamp(str(10 ** 20), utc=False) == ""
+    
     def test_get_display_fullname_with_share(self):
         """Test fullname display with share"""
         share = Share(id="123", name="TeamShare", key=b"key", readonly=False)
@@ -168,6 +175,19 @@ class TestFormatting:
         )
         assert format_account_field('s', account) == "TeamShare"
     
+    def test_format_account_field_modified(self):
+        """Test formatting the modification time"""
+        account = Account(
+            id="1",
+            name="test",
+            username="user",
+            password="pass",
+            url="http://example.com",
+            group="",
+            last_modified_gmt="1234567890",
+        )
+        assert format_account_field('m', account) == "2009-02-13 23:31"
+    
     def test_format_account_field_with_slash(self):
         """Test formatting with trailing slash"""
         account = Account(
@@ -307,7 +327,41 @@ class TestFormatting:
         # But %z (unknown top-level code) should be literal
         result2 = format_account("%z", account)
         assert result2 == "%z"
-
+    
+    
+    def test_format_accounts_compiles_once(self):
+        """Test a format string is parsed once and gives the same output per account"""
+        from lastpass.format import _compile_format
+        
+        accounts = [
+            Account(id=str(i), name=f"site{i}", username="user", password="pass",
+                    url="http://example.com", group="Group" if i % 2 else "")
+            for i in range(5)
+        ]
+        format_str = "%/ag%an [%ai] %/% %x%a"
+        
+        _compile_format.cache_clear()
+        results = format_accounts(format_str, accounts)
+        
+        assert results == [format_account(format_str, a) for a in accounts]
+        assert results[1] == "Group/site1 [1] %/% %x%a"
+        assert _compile_format.cache_info().misses == 1
+    
+    @pytest.mark.parametrize("format_str, expected", [
+        ("%", "%"),
+        ("%/", "%/"),
+        ("%a", "%a"),
+        ("%/f", "%/f"),
+        ("%/%an", "%/%an"),
+        ("%//an", "%//an"),
+        ("%%an%%", "%an%"),
+        ("%an\n%/ag", "test\nGroup/"),
+        ("%/an%/as%fn", "test/"),
+    ])
+    def test_format_account_edge_cases(self, format_str, expected):
+        """Test directives at the end of the string and odd modifiers stay literal"""
+        account = Account(id="1", name="test", group="Group")
+        assert format_account(format_str, account) == expected
 
 class TestCLIFormatting:
     """Test CLI integration with formatting"""
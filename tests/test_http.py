@@ -2,11 +2,17 @@
 Tests for lastpass.http module
 """
 
+import gzip
+import io
 import pytest
 import responses
 from requests.exceptions import RequestException
-from unittest.mock import patch
-from lastpass.http import HTTPClient
+from unittest.mock import Mock, patch
+from urllib.parse import urlencode
+from lastpass.http import (
+    HTTPClient, BATCH_WORKERS, GZIP_MIN_SIZE, POOL_MAXSIZE, RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND
+)
 from lastpass.session import Session
 from lastpass.exceptions import NetworkException
 from tests.test_fixtures import MOCK_LOGIN_SUCCESS_XML, get_mock_session
@@ -71,7 +77,101 @@ class TestHTTPClient:
             client.post("test.php", {})
         
         assert "HTTP request failed" in str(exc_info.value)
-
+    
+    def test_connection_pool_sized_for_workers(self):
+        """Test the server's adapter pools enough connections for bulk work"""
+        client = HTTPClient()
+        adapter = client.session.get_adapter("https://lastpass.com/show_website.php")
+        
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+        assert POOL_MAXSIZE >= BATCH_WORKERS
+    
+    def test_close_closes_session(self):
+        """Test close releases the pooled connections"""
+        client = HTTPClient()
+        
+        with patch.object(client.session, 'close') as mock_close:
+            client.close()
+        
+        mock_close.assert_called_once()
+    
+    @responses.activate
+    def test_post_paces_requests_past_burst(self):
+        """Test requests beyond the burst wait for the token bucket"""
+        responses.add(responses.POST, "https://lastpass.com/test.php", body=b"OK", status=200)
+        client = HTTPClient()
+        
+        with patch('lastpass.http.time.monotonic', return_value=100.0), \
+             patch('lastpass.http.time.sleep') as mock_sleep:
+            client._last_refill = 100.0
+            for _ in range(RATE_LIMIT_BURST):
+                client.post("test.php", {})
+            mock_sleep.assert_not_called()
+            
+            client.post("test.php", {})
+        
+        mock_sleep.assert_called_once_with(pytest.approx(1 / RATE_LIMIT_PER_SECOND))
+    
+    @responses.activate
+    def test_post_rate_limit_configurable(self):
+        """Test the rate and burst come from the constructor, and None turns pacing off"""
+        responses.add(responses.POST, "https://lastpass.com/test.php", body=b"OK", status=200)
+        paced = HTTPClient(rate_per_second=50.0, rate_burst=2)
+        unpaced = HTTPClient(rate_per_second=None)
+        
+        with patch('lastpass.http.time.monotonic', return_value=100.0), \
+             patch('lastpass.http.time.sleep') as mock_sleep:
+            paced._last_refill = 100.0
+            for _ in range(RATE_LIMIT_BURST + 5):
+                unpaced.post("test.php", {})
+            mock_sleep.assert_not_called()
+            
+            for _ in range(3):
+                paced.post("test.php", {})
+        
+        mock_sleep.assert_called_once_with(pytest.approx(1 / 50.0))
+    
+    @responses.activate
+    def test_post_slows_down_after_429(self):
+        """Test a 429 halves the request rate"""
+        responses.add(responses.POST, "https://lastpass.com/test.php", status=429)
+        responses.add(responses.POST, "https://lastpass.com/test.php", body=b"OK", status=200)
+        client = HTTPClient()
+        
+        with patch('lastpass.http.time.sleep'):
+            content, status = client.post("test.php", {})
+        
+        assert status == 200
+        assert client._rate < RATE_LIMIT_PER_SECOND
+    
+    def test_post_splits_connect_and_read_timeouts(self):
+        """Test post uses separate connect and read timeouts, overridable per call"""
+        client = HTTPClient(connect_timeout=2, read_timeout=20)
+        
+        with patch.object(client.session, 'post') as mock_post:
+            mock_post.return_value.status_code = 200
+            client.post("test.php", {})
+            assert mock_post.call_args.kwargs["timeout"] == (2, 20)
+            
+            client.post("test.php", {}, read_timeout=120)
+            assert mock_post.call_args.kwargs["timeout"] == (2, 120)
+    
+    
+    def test_post_encodes_form_once_for_retries(self):
+        """Test the form body is encoded before the retry loop and resent as is"""
+        client = HTTPClient()
+        
+        with patch.object(client.session, 'post') as mock_post, \
+             patch('lastpass.http.urlencode', wraps=urlencode) as mock_urlencode, \
+             patch('lastpass.http.time.sleep'):
+            mock_post.side_effect = [Mock(status_code=429), Mock(status_code=200, content=b"OK")]
+            client.post("test.php", {"data": "a b&c", "skipped": None})
+        
+        mock_urlencode.assert_called_once()
+        bodies = [call.kwargs["data"] for call in mock_post.call_args_list]
+        assert bodies == ["data=a+b%26c", "data=a+b%26c"]
+        assert mock_post.call_args.kwargs["headers"]["Content-Type"] == \
+            "application/x-www-form-urlencoded"
 
 class TestGetIterations:
     """Test get_iterations method"""
@@ -300,6 +400,82 @@ class TestDownloadBlob:
             client.download_blob(session)
         
         assert "Failed to download blob" in str(exc_info.value)
+    
+    @responses.activate
+    def test_download_blob_to_streams_into_writer(self):
+        """Test the blob is written to the given file in pieces"""
+        blob_data = bytes(range(256)) * 1024
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/getaccts.php",
+            body=blob_data,
+            status=200,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        writer = io.BytesIO()
+        
+        client.download_blob_to(session, writer)
+        
+        assert writer.getvalue() == blob_data
+        assert "token=tok" in responses.calls[0].request.body
+    
+    @responses.activate
+    def test_download_blob_to_error_writes_nothing(self):
+        """Test an error response is not written to the file"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/getaccts.php",
+            body=b"error",
+            status=401,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        writer = io.BytesIO()
+        
+        with pytest.raises(NetworkException, match="Failed to download blob"):
+            client.download_blob_to(session, writer)
+        
+        assert writer.getvalue() == b""
+
+
+class TestGetBlobVersion:
+    """Test get_blob_version method"""
+    
+    @responses.activate
+    def test_get_blob_version_success(self):
+        """Test reading the vault version number"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/getaccts.php",
+            body=b"1234\n",
+            status=200,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        assert client.get_blob_version(session) == 1234
+    
+    @responses.activate
+    def test_get_blob_version_error_page(self):
+        """Test a large non-numeric body is rejected from its prefix"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/getaccts.php",
+            body=b"<html>" + b"x" * 100000 + b"</html>",
+            status=200,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        with pytest.raises(NetworkException, match="Invalid blob version response") as exc_info:
+            client.get_blob_version(session)
+        
+        assert len(str(exc_info.value)) < 200
 
 
 class TestUploadBlob:
@@ -338,6 +514,43 @@ class TestUploadBlob:
             client.upload_blob(session, "encrypted_blob")
         
         assert "Failed to upload blob" in str(exc_info.value)
+    
+    @responses.activate
+    def test_upload_blob_compressed(self):
+        """Test large blobs are gzipped when compress_uploads is set"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/update.php",
+            body=b"OK",
+            status=200,
+        )
+        
+        client = HTTPClient(compress_uploads=True)
+        session = Session(uid="123", sessionid="sess", token="tok")
+        blob = "a" * (GZIP_MIN_SIZE + 1)
+        
+        client.upload_blob(session, blob)
+        
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert f"blob={blob}" in gzip.decompress(request.body).decode('ascii')
+    
+    @responses.activate
+    def test_upload_blob_uncompressed_by_default(self):
+        """Test blobs are sent as plain form data unless compression is enabled"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/update.php",
+            body=b"OK",
+            status=200,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        client.upload_blob(session, "a" * (GZIP_MIN_SIZE + 1))
+        
+        assert "Content-Encoding" not in responses.calls[0].request.headers
 
 
 class TestGetAttachment:
@@ -452,6 +665,42 @@ class TestDeleteAccount:
             client.delete_account(session, "1001")
         
         assert "Failed to delete account" in str(exc_info.value)
+    
+    @responses.activate
+    def test_delete_accounts_sends_each(self):
+        """Test deleting several accounts in one batch"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/show_website.php",
+            body=b"OK",
+            status=200,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        client.delete_accounts(session, [("1001", None), ("1002", "share_001"), ("1003", None)])
+        
+        bodies = [call.request.body for call in responses.calls]
+        assert len(bodies) == 3
+        assert any("aid=1002" in body and "sharedfolderid=share_001" in body for body in bodies)
+        assert all("token=tok" in body for body in bodies)
+    
+    @responses.activate
+    def test_delete_accounts_error(self):
+        """Test a failed delete in a batch raises"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/show_website.php",
+            body=b"error",
+            status=500,
+        )
+        
+        client = HTTPClient()
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        with pytest.raises(NetworkException, match="Failed to delete account"):
+            client.delete_accounts(session, [("1001", None), ("1002", None)])
 
 
 class TestAddAccount:
@@ -720,6 +969,21 @@ class TestShareManagementEndpoints:
         
         assert share_id == "share123"
     
+    @responses.activate
+    def test_create_share_xml_response(self):
+        """Test the share ID is read from an XML response"""
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/share.php",
+            body=b'<ok sharingid="987654" />',
+            status=200,
+        )
+        
+        client = HTTPClient()
+        share_id = client.create_share(session=get_mock_session(), share_name="Team Share")
+        
+        assert share_id == "987654"
+    
     @responses.activate
     def test_delete_share(self):
         """Test deleting a share"""
@@ -763,6 +1027,30 @@ class TestShareManagementEndpoints:
         # Returns a list
         assert isinstance(users, list)
     
+    @responses.activate
+    def test_get_share_users_xml(self):
+        """Test parsing share users from an XML response"""
+        session = get_mock_session()
+        
+        responses.add(
+            responses.POST,
+            "https://lastpass.com/share.php",
+            body='<users><user username="josé@example.com" uid="123" readonly="1" '
+                 'canadminister="0" give="on"/></users>'.encode('utf-8'),
+            status=200,
+        )
+        
+        client = HTTPClient()
+        users = client.get_share_users(session=session, share_id="share123")
+        
+        assert users == [{
+            "username": "josé@example.com",
+            "uid": "123",
+            "readonly": True,
+            "canadminister": False,
+            "give": True,
+        }]
+    
     @responses.activate
     def test_add_share_user(self):
         """Test adding user to share"""
@@ -2,6 +2,7 @@
 Tests for advanced HTTP client features (attachments, logging, share limits, batch operations)
 """
 
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from lastpass.http import HTTPClient
@@ -51,6 +52,22 @@ class TestUploadAttachment:
             assert params["aid"] == "account123"
             assert "mimetype" in params
     
+    @pytest.mark.parametrize("filename,mimetype", [
+        ("test.pdf", "application/pdf"),
+        ("dir/PHOTO.JPG", "image/jpeg"),
+        ("backup.tar.gz", "application/x-tar"),
+        (".hidden.txt", "text/plain"),
+        ("README", "application/octet-stream"),
+    ])
+    def test_upload_attachment_mimetype(self, http_client, mock_session, filename, mimetype):
+        """Test the MIME type is guessed from the file extensions"""
+        with patch.object(http_client, 'post') as mock_post:
+            mock_post.return_value = (b"", 200)
+            
+            http_client.upload_attachment(mock_session, "account123", filename, b"data")
+            
+            assert mock_post.call_args[0][1]["mimetype"] == mimetype
+    
     def test_upload_attachment_with_share(self, http_client, mock_session):
         """Test attachment upload to shared account"""
         with patch.object(http_client, 'post') as mock_post:
@@ -97,6 +114,7 @@ class TestLogAccess:
                 "https://example.com",
                 None
             )
+            http_client.flush_logs()
             
             mock_post.assert_called_once()
             params = mock_post.call_args[0][1]  # data dict is 2nd positional arg
@@ -115,6 +133,7 @@ class TestLogAccess:
                 "https://test.com",
                 "share789"
             )
+            http_client.flush_logs()
             
             params = mock_post.call_args[0][1]  # data dict is 2nd positional arg
             assert params["sharedfolderid"] == "share789"
@@ -122,7 +141,7 @@ class TestLogAccess:
     def test_log_access_network_error_silenced(self, http_client, mock_session):
         """Test that log_access doesn't raise on network errors (fire-and-forget)"""
         with patch.object(http_client, 'post') as mock_post:
-            mock_post.return_value = (b"error", 500)
+            mock_post.side_effect = NetworkException("HTTP request failed")
             
             # Should not raise exception
             http_client.log_access(
@@ -131,6 +150,73 @@ class TestLogAccess:
                 "https://example.com",
                 None
             )
+            http_client.flush_logs()
+            
+            mock_post.assert_called_once()
+    
+    def test_log_access_does_not_wait_for_request(self, http_client, mock_session):
+        """Test log_access returns while the request is still being sent"""
+        release = threading.Event()
+        
+        with patch.object(http_client, 'post') as mock_post:
+            mock_post.side_effect = lambda *args, **kwargs: release.wait(5)
+            
+            http_client.log_access(mock_session, "account123", "https://example.com")
+            assert not release.is_set()
+            
+            release.set()
+            http_client.flush_logs()
+            
+            mock_post.assert_called_once()
+    
+    def test_log_access_outside_rate_limit(self, http_client):
+        """Test access logs do not take rate limit tokens from foreground requests"""
+        session = Session(uid="123", sessionid="sess", token="tok")
+        
+        with patch.object(http_client.session, 'post') as mock_post, \
+             patch.object(http_client, '_acquire_token') as mock_acquire:
+            mock_post.return_value = Mock(status_code=200, content=b"")
+            
+            http_client.log_access(session, "account123", "https://example.com")
+            http_client.flush_logs()
+            
+            mock_post.assert_called_once()
+            mock_acquire.assert_not_called()
+    
+    def test_close_stops_log_worker(self, http_client, mock_session):
+        """Test close sends queued logs, stops the sender and drops its exit hook"""
+        with patch.object(http_client, 'post') as mock_post, \
+             patch('lastpass.http.atexit.unregister') as mock_unregister:
+            mock_post.return_value = (b"", 200)
+            
+            http_client.log_access(mock_session, "account123", "https://example.com")
+            log_queue = http_client._log_queue
+            http_client.close()
+            
+            # Returns once the sender has taken the stop entry
+            log_queue.join()
+            
+            mock_post.assert_called_once()
+            mock_unregister.assert_called_once_with(http_client._stop_log_worker)
+            assert http_client._log_queue is None
+    
+    def test_close_gives_up_on_slow_logs(self, http_client, mock_session):
+        """Test close drops queued logs it cannot send within LOG_FLUSH_TIMEOUT"""
+        release = threading.Event()
+        
+        with patch.object(http_client, 'post') as mock_post, \
+             patch('lastpass.http.LOG_FLUSH_TIMEOUT', 0.1):
+            mock_post.side_effect = lambda *args, **kwargs: release.wait(5)
+            
+            for account_id in ("1", "2", "3"):
+                http_client.log_access(mock_session, account_id, "https://example.com")
+            log_queue = http_client._log_queue
+            http_client.close()
+            
+            release.set()
+            log_queue.join()
+            
+            mock_post.assert_called_once()
 
 
 class TestGetShareLimits:
@@ -316,6 +402,23 @@ class TestBatchUploadAccounts:
             # Should be XML formatted
             assert "<account>" in params["accounts"]
     
+    def test_batch_upload_escapes_values(self, http_client, mock_session):
+        """Test markup characters in account data are escaped"""
+        import xml.etree.ElementTree as ET
+        
+        accounts = [{"name": "R&D <lab>", "password": "a<b&c"}]
+        
+        with patch.object(http_client, 'post') as mock_post:
+            mock_post.return_value = (b"", 200)
+            
+            http_client.batch_upload_accounts(mock_session, accounts)
+            
+            root = ET.fromstring(mock_post.call_args[0][1]["accounts"])
+            account = root.find("account")
+            assert account.findtext("name") == "R&D <lab>"
+            assert account.findtext("password") == "a<b&c"
+            assert account.findtext("url") == ""
+    
     def test_batch_upload_empty_list(self, http_client, mock_session):
         """Test batch upload with empty list"""
         with patch.object(http_client, 'post') as mock_post:
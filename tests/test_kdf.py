@@ -196,6 +196,14 @@ class TestDeriveKeys:
         
         assert login1 != login2
         assert dec1 != dec2
+    
+    def test_derive_keys_runs_iterations_once(self, mocker):
+        """Test the expensive PBKDF2 pass runs once for both keys"""
+        spy = mocker.patch("lastpass.kdf.pbkdf2_sha256", wraps=pbkdf2_sha256)
+        
+        derive_keys("user@example.com", "password", 100000)
+        
+        assert [c.args[2] for c in spy.call_args_list] == [100000, 1]
 
 
 class TestKDFEdgeCases:
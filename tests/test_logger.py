@@ -168,6 +168,7 @@ class TestLog:
         """Test logging to file."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Test message")
+        logger.flush()
         
         assert log_file.exists()
         content = log_file.read_text()
@@ -179,6 +180,7 @@ class TestLog:
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Debug message")
         logger.log(LogLevel.INFO, "Info message")
+        logger.flush()
         
         content = log_file.read_text()
         assert "Debug message" not in content
@@ -189,6 +191,7 @@ class TestLog:
         """Test logging with format arguments."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "User: %s, Count: %d", "test", 42)
+        logger.flush()
         
         content = log_file.read_text()
         assert "User: test, Count: 42" in content
@@ -198,6 +201,7 @@ class TestLog:
         """Test format errors are handled gracefully."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Message with %s", "too", "many", "args")
+        logger.flush()
         
         # Should log something even if format fails
         assert log_file.exists()
@@ -207,11 +211,25 @@ class TestLog:
         """Test log includes timestamp."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Test message")
+        logger.flush()
         
         content = log_file.read_text()
         # Should contain date in format YYYY-MM-DD
         assert datetime.now().strftime("%Y-%m-%d") in content
     
+    @patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
+    def test_log_timestamp_formatted_once_per_second(self, logger, temp_config_dir):
+        """Test lines logged within one second reuse the formatted timestamp."""
+        with patch('lastpass.logger.time.time', return_value=1700000000.5), \
+             patch('lastpass.logger.time.strftime', return_value="2023-11-14 22:13:20") as mock_strftime:
+            logger.debug("First")
+            logger.debug("Second")
+        logger.flush()
+        
+        assert mock_strftime.call_count == 1
+        content = (temp_config_dir / "lpass.log").read_text()
+        assert content.count("[2023-11-14 22:13:20] DEBUG: ") == 2
+    
     @patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
     def test_log_includes_level_name(self, logger, temp_config_dir):
         """Test log includes level name."""
@@ -240,12 +258,59 @@ class TestLog:
         log_file = temp_config_dir / "lpass.log"
         
         # Make directory read-only
-        with patch('builtins.open', side_effect=PermissionError()):
+        with patch('lastpass.logger.os.open', side_effect=PermissionError()):
             # Should not raise exception
             logger.log(LogLevel.DEBUG, "Test message")
+            logger.flush()
+    
+    @patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
+    def test_log_from_threads(self, logger, temp_config_dir):
+        """Test lines logged from several threads are all written, through one descriptor."""
+        import threading
+        
+        def worker(n):
+            for i in range(200):
+                logger.debug("Thread %d line %d", n, i)
+        
+        with patch('lastpass.logger.LOG_BUFFER_SIZE', 256), \
+             patch('lastpass.logger.os.open', wraps=os.open) as mock_open_fd:
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            logger.close()
+        
+        assert mock_open_fd.call_count == 1
+        lines = (temp_config_dir / "lpass.log").read_text().splitlines()
+        assert len(lines) == 8 * 200
+    
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    @patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
+    def test_log_file_private(self, logger, temp_config_dir):
+        """Test the log file is created readable by its owner only."""
+        logger.debug("Test message")
+        logger.close()
+        
+        assert ((temp_config_dir / "lpass.log").stat().st_mode & 0o777) == 0o600
+    
+    @patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
+    def test_log_buffered_until_flush(self, logger, temp_config_dir):
+        """Test lines are buffered until flushed, and errors flush at once."""
+        log_file = temp_config_dir / "lpass.log"
+        logger.debug("Buffered message")
+        
+        assert not log_file.exists()
+        
+        with patch('sys.stderr.write'):
+            logger.error("Error message")
+        
+        content = log_file.read_text()
+        assert content.index("Buffered message") < content.index("Error message")
 
 
 @pytest.mark.unit
+@patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
 class TestLoggerConvenienceMethods:
     """Tests for convenience logging methods."""
     
@@ -284,6 +349,17 @@ class TestLoggerConvenienceMethods:
         """Test convenience methods with format args."""
         logger.debug("User: %s", "test")
         mock_log.assert_called_with(LogLevel.DEBUG, "User: %s", "test")
+    
+    @patch.object(Logger, 'log')
+    def test_disabled_levels_skip_log(self, mock_log, logger):
+        """Test convenience methods below the log level never reach log()."""
+        with patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'WARNING'}):
+            logger.debug("Debug message")
+            logger.verbose("Verbose message")
+            logger.info("Info message")
+            logger.warning("Warning message")
+        
+        mock_log.assert_called_once_with(LogLevel.WARNING, "Warning message")
 
 
 @pytest.mark.unit
@@ -168,6 +168,7 @@ class TestLog:
         """Test logging to file."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Test message")
+        logger.flush()
         
         assert log_file.exists()
         content = log_file.read_text()
@@ -179,6 +180,7 @@ class TestLog:
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Debug message")
         logger.log(LogLevel.INFO, "Info message")
+        logger.flush()
         
         content = log_file.read_text()
         assert "Debug message" not in content
@@ -189,6 +191,7 @@ class TestLog:
         """Test logging with format arguments."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "User: %s, Count: %d", "test", 42)
+        logger.flush()
         
         content = log_file.read_text()
         assert "User: test, Count: 42" in content
@@ -198,6 +201,7 @@ class TestLog:
         """Test format errors are handled gracefully."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Message with %s", "too", "many", "args")
+        logger.flush()
         
         # Should log something even if format fails
         assert log_file.exists()
@@ -207,6 +211,7 @@ class TestLog:
         """Test log includes timestamp."""
         log_file = temp_config_dir / "lpass.log"
         logger.log(LogLevel.DEBUG, "Test message")
+        logger.flush()
         
         content = log_file.read_text()
         # Should contain date in format YYYY-MM-DD
@@ -246,6 +251,7 @@ class TestLog:
 
 
 @pytest.mark.unit
+@patch.dict(os.environ, {'LPASS_LOG_LEVEL': 'DEBUG'})
 class TestLoggerConvenienceMethods:
     """Tests for convenience logging methods."""
     
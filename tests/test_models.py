@@ -2,6 +2,7 @@
 Tests for lastpass.models module
 """
 
+import weakref
 import pytest
 from lastpass.models import Account, Field, Share, Attachment
 
@@ -246,3 +247,44 @@ class TestAccount:
         assert account.fields == []
         assert account.attachments == []
         assert account.share is None
+    
+    def test_get_field(self):
+        """Test get_field returns the first field with a name"""
+        first = Field(name="API Key", value="key123")
+        account = Account(
+            id="1009",
+            name="AWS",
+            fields=[first, Field(name="Secret", value="s"), Field(name="API Key", value="other")],
+        )
+        
+        assert account.get_field("API Key") is first
+        assert account.get_field("Secret").value == "s"
+        assert account.get_field("Missing") is None
+    
+    def test_get_field_sees_changed_fields(self):
+        """Test get_field follows fields added, reassigned, renamed or replaced after a lookup"""
+        account = Account(id="1010", name="AWS", fields=[Field(name="Old", value="1")])
+        assert account.get_field("New") is None
+        
+        account.fields.append(Field(name="New", value="2"))
+        assert account.get_field("New").value == "2"
+        
+        account.fields = [Field(name="Other", value="3")]
+        assert account.get_field("New") is None
+        assert account.get_field("Other").value == "3"
+        
+        account.fields[0].name = "Renamed"
+        assert account.get_field("Other") is None
+        assert account.get_field("Renamed").value == "3"
+        
+        account.fields[0] = Field(name="Replaced", value="4")
+        assert account.get_field("Replaced").value == "4"
+    
+    def test_models_support_weakrefs(self):
+        """Test model instances can still be weakly referenced"""
+        for obj in (
+            Account(id="1", name="a"),
+            Field(name="f", value="v", type="text"),
+            Share(id="1", name="s", key=b""),
+        ):
+            assert weakref.ref(obj)() is obj
@@ -253,6 +253,84 @@ class TestSearchFieldSelection:
         results = client.search_accounts_fixed("github", fields=["name"], sync=False)
         assert len(results) == 1
         assert results[0].name == "GitHub"
+    
+    def test_exact_search_field_selection(self, mocker):
+        """Test exact search over one, several, and unknown fields"""
+        client = LastPassClient()
+        
+        client._accounts = [
+            Account(id="1", name="GitHub", username="octo", url="https://github.com"),
+            Account(id="2", name="octo", username="user", url="https://example.com"),
+        ]
+        client._blob_loaded = True
+        
+        results = client.search_accounts_advanced("octo", fields=["username"], sync=False)
+        assert [a.id for a in results] == ["1"]
+        
+        results = client.search_accounts_advanced("octo", fields=["name", "username"], sync=False)
+        assert [a.id for a in results] == ["1", "2"]
+        
+        results = client.search_accounts_advanced("octo", fields=["no_such_field"], sync=False)
+        assert results == []
+
+
+class TestHyperscanRegexSearch:
+    """Test the optional Hyperscan prefilter for regex search"""
+    
+    @pytest.fixture
+    def client(self, mocker):
+        mocker.patch("lastpass.client.HYPERSCAN_MIN_ACCOUNTS", 0)
+        client = LastPassClient()
+        client._accounts = [
+            Account(id="1", name="GitHub", username="dev", url="https://github.com"),
+            Account(id="2", name="GitLab", username="ops", url="https://gitlab.com",
+                    notes="line one\nrelease key"),
+            Account(id="3", name="Bitbucket", username="dev@example.com", url="https://bitbucket.org"),
+            Account(id="4", name="Ünïcode Site", username="user", url="https://unicode.test"),
+        ]
+        client._blob_loaded = True
+        return client
+    
+    @pytest.mark.parametrize("pattern", [
+        r"git(hub|lab)",
+        r"^git",
+        r"\.com$",
+        r"^release",
+        r"@example\.com",
+        r"ünïcode",
+        r"(d)e\1?v",
+        r"nomatch",
+        r"\Agit",
+        r"x*",
+    ])
+    def test_matches_python_regex(self, client, pattern):
+        """Test Hyperscan prefiltering returns the same accounts as plain re"""
+        expected = [
+            a for a in client._accounts
+            if any(re.search(pattern, getattr(a, f), re.IGNORECASE)
+                   for f in ['name', 'id', 'fullname', 'username', 'url', 'notes'])
+        ]
+        
+        assert client.search_accounts_regex(pattern, sync=False) == expected
+    
+    def test_prefilter_narrows_candidates(self, client):
+        """Test Hyperscan reports only accounts that can match"""
+        pytest.importorskip("hyperscan")
+        
+        pattern = re.compile(r"bucket", re.IGNORECASE)
+        candidates = client._get_hyperscan_candidates(pattern, ["name", "url"])
+        
+        assert candidates == [2]
+    
+    def test_falls_back_without_hyperscan(self, client, mocker):
+        """Test regex search still works when Hyperscan is not installed"""
+        mocker.patch.dict("sys.modules", {"hyperscan": None})
+        
+        pattern = re.compile(r"git", re.IGNORECASE)
+        assert client._get_hyperscan_candidates(pattern, ["name"]) is None
+        
+        results = client.search_accounts_regex(r"git", sync=False)
+        assert [a.id for a in results] == ["1", "2"]
 
 
 if __name__ == "__main__":
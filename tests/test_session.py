@@ -2,6 +2,7 @@
 Tests for lastpass.session module
 """
 
+import os
 import pytest
 import json
 from pathlib import Path
@@ -185,6 +186,21 @@ class TestSessionPersistence:
         loaded = Session.load(mock_encryption_key, temp_config_dir)
         assert loaded.uid == "222"
     
+    def test_session_save_is_atomic(self, temp_config_dir, mock_encryption_key, mocker):
+        """Test a failed save keeps the previous session and leaves no temp file"""
+        Session(uid="111", sessionid="sess1", token="tok1").save(mock_encryption_key, temp_config_dir)
+        
+        session_file = temp_config_dir / "session"
+        if os.name == "posix":
+            assert session_file.stat().st_mode & 0o777 == 0o600
+        
+        mocker.patch("lastpass.session.os.replace", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            Session(uid="222", sessionid="sess2", token="tok2").save(mock_encryption_key, temp_config_dir)
+        
+        assert Session.load(mock_encryption_key, temp_config_dir).uid == "111"
+        assert not (temp_config_dir / "session.tmp").exists()
+    
     def test_get_config_dir_default(self):
         """Test getting default config directory"""
         config_dir = Session._get_config_dir()